@@ -0,0 +1,41 @@
+"""
+Gemensamma fixtures för API-testerna i _verify/: TestClient mot en isolerad in-memory SQLite
+och en egen uploads-katalog per test. Inga externa tjänster (postgres, feeds, LLM) behövs.
+"""
+
+import os
+
+import orjson
+import pytest
+
+# main.py skapar tabellerna vid import; utan DATABASE_URL pekar database.py på postgres
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """(client, auth) mot en tom databas; main.UPLOAD_DIR pekar på tmp_path."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    import database
+    import main
+
+    # En delad anslutning (StaticPool) så att request-tråden och testet ser samma in-memory-databas
+    test_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=database.json_dumps,
+        json_deserializer=orjson.loads,
+    )
+    database.Base.metadata.create_all(bind=test_engine)
+    database.SessionLocal.configure(bind=test_engine)
+    monkeypatch.setattr(main, "UPLOAD_DIR", tmp_path)
+    try:
+        # Utan with-block: startup-hookarna (STT-preload, scout-seed) körs inte
+        yield TestClient(main.app), (main.BASIC_AUTH_ADMIN_USER, main.BASIC_AUTH_ADMIN_PASS)
+    finally:
+        database.SessionLocal.configure(bind=database.engine)
+        test_engine.dispose()
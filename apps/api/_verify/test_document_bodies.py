@@ -0,0 +1,111 @@
+"""
+Verifiering: Document.masked_text / ProjectNote.masked_body ligger i 1:1-tabellerna
+document_bodies / project_note_bodies (association_proxy) men syns oförändrat i API, export och Fort Knox.
+"""
+
+from models import DocumentBody, ProjectNoteBody
+
+
+def _create_project(client, auth):
+    response = client.post("/api/projects", json={"name": "Brödtexter"}, auth=auth)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_document_body_roundtrip_through_proxy(api):
+    import database
+
+    client, auth = api
+    project_id = _create_project(client, auth)
+
+    response = client.post(
+        f"/api/projects/{project_id}/documents",
+        files={"file": ("rapport.txt", "Rapporten beskriver mötet i fullmäktige.".encode("utf-8"), "text/plain")},
+        auth=auth,
+    )
+    assert response.status_code == 201
+    document_id = response.json()["id"]
+    assert "masked_text" not in response.json()
+
+    masked_text = client.get(f"/api/documents/{document_id}", auth=auth).json()["masked_text"]
+    assert "fullmäktige" in masked_text
+    listed = client.get(f"/api/projects/{project_id}/documents", auth=auth).json()[0]
+    assert "masked_text" not in listed
+    # Webbklienten läser usage_restrictions i listan; den utelämnas aldrig
+    assert listed["usage_restrictions"] == response.json()["usage_restrictions"]
+
+    db = database.SessionLocal()
+    try:
+        assert db.query(DocumentBody.masked_text).filter(DocumentBody.document_id == document_id).scalar() == masked_text
+    finally:
+        db.close()
+
+    # Export läser brödtexten via proxyn (selectinload)
+    export = client.get(f"/api/projects/{project_id}/export", auth=auth)
+    assert export.status_code == 200
+    assert masked_text in export.text
+
+    assert client.delete(f"/api/documents/{document_id}", auth=auth).status_code == 204
+    db = database.SessionLocal()
+    try:
+        assert db.query(DocumentBody).count() == 0
+    finally:
+        db.close()
+
+
+def test_note_body_roundtrip_through_proxy(api):
+    import database
+
+    client, auth = api
+    project_id = _create_project(client, auth)
+
+    response = client.post(f"/api/projects/{project_id}/notes", json={"title": "Möte", "body": "Anteckning om mötet."}, auth=auth)
+    assert response.status_code == 201
+    note_id = response.json()["id"]
+    assert response.json()["masked_body"] == "Anteckning om mötet."
+
+    response = client.put(f"/api/projects/{project_id}/notes/{note_id}", json={"body": "Uppdaterad anteckning."}, auth=auth)
+    assert response.status_code == 200
+    assert client.get(f"/api/notes/{note_id}", auth=auth).json()["masked_body"] == "Uppdaterad anteckning."
+
+    # Listan bär ingen brödtext
+    assert "masked_body" not in client.get(f"/api/projects/{project_id}/notes", auth=auth).json()[0]
+
+    db = database.SessionLocal()
+    try:
+        assert db.query(ProjectNoteBody.masked_body).filter(ProjectNoteBody.note_id == note_id).scalar() == "Uppdaterad anteckning."
+    finally:
+        db.close()
+
+    export = client.get(f"/api/projects/{project_id}/export", params={"include_transcripts": True}, auth=auth)
+    assert "Uppdaterad anteckning." in export.text
+
+    assert client.delete(f"/api/notes/{note_id}", auth=auth).status_code == 204
+    db = database.SessionLocal()
+    try:
+        assert db.query(ProjectNoteBody).count() == 0
+    finally:
+        db.close()
+
+
+def test_fortknox_pack_reads_bodies(api):
+    import database
+    from fortknox import build_knox_input_pack, compute_sha256, get_policy
+
+    client, auth = api
+    project_id = _create_project(client, auth)
+    client.post(
+        f"/api/projects/{project_id}/documents",
+        files={"file": ("a.txt", "Dokumenttext om vägbygget.".encode("utf-8"), "text/plain")},
+        auth=auth,
+    )
+    client.post(f"/api/projects/{project_id}/notes", json={"body": "Anteckning om vägbygget."}, auth=auth)
+
+    db = database.SessionLocal()
+    try:
+        pack = build_knox_input_pack(project_id, get_policy("internal"), "standard", db)
+    finally:
+        db.close()
+    assert [doc.masked_text for doc in pack.documents] == ["Dokumenttext om vägbygget."]
+    assert [note.masked_body for note in pack.notes] == ["Anteckning om vägbygget."]
+    assert pack.documents[0].sha256 == compute_sha256("Dokumenttext om vägbygget.")
@@ -0,0 +1,142 @@
+"""
+Verifiering: feed-import (POST /api/projects/from-feed) utan nätverk.
+Feed-hämtning, parsning och artikeltext ersätts med fasta items.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from models import Document, DocumentBody, ProjectEvent
+
+
+@pytest.fixture
+def feed_items(monkeypatch):
+    import main
+
+    items = [
+        {
+            "guid": f"guid-{index}",
+            "link": f"https://example.se/artikel/{index}",
+            "title": f"Artikel {index}",
+            "summary_text": f"Sammanfattning {index}",
+            "published": "2026-01-06T10:00:00Z",
+        }
+        for index in range(3)
+    ]
+    monkeypatch.setattr(main, "fetch_feed_url", lambda url: b"<rss/>")
+    monkeypatch.setattr(main, "parse_feed", lambda content: {"title": "Testflöde", "items": items})
+    monkeypatch.setattr(main, "fetch_article_text", lambda link: f"Brödtext för {link}")
+    monkeypatch.setattr(main, "derive_tags", lambda title, url: ["test"])
+    return items
+
+
+def test_feed_bulk_insert_creates_document_bodies(api, feed_items):
+    import database
+
+    client, auth = api
+    response = client.post("/api/projects/from-feed", json={"url": "https://example.se/rss", "limit": 10}, auth=auth)
+    assert response.status_code == 201
+    project_id = response.json()["project_id"]
+    assert response.json()["created_count"] == len(feed_items)
+
+    db = database.SessionLocal()
+    try:
+        documents = db.query(Document).filter(Document.project_id == project_id).order_by(Document.id).all()
+        bodies = dict(db.query(DocumentBody.document_id, DocumentBody.masked_text))
+    finally:
+        db.close()
+    assert sorted(bodies) == [document.id for document in documents]
+    for document, item in zip(documents, feed_items):
+        assert f"Brödtext för {item['link']}" in bodies[document.id]
+        assert client.get(f"/api/documents/{document.id}", auth=auth).json()["masked_text"] == bodies[document.id]
+
+
+def test_feed_import_end_to_end_skips_duplicates_and_writes_files(api, monkeypatch, tmp_path):
+    import database
+    import main
+
+    client, auth = api
+    # guid-0 och artikel/1 förekommer två gånger i samma flöde
+    items = [
+        {"guid": "guid-0", "link": "https://example.se/artikel/0", "title": "Första", "summary_text": "Sammanfattning 0"},
+        {"guid": "guid-1", "link": "https://example.se/artikel/1", "title": "Andra", "summary_text": "Sammanfattning 1"},
+        {"guid": "guid-0", "link": "https://example.se/artikel/9", "title": "Dublett guid", "summary_text": "x"},
+        {"guid": "guid-3", "link": "https://example.se/artikel/1", "title": "Dublett länk", "summary_text": "x"},
+        {"guid": "guid-4", "link": "https://example.se/artikel/4", "title": "Tom fulltext", "summary_text": "Bara sammanfattning"},
+    ]
+    fetched_links = []
+
+    def fetch_article_text(link):
+        fetched_links.append(link)
+        return "" if link.endswith("/4") else f"Ring 070-123 45 67 om {link}"
+
+    monkeypatch.setattr(main, "fetch_feed_url", lambda url: b"<rss/>")
+    monkeypatch.setattr(main, "parse_feed", lambda content: {"title": "Testflöde", "items": items})
+    monkeypatch.setattr(main, "fetch_article_text", fetch_article_text)
+    monkeypatch.setattr(main, "derive_tags", lambda title, url: ["test"])
+
+    response = client.post("/api/projects/from-feed", json={"url": "https://example.se/rss", "limit": 10}, auth=auth)
+    assert response.status_code == 201
+    result = response.json()
+    assert (result["created_count"], result["created_notes"], result["skipped_duplicates"]) == (3, 3, 2)
+    assert sorted(fetched_links) == ["https://example.se/artikel/0", "https://example.se/artikel/1", "https://example.se/artikel/4"]
+
+    # Omimport: allt finns redan i projektet
+    response = client.post("/api/projects/from-feed", json={"url": "https://example.se/rss", "limit": 10}, auth=auth)
+    assert response.status_code == 201
+    assert response.json()["project_id"] == result["project_id"]
+    assert (response.json()["created_count"], response.json()["skipped_duplicates"]) == (0, len(items))
+
+    db = database.SessionLocal()
+    try:
+        documents = db.query(Document).filter(Document.project_id == result["project_id"]).order_by(Document.id).all()
+        rows = [(document.file_path, document.masked_text, document.document_metadata["item_guid"]) for document in documents]
+        events = [event_type for (event_type,) in db.query(ProjectEvent.event_type).order_by(ProjectEvent.id)]
+    finally:
+        db.close()
+    assert [guid for _, _, guid in rows] == ["guid-0", "guid-1", "guid-4"]
+    assert events == ["project_created", "feed_imported", "feed_imported"]
+
+    # En egen fil per dokument med råtexten; brödtexten i document_bodies är maskerad
+    assert len({path for path, _, _ in rows}) == 3
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(Path(path).name for path, _, _ in rows)
+    raw_first = Path(rows[0][0]).read_text(encoding="utf-8")
+    assert "070-123 45 67" in raw_first
+    assert "070-123 45 67" not in rows[0][1]
+    assert "om https://example.se/artikel/0" in rows[0][1]
+    assert "Bara sammanfattning" in rows[2][1]
+
+
+def test_failed_commit_removes_written_files(api, feed_items, monkeypatch, tmp_path):
+    from sqlalchemy.orm import Session
+
+    client, auth = api
+
+    def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(Session, "commit", failing_commit)
+    response = client.post("/api/projects/from-feed", json={"url": "https://example.se/rss", "limit": 10}, auth=auth)
+    assert response.status_code == 500
+    # Råtextfilerna skrevs före commit; ingen Document-rad pekar på dem efter rollback
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_strict_minimum_stores_only_attempted_levels():
+    # Feed/Scout: min_level=STRICT provar aldrig normal, så pii_gate_reasons saknar "normal"
+    from main import run_sanitize_pipeline
+    from models import SanitizeLevel
+
+    result = run_sanitize_pipeline("ID 4711 i ärendet", min_level=SanitizeLevel.STRICT)
+    assert (result["sanitize_level"], result["pii_gate_reasons"]) == (SanitizeLevel.STRICT, None)
+
+    # Strict-maskad text som inte klarar gaten eskalerar till paranoid
+    result = run_sanitize_pipeline("123.@.@12.Dok.Idx94567", min_level=SanitizeLevel.STRICT)
+    assert result["sanitize_level"] == SanitizeLevel.PARANOID
+    assert result["pii_gate_reasons"] == {"strict": ["email_detected"]}
+    assert result["usage_restrictions"] == {"ai_allowed": False, "export_allowed": False}
+
+    # Dokumentuppladdning (min_level=NORMAL) behåller hela kaskaden
+    result = run_sanitize_pipeline("123.@.@12.Dok.Idx94567")
+    assert result["pii_gate_reasons"] == {"normal": ["email_detected"], "strict": ["email_detected"]}
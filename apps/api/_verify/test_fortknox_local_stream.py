@@ -0,0 +1,101 @@
+"""
+Verifiering: fortknox-local strömmar llama.cpp-svaret och slutar läsa när JSON-objektet är slutet.
+_JsonObjectScanner får texten i godtyckliga bitar (split mitt i strängar/escapes, kodstaket).
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("uvicorn")  # fortknox-local/main.py importerar uvicorn (finns i requirements.txt)
+
+_FORTKNOX_LOCAL_MAIN = Path(__file__).resolve().parents[3] / "fortknox-local" / "main.py"
+
+
+@pytest.fixture(scope="module")
+def fortknox_local():
+    # Eget modulnamn: apps/api har redan en main-modul
+    spec = importlib.util.spec_from_file_location("fortknox_local_main", _FORTKNOX_LOCAL_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _scan(module, chunks):
+    scanner = module._JsonObjectScanner()
+    fed = []
+    for chunk in chunks:
+        fed.append(chunk)
+        if scanner.feed(chunk):
+            break
+    return scanner, "".join(fed)
+
+
+def test_scanner_on_split_chunks(fortknox_local):
+    # Klamrar och escapade citattecken i strängar, split mitt i escape-sekvensen
+    chunks = ['Svar: {"a": "x}{', '\\', '"', '", "b": {"c": ', "1}", "}", ' och {"d": 2}']
+    scanner, text = _scan(fortknox_local, chunks)
+    assert scanner.end != -1
+    assert json.loads(text[scanner.start:scanner.end]) == {"a": 'x}{"', "b": {"c": 1}}
+    # Slutar vid objektets slut; sista biten matas aldrig in
+    assert not text.endswith('{"d": 2}')
+
+    # Samma resultat som att mata in allt på en gång
+    whole = "".join(chunks)
+    assert fortknox_local._extract_json_object(whole) == text[scanner.start:scanner.end]
+
+    scanner, _ = _scan(fortknox_local, ['{"a": "', "ej slut", '"'])
+    assert (scanner.start, scanner.end) == (0, -1)
+
+
+class _StreamResponse:
+    def __init__(self, lines, consumed):
+        self._lines = lines
+        self._consumed = consumed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self._lines:
+            self._consumed.append(line)
+            yield line
+
+
+class _StreamSession:
+    def __init__(self, contents):
+        self.lines = [b"data: " + json.dumps({"content": content, "stop": False}).encode() for content in contents]
+        self.lines.append(b"data: " + json.dumps({"content": "", "stop": True}).encode())
+        self.consumed = []
+
+    def post(self, url, json, stream, timeout):
+        assert json["stream"] is True and stream is True
+        return _StreamResponse(self.lines, self.consumed)
+
+
+def test_stream_stops_after_fenced_object(fortknox_local, monkeypatch):
+    session = _StreamSession(["```json\n{", '"titel": "a}b', '"', "}", "\n```", "\nMer prosa {x}"])
+    monkeypatch.setattr(fortknox_local, "_LLAMA_SESSION", session)
+
+    text = fortknox_local.call_llama_server("prompt")
+    assert text == '```json\n{"titel": "a}b"}'
+    assert len(session.consumed) == 4
+    assert json.loads(fortknox_local._extract_json_object(text)) == {"titel": "a}b"}
+
+
+def test_stream_reads_to_end_after_prose_prefix(fortknox_local, monkeypatch):
+    # Prosa före '{' kan betyda fel objekt: hela svaret läses
+    session = _StreamSession(["Exempel {", '"x": 1}', ' och svaret: {"titel": "ok"}'])
+    monkeypatch.setattr(fortknox_local, "_LLAMA_SESSION", session)
+
+    text = fortknox_local.call_llama_server("prompt")
+    assert text == 'Exempel {"x": 1} och svaret: {"titel": "ok"}'
+    assert len(session.consumed) == len(session.lines)
@@ -0,0 +1,60 @@
+"""
+Verifiering: journalistanteckningar med bilder. get/list-images/delete laddar anteckningen och
+bild-endpointen bara bilden, med db.get(..., raiseload("*")) — ingen lazy load får ske på vägen till svaret.
+"""
+
+from models import JournalistNote, JournalistNoteImage, ProjectEvent
+
+
+def test_note_with_images_get_list_and_delete(api, tmp_path):
+    import database
+
+    client, auth = api
+    project_id = client.post("/api/projects", json={"name": "Anteckningar"}, auth=auth).json()["id"]
+
+    response = client.post(f"/api/projects/{project_id}/journalist-notes", json={"title": "Fältanteckning", "body": "Råtext."}, auth=auth)
+    assert response.status_code == 201
+    note_id = response.json()["id"]
+
+    image_ids = []
+    for name in ("a.png", "b.png"):
+        response = client.post(
+            f"/api/journalist-notes/{note_id}/images",
+            files={"file": (name, b"\x89PNG\r\n\x1a\nbilddata", "image/png")},
+            auth=auth,
+        )
+        assert response.status_code == 201
+        image_ids.append(response.json()["id"])
+
+    response = client.get(f"/api/journalist-notes/{note_id}", auth=auth)
+    assert response.status_code == 200
+    assert response.json()["body"] == "Råtext."
+
+    response = client.get(f"/api/journalist-notes/{note_id}/images", auth=auth)
+    assert response.status_code == 200
+    assert sorted(image["id"] for image in response.json()) == sorted(image_ids)
+
+    response = client.get(f"/api/journalist-notes/{note_id}/images/{image_ids[0]}", auth=auth)
+    assert response.status_code == 200
+    assert response.content == b"\x89PNG\r\n\x1a\nbilddata"
+    # Bilden hör inte till en annan anteckning
+    assert client.get(f"/api/journalist-notes/{note_id + 1}/images/{image_ids[0]}", auth=auth).status_code == 404
+
+    image_dir = tmp_path / "journalist_notes" / str(note_id)
+    assert len(list(image_dir.iterdir())) == 2
+
+    assert client.delete(f"/api/journalist-notes/{note_id}", auth=auth).status_code == 204
+    assert client.get(f"/api/journalist-notes/{note_id}", auth=auth).status_code == 404
+    assert client.get(f"/api/journalist-notes/{note_id}/images", auth=auth).status_code == 404
+    # Bildfilerna tas bort efter svaret (BackgroundTask; TestClient kör den före retur)
+    assert list(image_dir.iterdir()) == []
+
+    db = database.SessionLocal()
+    try:
+        assert db.query(JournalistNote).count() == 0
+        assert db.query(JournalistNoteImage).count() == 0
+        # Audit-eventen skrivs i samma transaktion som ändringen
+        events = [event_type for (event_type,) in db.query(ProjectEvent.event_type).order_by(ProjectEvent.id)]
+    finally:
+        db.close()
+    assert events[-4:] == ["note_created", "note_image_added", "note_image_added", "note_deleted"]
@@ -0,0 +1,64 @@
+"""
+Verifiering: Scout pollar flöden med conditional GET (ETag / Last-Modified).
+Ett 304-svar får varken röra sparade items eller nollställa validatorerna.
+"""
+
+import requests
+
+from models import ScoutFeed, ScoutItem
+
+RSS = (
+    b'<rss version="2.0"><channel><title>Test</title>'
+    + b"".join(
+        b"<item><title>Nyhet %d</title><link>https://example.se/%d</link><guid>guid-%d</guid>"
+        b"<pubDate>Mon, 01 Jan 2024 12:00:00 +0000</pubDate></item>" % (index, index, index)
+        for index in range(3)
+    )
+    + b"</channel></rss>"
+)
+
+
+class _Response:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_not_modified_keeps_items_and_validators(api, monkeypatch):
+    import database
+    import scout
+
+    sent_headers = []
+
+    def get(self, url, timeout, headers):
+        sent_headers.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            # 304 bär ofta inga validatorer alls
+            return _Response(304)
+        return _Response(200, RSS, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"})
+
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    db = database.SessionLocal()
+    try:
+        db.add(ScoutFeed(name="Test", url="https://example.se/rss", is_enabled=True))
+        db.commit()
+        feed_id = db.query(ScoutFeed.id).scalar()
+
+        assert scout.fetch_all_feeds(db) == {feed_id: 3}
+        assert "If-None-Match" not in sent_headers[0]
+
+        assert scout.fetch_all_feeds(db) == {feed_id: 0}
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+        assert sent_headers[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+
+        db.expire_all()
+        feed = db.get(ScoutFeed, feed_id)
+        assert (feed.etag, feed.last_modified) == ('"v1"', "Mon, 01 Jan 2024 12:00:00 GMT")
+        assert sorted(title for (title,) in db.query(ScoutItem.title)) == ["Nyhet 0", "Nyhet 1", "Nyhet 2"]
+    finally:
+        db.close()
@@ -0,0 +1,52 @@
+"""Composite (project_id, created_at/timestamp) indexes
+
+Revision ID: 20261016_0002
+Revises: 20260108_0001
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0002"
+down_revision = "20260108_0001"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = (
+    ("idx_project_events_project_timestamp", "project_events", ["project_id", "timestamp"]),
+    ("idx_documents_project_created_at", "documents", ["project_id", "created_at"]),
+    ("idx_project_notes_project_created_at", "project_notes", ["project_id", "created_at"]),
+)
+
+
+def _index_names(inspector, table: str) -> set:
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    for name, table, columns in INDEXES:
+        if table in tables and name not in _index_names(inspector, table):
+            op.create_index(name, table, columns)
+
+    # Composite index covers project_id lookups (legacy index from init_db.sql)
+    if "project_events" in tables and "idx_project_events_project_id" in _index_names(inspector, "project_events"):
+        op.drop_index("idx_project_events_project_id", table_name="project_events")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    if "project_events" in tables and "idx_project_events_project_id" not in _index_names(inspector, "project_events"):
+        op.create_index("idx_project_events_project_id", "project_events", ["project_id"])
+
+    for name, table, _columns in INDEXES:
+        if table in tables and name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,64 @@
+"""Classification/SanitizeLevel columns: native ENUM -> VARCHAR(16)
+
+Revision ID: 20261016_0003
+Revises: 20261016_0002
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0003"
+down_revision = "20261016_0002"
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type name, SQL expression mapping enum name -> enum value)
+COLUMNS = (
+    ("projects", "classification", "classification", "lower(replace(classification::text, '_', '-'))"),
+    ("documents", "classification", "classification", "lower(replace(classification::text, '_', '-'))"),
+    ("documents", "sanitize_level", "sanitizelevel", "lower(sanitize_level::text)"),
+    ("project_notes", "sanitize_level", "sanitizelevel", "lower(sanitize_level::text)"),
+)
+
+
+def _is_native_enum(conn, table: str, column: str) -> bool:
+    res = conn.execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = :t AND column_name = :c AND data_type = 'USER-DEFINED'"
+        ),
+        {"t": table, "c": column},
+    ).fetchone()
+    return bool(res)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    for table, column, _enum_name, using in COLUMNS:
+        if _is_native_enum(conn, table, column):
+            op.alter_column(table, column, type_=sa.String(16), postgresql_using=using)
+
+    op.execute("DROP TYPE IF EXISTS classification")
+    op.execute("DROP TYPE IF EXISTS sanitizelevel")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    sa.Enum("NORMAL", "SENSITIVE", "SOURCE_SENSITIVE", name="classification").create(conn, checkfirst=True)
+    sa.Enum("NORMAL", "STRICT", "PARANOID", name="sanitizelevel").create(conn, checkfirst=True)
+
+    for table, column, enum_name, _using in COLUMNS:
+        if not _is_native_enum(conn, table, column):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Enum(name=enum_name, create_type=False),
+                postgresql_using=f"upper(replace({column}, '-', '_'))::{enum_name}",
+            )
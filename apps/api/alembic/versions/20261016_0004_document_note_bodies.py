@@ -0,0 +1,69 @@
+"""Move Document.masked_text / ProjectNote.masked_body to 1:1 body tables
+
+Revision ID: 20261016_0004
+Revises: 20261016_0003
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0004"
+down_revision = "20261016_0003"
+branch_labels = None
+depends_on = None
+
+# (parent table, body column, body table, body FK column)
+BODIES = (
+    ("documents", "masked_text", "document_bodies", "document_id"),
+    ("project_notes", "masked_body", "project_note_bodies", "note_id"),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    # Schemat skrivs ut här (som i 0001) så att revisionen inte följer senare ändringar i models.py
+    if "document_bodies" not in tables:
+        op.create_table(
+            "document_bodies",
+            sa.Column("document_id", sa.Integer(), sa.ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("masked_text", sa.Text(), nullable=False),
+        )
+    if "project_note_bodies" not in tables:
+        op.create_table(
+            "project_note_bodies",
+            sa.Column("note_id", sa.Integer(), sa.ForeignKey("project_notes.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("masked_body", sa.Text(), nullable=False),
+        )
+
+    for parent, column, body_table, fk_column in BODIES:
+        parent_columns = {c["name"] for c in inspector.get_columns(parent)}
+        if column in parent_columns:
+            op.execute(
+                f"INSERT INTO {body_table} ({fk_column}, {column}) "
+                f"SELECT id, {column} FROM {parent} "
+                f"WHERE id NOT IN (SELECT {fk_column} FROM {body_table})"
+            )
+            op.drop_column(parent, column)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    tables = set(inspector.get_table_names())
+
+    for parent, column, body_table, fk_column in BODIES:
+        if body_table not in tables:
+            continue
+        parent_columns = {c["name"] for c in inspector.get_columns(parent)}
+        if column not in parent_columns:
+            op.add_column(parent, sa.Column(column, sa.Text(), nullable=True))
+        op.execute(
+            f"UPDATE {parent} SET {column} = b.{column} FROM {body_table} b WHERE b.{fk_column} = {parent}.id"
+        )
+        op.execute(f"UPDATE {parent} SET {column} = '' WHERE {column} IS NULL")
+        op.alter_column(parent, column, nullable=False)
+        op.drop_table(body_table)
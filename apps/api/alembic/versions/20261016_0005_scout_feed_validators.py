@@ -0,0 +1,40 @@
+"""Scout feed HTTP validators (etag, last_modified) for conditional GET
+
+Revision ID: 20261016_0005
+Revises: 20261016_0004
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0005"
+down_revision = "20261016_0004"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("etag", "last_modified")
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "scout_feeds" not in set(inspector.get_table_names()):
+        return
+
+    existing = {c["name"] for c in inspector.get_columns("scout_feeds")}
+    for column in COLUMNS:
+        if column not in existing:
+            op.add_column("scout_feeds", sa.Column(column, sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "scout_feeds" not in set(inspector.get_table_names()):
+        return
+
+    existing = {c["name"] for c in inspector.get_columns("scout_feeds")}
+    for column in COLUMNS:
+        if column in existing:
+            op.drop_column("scout_feeds", column)
@@ -6,6 +6,7 @@ import ipaddress
 import logging
 import re
 import socket
+from datetime import datetime
 from typing import Dict, List, Tuple
 from urllib.parse import urlparse, urljoin
 
@@ -197,15 +198,15 @@ def validate_and_fetch(
             if size > max_bytes:
                 raise ValueError(f"Response too large: {size} bytes (max {max_bytes})")
         
-        # Read response with size limit
-        content = b''
+        # Read response with size limit (bytearray växer på plats; bytes += kopierar hela bufferten per chunk)
+        content = bytearray()
         for chunk in response.iter_content(chunk_size=8192):
             content += chunk
             if len(content) > max_bytes:
                 raise ValueError(f"Response exceeds size limit: {max_bytes} bytes")
         
         content_type = response.headers.get('Content-Type', '')
-        return (content, content_type)
+        return (bytes(content), content_type)
         
     except requests.exceptions.Timeout:
         raise ValueError(f"Request timeout after {timeout}s")
@@ -358,7 +359,6 @@ def html_to_text(html_content: str) -> str:
     text = html.unescape(html_content)
     
     # Simple HTML tag removal (regex-based, safe for feed summaries)
-    import re
     # Remove script and style tags and their content
     text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
     text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
@@ -412,10 +412,8 @@ def parse_feed(content: bytes) -> Dict:
             # Get published date
             published = None
             if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                from datetime import datetime
                 published = datetime(*entry.published_parsed[:6]).isoformat()
             elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                from datetime import datetime
                 published = datetime(*entry.updated_parsed[:6]).isoformat()
             
             # Get summary/content and convert HTML to text
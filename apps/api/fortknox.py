@@ -7,7 +7,7 @@ import re
 import logging
 from typing import Dict, List, Tuple, Any
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models import Project, Document, ProjectNote, ProjectSource
 from schemas import (
@@ -88,7 +88,7 @@ def build_knox_input_pack(
     
     # Hämtar documents (sorterat: created_at asc, id asc)
     # Exkludera dokument som är markerade för exkludering från Fort Knox
-    documents = db.query(Document).filter(
+    documents = db.query(Document).options(selectinload(Document.body)).filter(
         Document.project_id == project_id
     ).order_by(Document.created_at.asc(), Document.id.asc()).all()
     
@@ -103,7 +103,7 @@ def build_knox_input_pack(
     
     # Hämtar notes (sorterat: created_at asc, id asc)
     # Exkludera anteckningar som är markerade för exkludering från Fort Knox
-    notes = db.query(ProjectNote).filter(
+    notes = db.query(ProjectNote).options(selectinload(ProjectNote.body)).filter(
         ProjectNote.project_id == project_id
     ).order_by(ProjectNote.created_at.asc(), ProjectNote.id.asc()).all()
     
@@ -43,9 +43,15 @@ CREATE TABLE IF NOT EXISTS project_events (
     metadata JSONB
 );
 
-CREATE INDEX IF NOT EXISTS idx_project_events_project_id ON project_events(project_id);
 CREATE INDEX IF NOT EXISTS idx_project_events_timestamp ON project_events(timestamp DESC);
 
+-- Composite (project_id, created_at/timestamp) indexes for per-project ORDER BY ... DESC loads (idempotent).
+-- The composite index covers project_id lookups, so the single-column index is dropped.
+CREATE INDEX IF NOT EXISTS idx_project_events_project_timestamp ON project_events(project_id, timestamp);
+DROP INDEX IF EXISTS idx_project_events_project_id;
+CREATE INDEX IF NOT EXISTS idx_documents_project_created_at ON documents(project_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_project_notes_project_created_at ON project_notes(project_id, created_at);
+
 -- Add new columns to documents table (idempotent)
 DO $$ 
 BEGIN
@@ -93,3 +99,70 @@ BEGIN
     END IF;
 END $$;
 
+
+-- Classification/SanitizeLevel: native ENUM -> VARCHAR(16) holding the enum value (idempotent).
+-- SQLEnum stored enum names ('SOURCE_SENSITIVE'); convert to values ('source-sensitive').
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='projects' AND column_name='classification' AND data_type='USER-DEFINED') THEN
+        ALTER TABLE projects ALTER COLUMN classification TYPE VARCHAR(16) USING lower(replace(classification::text, '_', '-'));
+    END IF;
+    
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='documents' AND column_name='classification' AND data_type='USER-DEFINED') THEN
+        ALTER TABLE documents ALTER COLUMN classification TYPE VARCHAR(16) USING lower(replace(classification::text, '_', '-'));
+    END IF;
+    
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='documents' AND column_name='sanitize_level' AND data_type='USER-DEFINED') THEN
+        ALTER TABLE documents ALTER COLUMN sanitize_level TYPE VARCHAR(16) USING lower(sanitize_level::text);
+    END IF;
+    
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='project_notes' AND column_name='sanitize_level' AND data_type='USER-DEFINED') THEN
+        ALTER TABLE project_notes ALTER COLUMN sanitize_level TYPE VARCHAR(16) USING lower(sanitize_level::text);
+    END IF;
+END $$;
+
+-- Add HTTP validators to scout_feeds for conditional GET (idempotent)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name='scout_feeds') THEN
+        IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
+                       WHERE table_name='scout_feeds' AND column_name='etag') THEN
+            ALTER TABLE scout_feeds ADD COLUMN etag VARCHAR;
+        END IF;
+        
+        IF NOT EXISTS (SELECT 1 FROM information_schema.columns 
+                       WHERE table_name='scout_feeds' AND column_name='last_modified') THEN
+            ALTER TABLE scout_feeds ADD COLUMN last_modified VARCHAR;
+        END IF;
+    END IF;
+END $$;
+
+DROP TYPE IF EXISTS classification;
+DROP TYPE IF EXISTS sanitizelevel;
+
+-- Document/note bodies: masked_text/masked_body moved to 1:1 tables (idempotent).
+-- List scans of documents/project_notes no longer carry the body (or its TOAST pointer).
+-- No CREATE TABLE here: document_bodies/project_note_bodies come from models.py via create_all
+-- (entrypoint.sh runs it before this script) or from Alembic revision 0004; only the data move happens here.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='documents' AND column_name='masked_text') THEN
+        INSERT INTO document_bodies (document_id, masked_text)
+            SELECT id, masked_text FROM documents
+            ON CONFLICT (document_id) DO NOTHING;
+        ALTER TABLE documents DROP COLUMN masked_text;
+    END IF;
+    
+    IF EXISTS (SELECT 1 FROM information_schema.columns 
+               WHERE table_name='project_notes' AND column_name='masked_body') THEN
+        INSERT INTO project_note_bodies (note_id, masked_body)
+            SELECT id, masked_body FROM project_notes
+            ON CONFLICT (note_id) DO NOTHING;
+        ALTER TABLE project_notes DROP COLUMN masked_body;
+    END IF;
+END $$;
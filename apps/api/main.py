@@ -2,26 +2,37 @@ from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Query, Ba
 from pydantic import BaseModel
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import PlainTextResponse, ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
 from sqlalchemy.sql import func
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, insert, select
+import asyncio
+import hashlib
 import os
+import re
 import uuid
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import orjson
 from typing import Optional, List, Dict, Any
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timezone
 
 # Local modules (keep all imports at top for lint/clarity)
 from security_core.privacy_guard import sanitize_for_logging, assert_no_content
 from database import get_db, engine, SessionLocal
+from feeds import fetch_feed_url, parse_feed, fetch_article_text, derive_tags
+from scout import fetch_all_feeds
 from models import (
     Project,
     ProjectEvent,
     Document,
+    DocumentBody,
     ProjectNote,
+    ProjectNoteBody,
     JournalistNote,
     JournalistNoteImage,
     ProjectSource,
@@ -73,6 +84,10 @@ from schemas import (
     KnoxCompileRequest,
     KnoxReportResponse,
     KnoxErrorResponse,
+    PROJECT_LIST_ADAPTER,
+    PROJECT_EVENT_LIST_ADAPTER,
+    DOCUMENT_LIST_ADAPTER,
+    NOTE_LIST_ADAPTER,
 )
 from text_processing import (
     extract_text_from_pdf,
@@ -82,6 +97,7 @@ from text_processing import (
     mask_datetime,
     validate_file_type,
     pii_gate_check,
+    detect_pii_features,
     transcribe_audio,
     normalize_transcript_text,
     process_transcript,
@@ -155,6 +171,41 @@ def _update_job(job_id: int, **fields):
         db.close()
 
 
+def _unlink_all(paths: List[Path]):
+    """
+    Ta bort filer utan föregående exists()-stat; saknad fil är redan borttagen.
+    Körs som BackgroundTask (i threadpool) efter att svaret skickats.
+    """
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove file: {type(e).__name__}")
+
+
+def _write_text_file(path: Path, content: str):
+    """Skriv text som UTF-8 (används från trådpool vid feed-import)."""
+    path.write_bytes(content.encode('utf-8'))
+
+
+def _adapter_json_response(adapter, rows, construct=None, **dump_options) -> Response:
+    """
+    Validera ORM-rader med en förkompilerad TypeAdapter (schemas.py) och returnera JSON direkt.
+    construct: valfri Model.from_orm_fast som bygger modellerna utan validering (betrodda DB-rader).
+    dump_options skickas till dump_json (t.ex. exclude_defaults/exclude_none för listor).
+    """
+    if construct is not None:
+        items = [construct(row) for row in rows]
+    else:
+        items = adapter.validate_python(rows, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(items, by_alias=True, **dump_options),
+        media_type="application/json",
+    )
+
+
 def _safe_job_result(data: Optional[dict]) -> Optional[dict]:
     """Plocka endast metadata/ids (aldrig textfält)."""
     if not isinstance(data, dict):
@@ -257,10 +308,23 @@ def _run_job_http_post(
             error_detail=type(e).__name__,
         )
 
-def run_sanitize_pipeline(raw_text: str) -> Dict:
+# Delade, read-only usage_restrictions för de två vanliga utfallen (ingen ny dict per item).
+# JSON-kolumnerna serialiserar Mapping via database.json_dumps.
+USAGE_RESTRICTIONS_DEFAULT = MappingProxyType({"ai_allowed": True, "export_allowed": True})
+USAGE_RESTRICTIONS_PARANOID = MappingProxyType({"ai_allowed": False, "export_allowed": False})
+
+
+def run_sanitize_pipeline(raw_text: str, min_level: SanitizeLevel = SanitizeLevel.NORMAL) -> Dict:
     """
     Run full sanitization pipeline on raw text (same as document ingest).
     
+    min_level=STRICT hoppar över normal-försöket (Feed/Scout höjer alltid miniminivån
+    till STRICT), så texten normaliseras och maskas en gång per nivå.
+    pii_gate_reasons innehåller då bara nivåer som faktiskt provats: None om strict passerar,
+    annars {"strict": [...]} (ingen "normal"-nyckel, ingen tom "paranoid"-lista).
+    Text utan siffror/@ (detect_pii_features) landar direkt på min_level utan
+    maskning eller gate-kontroll.
+    
     Returns:
         Dict with keys: ok (bool), masked_text (str), sanitize_level (SanitizeLevel),
         pii_gate_reasons (dict or None), usage_restrictions (dict),
@@ -275,26 +339,36 @@ def run_sanitize_pipeline(raw_text: str) -> Dict:
     # Progressive sanitization
     pii_gate_reasons = {}
     sanitize_level = SanitizeLevel.NORMAL
-    usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+    usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
     masked_text = None
     datetime_masked = False
     datetime_mask_count = 0
     
     # Try normal masking
-    masked_text = mask_text(normalized_text, level="normal")
-    is_safe, reasons = pii_gate_check(masked_text)
+    if not detect_pii_features(normalized_text):
+        # Inget för maskning/gate att slå till på: normal/strict lämnar texten orörd
+        masked_text = normalized_text
+        is_safe = True
+    elif min_level == SanitizeLevel.NORMAL:
+        masked_text = mask_text(normalized_text, level="normal")
+        is_safe, reasons = pii_gate_check(masked_text)
+    else:
+        is_safe = False
     if is_safe:
-        sanitize_level = SanitizeLevel.NORMAL
+        sanitize_level = min_level
         pii_gate_reasons = None
     else:
-        pii_gate_reasons["normal"] = reasons
+        if min_level == SanitizeLevel.NORMAL:
+            pii_gate_reasons["normal"] = reasons
         
         # Try strict masking
         masked_text = mask_text(normalized_text, level="strict")
         is_safe, reasons = pii_gate_check(masked_text)
         if is_safe:
             sanitize_level = SanitizeLevel.STRICT
-            usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+            usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
+            # Inga reasons om strict var miniminivån och passerade direkt
+            pii_gate_reasons = pii_gate_reasons or None
         else:
             pii_gate_reasons["strict"] = reasons
             
@@ -307,7 +381,7 @@ def run_sanitize_pipeline(raw_text: str) -> Dict:
                 raise Exception(f"Paranoid masking failed PII gate: {reasons}")
             
             sanitize_level = SanitizeLevel.PARANOID
-            usage_restrictions = {"ai_allowed": False, "export_allowed": False}
+            usage_restrictions = USAGE_RESTRICTIONS_PARANOID
     
     # DATUM/TID-MASKNING: alltid körs för strict/paranoid (fail-closed mot extern export)
     if sanitize_level in (SanitizeLevel.STRICT, SanitizeLevel.PARANOID):
@@ -333,7 +407,16 @@ Base.metadata.create_all(bind=engine)
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-app = FastAPI(title="Arbetsytan API")
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """ORJSONResponse som skriver UTC-tider med 'Z', som Pydantic v2 (samma JSON som tidigare)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+app = FastAPI(title="Arbetsytan API", default_response_class=UTCORJSONResponse)
 
 try:
     # Optional, but installed in demo image: Prometheus metrics
@@ -406,6 +489,48 @@ async def preload_stt_engine():
     except Exception as e:
         logger.warning(f"[STARTUP] Failed to preload STT engine: {str(e)} (will load on first use)")
 
+DOMSTOL_FEED_URL = "https://www.domstol.se/feed/56/?searchPageId=1139&scope=news"
+
+DEFAULT_SCOUT_FEEDS = (
+    ("Polisen – Händelser Västra Götaland", "https://polisen.se/aktuellt/rss/vastra-gotaland/handelser-rss---vastra-gotaland/"),
+    ("Polisen – Pressmeddelanden Västra Götaland", "https://polisen.se/aktuellt/rss/vastra-gotaland/pressmeddelanden-rss---vastra-gotaland/"),
+    ("Göteborgs tingsrätt", DOMSTOL_FEED_URL),
+)
+
+
+def _seed_default_scout_feeds(db: Session) -> None:
+    """
+    Seed default Scout feeds (idempotent).
+    Creates all defaults if the table is empty, otherwise ensures the Domstol feed exists.
+    """
+    feed_count = db.query(ScoutFeed).count()
+    if feed_count == 0:
+        for name, url in DEFAULT_SCOUT_FEEDS:
+            db.add(ScoutFeed(name=name, url=url, is_enabled=True))
+        db.commit()
+        logger.info(f"Scout: Created {len(DEFAULT_SCOUT_FEEDS)} default feeds (all enabled)")
+        return
+
+    # Kontrollera om Göteborgs tingsrätt feed saknas och lägg till den
+    domstol_feed = db.query(ScoutFeed).filter(ScoutFeed.url == DOMSTOL_FEED_URL).first()
+    if not domstol_feed:
+        db.add(ScoutFeed(name="Göteborgs tingsrätt", url=DOMSTOL_FEED_URL, is_enabled=True))
+        db.commit()
+        logger.info("Scout: Added Göteborgs tingsrätt feed to existing feeds")
+
+
+# Seed Scout feeds once at startup (keeps GET /api/scout/feeds to a single SELECT)
+@app.on_event("startup")
+async def seed_scout_feeds():
+    """Seed default Scout feeds at startup instead of on every list request."""
+    db = SessionLocal()
+    try:
+        _seed_default_scout_feeds(db)
+    except Exception as e:
+        logger.warning(f"[STARTUP] Failed to seed Scout feeds: {type(e).__name__} (will retry on /api/scout/fetch)")
+    finally:
+        db.close()
+
 # CORS middleware
 # - Dev: localhost
 # - Prod demo (Tailscale Funnel): set CORS_ALLOW_ORIGINS="https://{DOMAIN_ROOT}"
@@ -588,7 +713,7 @@ async def list_projects(
 ):
     """List all projects"""
     projects = db.query(Project).order_by(Project.updated_at.desc()).all()
-    return projects
+    return _adapter_json_response(PROJECT_LIST_ADAPTER, projects)
 
 
 @app.post("/api/projects", response_model=ProjectResponse, status_code=201)
@@ -754,9 +879,6 @@ async def delete_project(
     - Logs only metadata (no filenames/paths)
     - Fail-closed: if verification fails, log error and block delete
     """
-    import os
-    from pathlib import Path
-    from security_core.privacy_guard import sanitize_for_logging
     
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -818,6 +940,13 @@ async def delete_project(
     # === PHASE 4: Delete DB records (CASCADE) ===
     # Delete events first (explicit cascade)
     db.query(ProjectEvent).filter(ProjectEvent.project_id == project_id).delete()
+    # Delete document/note bodies first (bulk delete bypasses ORM cascade)
+    db.query(DocumentBody).filter(
+        DocumentBody.document_id.in_(select(Document.id).where(Document.project_id == project_id))
+    ).delete(synchronize_session=False)
+    db.query(ProjectNoteBody).filter(
+        ProjectNoteBody.note_id.in_(select(ProjectNote.id).where(ProjectNote.project_id == project_id))
+    ).delete(synchronize_session=False)
     # Delete documents (cascade should handle, but explicit for safety)
     db.query(Document).filter(Document.project_id == project_id).delete()
     # Delete project sources (avoid ORM trying to NULL fk on parent delete)
@@ -860,7 +989,7 @@ async def get_project_events(
     events = db.query(ProjectEvent).filter(
         ProjectEvent.project_id == project_id
     ).order_by(ProjectEvent.timestamp.desc()).all()
-    return events
+    return _adapter_json_response(PROJECT_EVENT_LIST_ADAPTER, events)
 
 
 @app.post("/api/projects/{project_id}/events", response_model=ProjectEventResponse, status_code=201)
@@ -884,7 +1013,6 @@ async def create_project_event(
     db.add(db_event)
     
     # Update project updated_at
-    from sqlalchemy.sql import func
     project.updated_at = func.now()
     
     db.commit()
@@ -946,7 +1074,7 @@ async def upload_document(
         # Progressive sanitization pipeline
         pii_gate_reasons = {}
         sanitize_level = SanitizeLevel.NORMAL
-        usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+        usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
         masked_text = None
         
         # Try normal masking
@@ -963,7 +1091,7 @@ async def upload_document(
             is_safe, reasons = pii_gate_check(masked_text)
             if is_safe:
                 sanitize_level = SanitizeLevel.STRICT
-                usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+                usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
             else:
                 pii_gate_reasons["strict"] = reasons
                 
@@ -980,7 +1108,7 @@ async def upload_document(
                     )
                 
                 sanitize_level = SanitizeLevel.PARANOID
-                usage_restrictions = {"ai_allowed": False, "export_allowed": False}
+                usage_restrictions = USAGE_RESTRICTIONS_PARANOID
         
         # Move file to permanent location
         file_id = str(uuid.uuid4())
@@ -1003,7 +1131,6 @@ async def upload_document(
         db.add(db_document)
         
         # Update project updated_at
-        from sqlalchemy.sql import func
         project.updated_at = func.now()
         
         # Create event
@@ -1058,20 +1185,11 @@ async def list_documents(
         Document.project_id == project_id
     ).order_by(Document.created_at.desc()).all()
     
-    return [
-        DocumentListResponse(
-            id=doc.id,
-            project_id=doc.project_id,
-            filename=doc.filename,
-            file_type=doc.file_type,
-            classification=doc.classification.value,
-            sanitize_level=doc.sanitize_level.value,
-            usage_restrictions=doc.usage_restrictions,
-            pii_gate_reasons=doc.pii_gate_reasons,
-            created_at=doc.created_at
-        )
-        for doc in documents
-    ]
+    # pii_gate_reasons = None utelämnas per rad (läses inte av klienten i listan); usage_restrictions skickas alltid
+    return _adapter_json_response(
+        DOCUMENT_LIST_ADAPTER, documents, construct=DocumentListResponse.from_orm_fast,
+        exclude_none=True,
+    )
 
 
 @app.get("/api/documents/{document_id}", response_model=DocumentResponse)
@@ -1084,7 +1202,7 @@ async def get_document(
     Get a specific document.
     Returns masked_text + metadata only (no file_path).
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document).options(joinedload(Document.body)).filter(Document.id == document_id).first()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -1113,7 +1231,7 @@ async def update_document(
     Update a document's masked_text.
     The text will go through the same normalize/mask/sanitization pipeline.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document).options(joinedload(Document.body)).filter(Document.id == document_id).first()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -1138,7 +1256,7 @@ async def update_document(
         is_safe, reasons = pii_gate_check(masked_text)
         if is_safe:
             sanitize_level = SanitizeLevel.STRICT
-            usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+            usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
         else:
             pii_gate_reasons["strict"] = reasons
             
@@ -1175,7 +1293,6 @@ async def update_document(
     db.add(event)
     
     # Update project updated_at
-    from sqlalchemy.sql import func
     project = db.query(Project).filter(Project.id == document.project_id).first()
     if project:
         project.updated_at = func.now()
@@ -1206,7 +1323,7 @@ async def delete_document(
     """
     Delete a document and its associated files.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document).options(joinedload(Document.body)).filter(Document.id == document_id).first()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
@@ -1214,7 +1331,6 @@ async def delete_document(
     file_type = document.file_type
 
     # Delete associated files if they exist
-    import os
     if document.file_path and os.path.exists(document.file_path):
         try:
             os.remove(document.file_path)
@@ -1245,7 +1361,6 @@ async def delete_document(
     db.delete(document)
 
     # Update project updated_at
-    from sqlalchemy.sql import func
     project = db.query(Project).filter(Project.id == project_id).first()
     if project:
         project.updated_at = func.now()
@@ -1270,7 +1385,7 @@ async def exclude_document_from_fortknox(
     - Uppdaterar usage_restrictions.fortknox_excluded
     - Loggar aldrig originaltext
     """
-    document = db.query(Document).filter(
+    document = db.query(Document).options(joinedload(Document.body)).filter(
         Document.id == document_id,
         Document.project_id == project_id
     ).first()
@@ -1336,7 +1451,7 @@ async def re_sanitize_document(
     - Updates sanitize_level, masked_text, pii_gate_reasons, usage_restrictions
     - Never logs original text
     """
-    document = db.query(Document).filter(
+    document = db.query(Document).options(joinedload(Document.body)).filter(
         Document.id == document_id,
         Document.project_id == project_id
     ).first()
@@ -1370,7 +1485,7 @@ async def re_sanitize_document(
     # Progressive sanitization pipeline
     pii_gate_reasons = {}
     sanitize_level = SanitizeLevel.NORMAL
-    usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+    usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
     
     # Try normal masking first
     masked_text = mask_text(normalized_text, level="normal")
@@ -1404,7 +1519,7 @@ async def re_sanitize_document(
             # Must use paranoid
             masked_text = mask_text(normalized_text, level="paranoid")
             sanitize_level = SanitizeLevel.PARANOID
-            usage_restrictions = {"ai_allowed": False, "export_allowed": False}
+            usage_restrictions = USAGE_RESTRICTIONS_PARANOID
     
     # Update document
     document.masked_text = masked_text
@@ -1496,16 +1611,16 @@ async def upload_recording(
     
     # Transcribe audio using local STT (openai-whisper)
     # NEVER log raw transcript
+    # Körs i threadpoolen: transkriberingen tar sekunder-minuter och får inte blockera event-loopen
     logger.info("[AUDIO] Transcription starting")
     try:
-        raw_transcript = transcribe_audio(str(audio_path))
+        raw_transcript = await run_in_threadpool(transcribe_audio, str(audio_path))
         transcript_length = len(raw_transcript) if raw_transcript else 0
         logger.info(f"[AUDIO] Transcription finished: transcript_length={transcript_length}")
     except Exception as e:
         logger.error(f"[AUDIO] Transcription failed: err={type(e).__name__}")
         # Fail-closed: cleanup and raise error (no document created)
-        if audio_path.exists():
-            os.remove(audio_path)
+        audio_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=400,
             detail="Audio transcription failed"
@@ -1537,11 +1652,11 @@ async def upload_recording(
             f.write(processed_text)
     except Exception:
         # Cleanup audio file
-        if audio_path.exists():
-            os.remove(audio_path)
+        audio_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail="Failed to create transcript file")
     
     # Feed processed text into existing ingest pipeline (same as TXT upload)
+    permanent_txt_path = None
     try:
         # Normalize text
         normalized_text = normalize_text(processed_text)
@@ -1549,7 +1664,7 @@ async def upload_recording(
         # Progressive sanitization pipeline (same as document upload)
         pii_gate_reasons = {}
         sanitize_level = SanitizeLevel.NORMAL
-        usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+        usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
         masked_text = None
         
         # Try normal masking
@@ -1566,7 +1681,7 @@ async def upload_recording(
             is_safe, reasons = pii_gate_check(masked_text)
             if is_safe:
                 sanitize_level = SanitizeLevel.STRICT
-                usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+                usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
             else:
                 pii_gate_reasons["strict"] = reasons
                 
@@ -1575,17 +1690,14 @@ async def upload_recording(
                 is_safe, reasons = pii_gate_check(masked_text)
                 
                 if not is_safe:
-                    # This should never happen - paranoid must guarantee gate pass
-                    os.remove(temp_txt_path)
-                    if audio_path.exists():
-                        os.remove(audio_path)
+                    # This should never happen - paranoid must guarantee gate pass (cleanup in except below)
                     raise HTTPException(
                         status_code=500,
                         detail="Internal error: Paranoid masking failed PII gate check. This is a bug."
                     )
                 
                 sanitize_level = SanitizeLevel.PARANOID
-                usage_restrictions = {"ai_allowed": False, "export_allowed": False}
+                usage_restrictions = USAGE_RESTRICTIONS_PARANOID
         
         # Move TXT file to permanent location
         txt_file_id = str(uuid.uuid4())
@@ -1610,7 +1722,6 @@ async def upload_recording(
         db.add(db_document)
         
         # Update project updated_at
-        from sqlalchemy.sql import func
         project.updated_at = func.now()
         
         # Create event: recording_transcribed with ONLY metadata (no raw transcript)
@@ -1633,6 +1744,7 @@ async def upload_recording(
         
         logger.info("[AUDIO] Creating document")
         db.commit()
+        permanent_txt_path = None  # Committad: filen hör nu till dokumentet och städas inte bort vid fel nedan
         db.refresh(db_document)
         logger.info(f"[AUDIO] Document created: id={db_document.id}")
         
@@ -1649,19 +1761,14 @@ async def upload_recording(
             created_at=db_document.created_at
         )
         
-    except HTTPException:
-        # Cleanup on error
-        if temp_txt_path.exists():
-            os.remove(temp_txt_path)
-        if audio_path.exists():
-            os.remove(audio_path)
-        raise
-    except Exception:
-        # Cleanup on error
-        if temp_txt_path.exists():
-            os.remove(temp_txt_path)
-        if audio_path.exists():
-            os.remove(audio_path)
+    except Exception as e:
+        # Cleanup on error: temp- eller (efter move) permanent TXT samt ljudfilen, utan exists()-stat
+        temp_txt_path.unlink(missing_ok=True)
+        if permanent_txt_path is not None:
+            permanent_txt_path.unlink(missing_ok=True)
+        audio_path.unlink(missing_ok=True)
+        if isinstance(e, HTTPException):
+            raise
         raise HTTPException(status_code=500, detail="Processing failed")
 
 
@@ -1681,7 +1788,7 @@ async def list_project_notes(
         raise HTTPException(status_code=404, detail="Project not found")
     
     notes = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.created_at.desc()).all()
-    return notes
+    return _adapter_json_response(NOTE_LIST_ADAPTER, notes, construct=NoteListResponse.from_orm_fast)
 
 
 @app.post("/api/projects/{project_id}/notes", response_model=NoteResponse, status_code=201)
@@ -1766,7 +1873,7 @@ async def get_note(
     username: str = Depends(verify_basic_auth)
 ):
     """Get a specific note with masked body."""
-    note = db.query(ProjectNote).filter(ProjectNote.id == note_id).first()
+    note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(ProjectNote.id == note_id).first()
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return note
@@ -1783,7 +1890,7 @@ async def update_project_note(
     Update a project note.
     Body goes through same normalize/mask/sanitization pipeline as documents.
     """
-    db_note = db.query(ProjectNote).filter(
+    db_note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(
         ProjectNote.id == note_id,
         ProjectNote.project_id == project_id
     ).first()
@@ -1796,7 +1903,7 @@ async def update_project_note(
     # Progressive sanitization pipeline (same as documents)
     pii_gate_reasons = {}
     sanitize_level = SanitizeLevel.NORMAL
-    usage_restrictions = {"ai_allowed": True, "export_allowed": True}
+    usage_restrictions = USAGE_RESTRICTIONS_DEFAULT
     
     # Try normal masking
     masked_text = mask_text(normalized_text, level="normal")
@@ -1818,7 +1925,7 @@ async def update_project_note(
             # Use paranoid masking
             masked_text = mask_text(normalized_text, level="paranoid")
             sanitize_level = SanitizeLevel.PARANOID
-            usage_restrictions = {"ai_allowed": False, "export_allowed": False}
+            usage_restrictions = USAGE_RESTRICTIONS_PARANOID
     
     # Update note
     if note_update.title is not None:
@@ -1852,7 +1959,7 @@ async def delete_note(
     username: str = Depends(verify_basic_auth)
 ):
     """Delete a note."""
-    note = db.query(ProjectNote).filter(ProjectNote.id == note_id).first()
+    note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(ProjectNote.id == note_id).first()
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     
@@ -1887,7 +1994,7 @@ async def exclude_note_from_fortknox(
     - Uppdaterar usage_restrictions.fortknox_excluded
     - Loggar aldrig originaltext
     """
-    db_note = db.query(ProjectNote).filter(
+    db_note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(
         ProjectNote.id == note_id,
         ProjectNote.project_id == project_id
     ).first()
@@ -1934,7 +2041,7 @@ async def re_sanitize_note(
     This endpoint attempts to upgrade sanitize_level but cannot re-process original text.
     Returns error if original text is required but not available.
     """
-    db_note = db.query(ProjectNote).filter(
+    db_note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(
         ProjectNote.id == note_id,
         ProjectNote.project_id == project_id
     ).first()
@@ -1967,30 +2074,38 @@ async def list_journalist_notes(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    notes = db.query(JournalistNote).filter(JournalistNote.project_id == project_id).order_by(JournalistNote.updated_at.desc()).all()
+    rows = db.query(
+        JournalistNote.id,
+        JournalistNote.title,
+        JournalistNote.body,
+        JournalistNote.category,
+        JournalistNote.created_at,
+        JournalistNote.updated_at,
+    ).filter(JournalistNote.project_id == project_id).order_by(JournalistNote.updated_at.desc()).all()
     
     # Build list response with preview (title or first line of body)
+    # Rader -> dicts direkt (JournalistNoteListResponse-form), serialiseras av orjson
     result = []
-    for note in notes:
+    for note_id, title, body, category, created_at, updated_at in rows:
         # Use title if available, otherwise first line of body
-        if note.title:
-            preview = note.title
+        if title:
+            preview = title
         else:
-            preview = note.body.split('\n')[0] if note.body else ""
+            preview = body.split('\n')[0] if body else ""
             if len(preview) > 100:
                 preview = preview[:100] + "..."
         
-        result.append(JournalistNoteListResponse(
-            id=note.id,
-            project_id=note.project_id,
-            title=note.title,
-            preview=preview,
-            category=note.category.value,
-            created_at=note.created_at,
-            updated_at=note.updated_at
-        ))
+        result.append({
+            "id": note_id,
+            "project_id": project_id,
+            "title": title,
+            "preview": preview,
+            "category": category.value,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        })
     
-    return result
+    return UTCORJSONResponse(content=result)
 
 
 @app.get("/api/journalist-notes/{note_id}", response_model=JournalistNoteResponse)
@@ -2000,7 +2115,7 @@ async def get_journalist_note(
     username: str = Depends(verify_basic_auth)
 ):
     """Get a specific journalist note with raw body."""
-    note = db.query(JournalistNote).filter(JournalistNote.id == note_id).first()
+    note = db.get(JournalistNote, note_id, options=[raiseload("*")])
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return note
@@ -2013,17 +2128,12 @@ async def list_journalist_note_images(
     username: str = Depends(verify_basic_auth)
 ):
     """List all images for a journalist note."""
-    note = db.query(JournalistNote).filter(JournalistNote.id == note_id).first()
+    # One round-trip: note + images (PK lookup via identity map, images via selectinload)
+    note = db.get(JournalistNote, note_id, options=[selectinload(JournalistNote.images), raiseload("*")])
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     
-    images = (
-        db.query(JournalistNoteImage)
-        .filter(JournalistNoteImage.note_id == note_id)
-        .order_by(JournalistNoteImage.created_at.desc())
-        .all()
-    )
-    return images
+    return sorted(note.images, key=lambda image: image.created_at, reverse=True)
 
 
 @app.post("/api/projects/{project_id}/journalist-notes", response_model=JournalistNoteResponse, status_code=201)
@@ -2059,26 +2169,23 @@ async def create_journalist_note(
         category=note.category or NoteCategory.RAW
     )
     db.add(db_note)
+    # flush ger note_id så att eventet skrivs i samma commit som anteckningen
+    db.flush()
     
     # Create event (metadata only - NEVER content)
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=project_id,
         event_type="note_created",
         actor=username,
         event_metadata=_safe_event_metadata({
-            "note_id": None,  # Will be set after commit
+            "note_id": db_note.id,
             "note_type": "journalist"
         }, context="audit")
-    )
-    db.add(event)
+    ))
     
     db.commit()
     db.refresh(db_note)
     
-    # Update event with note_id
-    event.event_metadata["note_id"] = db_note.id
-    db.commit()
-    
     return db_note
 
 
@@ -2115,7 +2222,7 @@ async def update_journalist_note(
     # updated_at is set automatically by onupdate
     
     # Create event (metadata only)
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=db_note.project_id,
         event_type="note_updated",
         actor=username,
@@ -2123,11 +2230,9 @@ async def update_journalist_note(
             "note_id": note_id,
             "note_type": "journalist"
         }, context="audit")
-    )
-    db.add(event)
+    ))
     
     # Update project updated_at
-    from sqlalchemy.sql import func
     project = db.query(Project).filter(Project.id == db_note.project_id).first()
     if project:
         project.updated_at = func.now()
@@ -2141,31 +2246,23 @@ async def update_journalist_note(
 @app.delete("/api/journalist-notes/{note_id}", status_code=204)
 async def delete_journalist_note(
     note_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     username: str = Depends(verify_basic_auth)
 ):
     """Delete a journalist note and associated images."""
-    note = db.query(JournalistNote).filter(JournalistNote.id == note_id).first()
+    note = db.get(JournalistNote, note_id, options=[selectinload(JournalistNote.images), raiseload("*")])
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     
     project_id = note.project_id
-    
-    # Delete associated images from disk
-    images = db.query(JournalistNoteImage).filter(JournalistNoteImage.note_id == note_id).all()
-    for image in images:
-        image_path = UPLOAD_DIR / image.file_path
-        if image_path.exists():
-            try:
-                os.remove(image_path)
-            except Exception:
-                pass  # Ignore errors
+    image_paths = [UPLOAD_DIR / image.file_path for image in note.images]
     
     # Delete note (cascade will delete images from DB)
     db.delete(note)
     
     # Create deletion event
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=project_id,
         event_type="note_deleted",
         actor=username,
@@ -2173,13 +2270,20 @@ async def delete_journalist_note(
             "note_id": note_id,
             "note_type": "journalist"
         }, context="audit")
-    )
-    db.add(event)
+    ))
     
     db.commit()
+    
+    # Delete associated images from disk after the response
+    if image_paths:
+        background_tasks.add_task(_unlink_all, image_paths)
     return None
 
 
+# Källtyp -> svensk etikett i Markdown-exporten
+_SOURCE_TYPE_LABELS = {"link": "Länk", "person": "Person", "document": "Dokument", "other": "Övrigt"}
+
+
 @app.get("/api/projects/{project_id}/export")
 async def export_project_markdown(
     project_id: int,
@@ -2195,101 +2299,100 @@ async def export_project_markdown(
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Fetch data
-    documents = db.query(Document).filter(Document.project_id == project_id).order_by(Document.created_at).all()
-    transcripts = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.created_at).all()
+    documents = db.query(Document).options(selectinload(Document.body)).filter(Document.project_id == project_id).order_by(Document.created_at).all()
+    transcripts = db.query(ProjectNote).options(selectinload(ProjectNote.body)).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.created_at).all()
     sources = db.query(ProjectSource).filter(ProjectSource.project_id == project_id).order_by(ProjectSource.created_at).all()
     journalist_notes = db.query(JournalistNote).filter(JournalistNote.project_id == project_id).order_by(JournalistNote.created_at).all()
     
-    # Build Markdown (follow template exactly)
-    md = f"# Projekt: {project.name}\n\n"
+    # Build Markdown (follow template exactly); collect parts and join once at the end
+    parts = [f"# Projekt: {project.name}\n\n"]
     
     # Project metadata (only if include_metadata=true)
     if include_metadata:
-        md += f"Projekt-ID: {project.id}\n"
-        md += f"Status: {project.status.value}\n"
-        md += f"Skapad: {project.created_at.strftime('%Y-%m-%d')}\n"
-        md += f"Uppdaterad: {project.updated_at.strftime('%Y-%m-%d')}\n\n"
+        parts.append(f"Projekt-ID: {project.id}\n")
+        parts.append(f"Status: {project.status.value}\n")
+        parts.append(f"Skapad: {project.created_at.strftime('%Y-%m-%d')}\n")
+        parts.append(f"Uppdaterad: {project.updated_at.strftime('%Y-%m-%d')}\n\n")
     else:
-        md += "\n"
+        parts.append("\n")
     
     # Export settings
-    md += "## Exportinställningar\n\n"
-    md += f"Inkludera metadata: {include_metadata}\n"
-    md += f"Inkludera röstmemo/transkript: {include_transcripts}\n"
-    md += f"Inkludera anteckningar: {include_notes}\n"
+    parts.append("## Exportinställningar\n\n")
+    parts.append(f"Inkludera metadata: {include_metadata}\n")
+    parts.append(f"Inkludera röstmemo/transkript: {include_transcripts}\n")
+    parts.append(f"Inkludera anteckningar: {include_notes}\n")
     if include_metadata:
-        md += f"Skapad av: {username}\n"
-    md += f"Exportdatum: {datetime.now().strftime('%Y-%m-%d')}\n\n"
+        parts.append(f"Skapad av: {username}\n")
+    parts.append(f"Exportdatum: {datetime.now().strftime('%Y-%m-%d')}\n\n")
     
     # Sources (only if include_metadata=true)
-    md += "## Källor\n\n"
+    parts.append("## Källor\n\n")
     if include_metadata:
-        md += "(Detta är metadata som journalisten manuellt har lagt till.)\n\n"
-        type_labels = {"link": "Länk", "person": "Person", "document": "Dokument", "other": "Övrigt"}
+        parts.append("(Detta är metadata som journalisten manuellt har lagt till.)\n\n")
         if sources:
             for src in sources:
-                type_label = type_labels.get(src.type.value, src.type.value)
-                md += f"**{type_label}** — {src.title}\n"
+                type_label = _SOURCE_TYPE_LABELS.get(src.type.value, src.type.value)
+                parts.append(f"**{type_label}** — {src.title}\n")
                 if src.comment:
-                    md += f"Kommentar: {src.comment}\n"
-                md += f"Skapad: {src.created_at.strftime('%Y-%m-%d')}\n\n"
+                    parts.append(f"Kommentar: {src.comment}\n")
+                parts.append(f"Skapad: {src.created_at.date().isoformat()}\n\n")
         else:
-            md += "*(Inget att visa)*\n\n"
+            parts.append("*(Inget att visa)*\n\n")
     else:
-        md += "*(Ej inkluderat i denna export)*\n\n"
+        parts.append("*(Ej inkluderat i denna export)*\n\n")
     
     # Documents (always included)
-    md += "## Dokument\n\n"
+    parts.append("## Dokument\n\n")
     if documents:
         for doc in documents:
-            md += f"### {doc.filename}\n\n"
+            parts.append(f"### {doc.filename}\n\n")
             if include_metadata:
-                md += f"Dokument-ID: {doc.id}\n"
-            md += f"Skapad: {doc.created_at.strftime('%Y-%m-%d')}\n\n"
-            md += f"{doc.masked_text}\n\n"
+                parts.append(f"Dokument-ID: {doc.id}\n")
+            parts.append(f"Skapad: {doc.created_at.date().isoformat()}\n\n")
+            parts.append(f"{doc.masked_text}\n\n")
     else:
-        md += "*(Inget att visa)*\n\n"
+        parts.append("*(Inget att visa)*\n\n")
     
     # Transcripts (only if toggled)
-    md += "## Röstmemo / Transkript\n\n"
+    parts.append("## Röstmemo / Transkript\n\n")
     if include_transcripts:
         if transcripts:
             for trans in transcripts:
                 title = trans.title if trans.title else "Namnlöst transkript"
-                md += f"### {title}\n\n"
+                parts.append(f"### {title}\n\n")
                 if include_metadata:
-                    md += f"Transkript-ID: {trans.id}\n"
-                md += f"Skapad: {trans.created_at.strftime('%Y-%m-%d')}\n\n"
-                md += f"{trans.masked_body}\n\n"
+                    parts.append(f"Transkript-ID: {trans.id}\n")
+                parts.append(f"Skapad: {trans.created_at.date().isoformat()}\n\n")
+                parts.append(f"{trans.masked_body}\n\n")
         else:
-            md += "*(Inget att visa)*\n\n"
+            parts.append("*(Inget att visa)*\n\n")
     else:
-        md += "*(Ej inkluderat i denna export)*\n\n"
+        parts.append("*(Ej inkluderat i denna export)*\n\n")
     
     # Notes (only if explicitly toggled, OFF by default)
-    md += "## Anteckningar\n\n"
+    parts.append("## Anteckningar\n\n")
     if include_notes:
         if journalist_notes:
             for note in journalist_notes:
                 title = note.title if note.title else "Namnlös anteckning"
-                md += f"### {title}\n\n"
+                parts.append(f"### {title}\n\n")
                 if include_metadata:
-                    md += f"Antecknings-ID: {note.id}\n"
-                    md += f"Kategori: {note.category.value}\n"
-                md += f"Skapad: {note.created_at.strftime('%Y-%m-%d')}\n"
-                md += f"Uppdaterad: {note.updated_at.strftime('%Y-%m-%d')}\n\n"
-                md += f"{note.body}\n\n"
+                    parts.append(f"Antecknings-ID: {note.id}\n")
+                    parts.append(f"Kategori: {note.category.value}\n")
+                parts.append(f"Skapad: {note.created_at.date().isoformat()}\n")
+                parts.append(f"Uppdaterad: {note.updated_at.date().isoformat()}\n\n")
+                parts.append(f"{note.body}\n\n")
         else:
-            md += "*(Inget att visa)*\n\n"
+            parts.append("*(Inget att visa)*\n\n")
     else:
-        md += "*(Ej inkluderat i denna export)*\n\n"
+        parts.append("*(Ej inkluderat i denna export)*\n\n")
     
     # Footer
-    md += "---\n\n"
-    md += "## Integritetsnotis\n\n"
-    md += "Denna export kan innehålla sanerat material från dokument och (om valt) transkript.\n"
-    md += "Privata anteckningar inkluderas inte som standard.\n"
-    md += "Systemets events/loggar innehåller aldrig innehåll, endast metadata.\n"
+    parts.append("---\n\n")
+    parts.append("## Integritetsnotis\n\n")
+    parts.append("Denna export kan innehålla sanerat material från dokument och (om valt) transkript.\n")
+    parts.append("Privata anteckningar inkluderas inte som standard.\n")
+    parts.append("Systemets events/loggar innehåller aldrig innehåll, endast metadata.\n")
     
     # Log event (metadata only, NO CONTENT)
     event_metadata = _safe_event_metadata({
@@ -2313,7 +2416,7 @@ async def export_project_markdown(
     # Return as downloadable file
     filename = f"project_{project_id}_export.md"
     return PlainTextResponse(
-        content=md,
+        content="".join(parts),
         media_type="text/markdown",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -2368,28 +2471,25 @@ async def upload_journalist_note_image(
         mime_type=mime_type
     )
     db.add(db_image)
+    # flush ger image_id så att eventet skrivs i samma commit som bilden
+    db.flush()
     
     # Create event (metadata only - NEVER image content)
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=note.project_id,
         event_type="note_image_added",
         actor=username,
         event_metadata=_safe_event_metadata({
             "note_id": note_id,
-            "image_id": None,  # Will be set after commit
+            "image_id": db_image.id,
             "mime_type": mime_type,
             "size": file_size
         }, context="audit")
-    )
-    db.add(event)
+    ))
     
     db.commit()
     db.refresh(db_image)
     
-    # Update event with image_id
-    event.event_metadata["image_id"] = db_image.id
-    db.commit()
-    
     return db_image
 
 
@@ -2401,16 +2501,9 @@ async def get_journalist_note_image(
     username: str = Depends(verify_basic_auth)
 ):
     """Get an image file for inline display."""
-    note = db.query(JournalistNote).filter(JournalistNote.id == note_id).first()
-    if not note:
-        raise HTTPException(status_code=404, detail="Note not found")
-    
-    image = db.query(JournalistNoteImage).filter(
-        JournalistNoteImage.id == image_id,
-        JournalistNoteImage.note_id == note_id
-    ).first()
-    
-    if not image:
+    # En PK-uppslagning av bara bilden; note_id-kontrollen ersätter den separata note-hämtningen
+    image = db.get(JournalistNoteImage, image_id, options=[raiseload("*")])
+    if not image or image.note_id != note_id:
         raise HTTPException(status_code=404, detail="Image not found")
     
     image_path = UPLOAD_DIR / image.file_path
@@ -2448,22 +2541,19 @@ async def create_project_source(
         comment=source_data.comment
     )
     db.add(source)
-    db.commit()
-    db.refresh(source)
     
-    # Log event (metadata only: type + timestamp, NO title/comment)
+    # Log event (metadata only: type + timestamp, NO title/comment), same commit as the source
     event_metadata = _safe_event_metadata({
         "type": source_data.type.value
     }, context="audit")
-    
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=project_id,
         event_type="source_added",
         actor=username,
         event_metadata=event_metadata
-    )
-    db.add(event)
+    ))
     db.commit()
+    db.refresh(source)
     
     logger.info(f"Source added to project {project_id}: type={source_data.type.value}")
     
@@ -2481,8 +2571,28 @@ async def get_project_sources(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    sources = db.query(ProjectSource).filter(ProjectSource.project_id == project_id).order_by(ProjectSource.created_at.desc()).all()
-    return sources
+    rows = db.query(
+        ProjectSource.id,
+        ProjectSource.title,
+        ProjectSource.type,
+        ProjectSource.url,
+        ProjectSource.comment,
+        ProjectSource.created_at,
+    ).filter(ProjectSource.project_id == project_id).order_by(ProjectSource.created_at.desc()).all()
+    
+    # Rader -> dicts direkt (ProjectSourceResponse-form), serialiseras av orjson
+    return UTCORJSONResponse(content=[
+        {
+            "id": source_id,
+            "project_id": project_id,
+            "title": title,
+            "type": source_type.value,
+            "url": url,
+            "comment": comment,
+            "created_at": created_at,
+        }
+        for source_id, title, source_type, url, comment, created_at in rows
+    ])
 
 @app.put("/api/projects/{project_id}/sources/{source_id}", response_model=ProjectSourceResponse)
 async def update_project_source(
@@ -2511,11 +2621,8 @@ async def update_project_source(
     if source_update.comment is not None:
         source.comment = source_update.comment
     
-    db.commit()
-    db.refresh(source)
-    
     # Log update event
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=project_id,
         event_type="source_updated",
         actor=username,
@@ -2523,9 +2630,10 @@ async def update_project_source(
             "source_id": source_id,
             "source_type": source.type.value if hasattr(source.type, 'value') else str(source.type)
         }, context="audit")
-    )
-    db.add(event)
+    ))
+    
     db.commit()
+    db.refresh(source)
     
     return source
 
@@ -2550,20 +2658,17 @@ async def delete_project_source(
     
     # Delete source
     db.delete(source)
-    db.commit()
     
     # Log event (metadata only: type, NO title/comment)
     event_metadata = _safe_event_metadata({
         "type": source_type
     }, context="audit")
-    
-    event = ProjectEvent(
+    db.add(ProjectEvent(
         project_id=project_id,
         event_type="source_removed",
         actor=username,
         event_metadata=event_metadata
-    )
-    db.add(event)
+    ))
     db.commit()
     
     logger.info(f"Source removed from project {project_id}: type={source_type}")
@@ -2577,46 +2682,7 @@ async def list_scout_feeds(
     db: Session = Depends(get_db),
     username: str = Depends(verify_basic_auth)
 ):
-    """List all Scout feeds. Lazy seed: creates default feeds if table is empty."""
-    # Lazy seed: if no feeds exist, create defaults
-    feed_count = db.query(ScoutFeed).count()
-    if feed_count == 0:
-        defaults = [
-            ScoutFeed(
-                name="Polisen – Händelser Västra Götaland",
-                url="https://polisen.se/aktuellt/rss/vastra-gotaland/handelser-rss---vastra-gotaland/",
-                is_enabled=True
-            ),
-            ScoutFeed(
-                name="Polisen – Pressmeddelanden Västra Götaland",
-                url="https://polisen.se/aktuellt/rss/vastra-gotaland/pressmeddelanden-rss---vastra-gotaland/",
-                is_enabled=True
-            ),
-            ScoutFeed(
-                name="Göteborgs tingsrätt",
-                url="https://www.domstol.se/feed/56/?searchPageId=1139&scope=news",
-                is_enabled=True
-            )
-        ]
-        for feed in defaults:
-            db.add(feed)
-        db.commit()
-        logger.info("Scout: Created 3 default feeds (all enabled)")
-    else:
-        # Kontrollera om Göteborgs tingsrätt feed saknas och lägg till den
-        domstol_feed = db.query(ScoutFeed).filter(
-            ScoutFeed.url == "https://www.domstol.se/feed/56/?searchPageId=1139&scope=news"
-        ).first()
-        if not domstol_feed:
-            new_feed = ScoutFeed(
-                name="Göteborgs tingsrätt",
-                url="https://www.domstol.se/feed/56/?searchPageId=1139&scope=news",
-                is_enabled=True
-            )
-            db.add(new_feed)
-            db.commit()
-            logger.info("Scout: Added Göteborgs tingsrätt feed to existing feeds")
-    
+    """List all Scout feeds (default feeds are seeded once at startup)."""
     feeds = db.query(ScoutFeed).all()
     return feeds
 
@@ -2671,6 +2737,10 @@ async def update_scout_feed(
     if body.name is not None:
         feed.name = body.name
     if body.url is not None:
+        if body.url != feed.url:
+            # Validatorerna gällde den gamla URL:en
+            feed.etag = None
+            feed.last_modified = None
         feed.url = body.url
     if body.is_enabled is not None:
         feed.is_enabled = body.is_enabled
@@ -2696,7 +2766,15 @@ async def list_scout_items(
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
     
     # Filter: (published_at >= cutoff) OR (published_at IS NULL AND fetched_at >= cutoff)
-    items = db.query(ScoutItem).filter(
+    rows = db.query(
+        ScoutItem.id,
+        ScoutItem.feed_id,
+        ScoutItem.title,
+        ScoutItem.link,
+        ScoutItem.published_at,
+        ScoutItem.fetched_at,
+        ScoutItem.raw_source,
+    ).filter(
         or_(
             ScoutItem.published_at >= cutoff,
             and_(ScoutItem.published_at.is_(None), ScoutItem.fetched_at >= cutoff)
@@ -2705,7 +2783,8 @@ async def list_scout_items(
         sql_func.coalesce(ScoutItem.published_at, ScoutItem.fetched_at).desc()
     ).limit(limit).all()
     
-    return items
+    # Rader -> dicts direkt (ScoutItemResponse-form), serialiseras av orjson
+    return UTCORJSONResponse(content=[row._asdict() for row in rows])
 
 
 @app.post("/api/scout/fetch")
@@ -2714,32 +2793,9 @@ async def fetch_scout_feeds(
     username: str = Depends(verify_basic_auth)
 ):
     """Manually trigger RSS feed fetch."""
-    from scout import fetch_all_feeds
 
-    # Seeda default-feeds om tabellen är tom (UI kan kalla /fetch utan att någonsin kalla /feeds)
-    feed_count = db.query(ScoutFeed).count()
-    if feed_count == 0:
-        defaults = [
-            ScoutFeed(
-                name="Polisen – Händelser Västra Götaland",
-                url="https://polisen.se/aktuellt/rss/vastra-gotaland/handelser-rss---vastra-gotaland/",
-                is_enabled=True
-            ),
-            ScoutFeed(
-                name="Polisen – Pressmeddelanden Västra Götaland",
-                url="https://polisen.se/aktuellt/rss/vastra-gotaland/pressmeddelanden-rss---vastra-gotaland/",
-                is_enabled=True
-            ),
-            ScoutFeed(
-                name="Göteborgs tingsrätt",
-                url="https://www.domstol.se/feed/56/?searchPageId=1139&scope=news",
-                is_enabled=True
-            )
-        ]
-        for feed in defaults:
-            db.add(feed)
-        db.commit()
-        logger.info("Scout: Created 3 default feeds (all enabled) [seeded in /fetch]")
+    # Seeda default-feeds om tabellen är tom (t.ex. om startup-seed misslyckades)
+    _seed_default_scout_feeds(db)
     
     results = fetch_all_feeds(db)
     return {"feeds_processed": len(results), "results": results}
@@ -2831,7 +2887,6 @@ async def preview_feed(
     Preview a feed without creating a project.
     Returns feed metadata and items (no storage).
     """
-    from feeds import fetch_feed_url, parse_feed
     
     try:
         # Fetch and validate URL (SSRF protection)
@@ -2876,13 +2931,13 @@ async def create_project_from_feed(
     Creates Project with description/tags, ProjectSource with URL, ProjectNote with fulltext,
     and Document - all using the same ingest pipeline.
     """
-    from feeds import fetch_feed_url, parse_feed, fetch_article_text, derive_tags
-    import hashlib
+    # Råtextfiler som skrivits före commit; tas bort om importen rullas tillbaka
+    pending_items = []
     
     try:
-        # Fetch and parse feed
-        content = fetch_feed_url(request.url)
-        feed_data = parse_feed(content)
+        # Fetch and parse feed (blockerande requests/feedparser körs i threadpool, inte på event-loopen)
+        content = await run_in_threadpool(fetch_feed_url, request.url)
+        feed_data = await run_in_threadpool(parse_feed, content)
         
         # Determine project name
         project_name = request.project_name or feed_data['title'] or "Feed Import"
@@ -2906,10 +2961,9 @@ async def create_project_from_feed(
                 tags=tags
             )
             db.add(db_project)
-            db.commit()
-            db.refresh(db_project)
+            db.flush()  # Get project ID
             
-            # Create initial event
+            # Create initial event (only for new projects; re-imports log feed_imported only)
             event = ProjectEvent(
                 project_id=db_project.id,
                 event_type="project_created",
@@ -2917,14 +2971,14 @@ async def create_project_from_feed(
                 event_metadata=_safe_event_metadata({"name": project_name, "source": "feed_import"}, context="audit")
             )
             db.add(event)
-            db.commit()
         else:
             # Update existing project description/tags if needed
             if not db_project.description or "Imported from RSS" not in db_project.description:
                 db_project.description = description
             if not db_project.tags:
                 db_project.tags = tags
-            db.commit()
+        
+        # Projekt, items och import-event skrivs i en och samma transaktion (en commit nedan)
         
         # Process feed items
         created_documents = 0
@@ -2933,69 +2987,113 @@ async def create_project_from_feed(
         skipped_duplicates = 0
         items_to_process = feed_data['items'][:request.limit]
         
-        for item in items_to_process:
-            item_guid = item.get('guid') or None
-            item_link = item.get('link') or ''
-            
-            # Dedupe: check if document with same guid or link already exists in project
-            existing_doc = None
-            if item_guid:
-                # Check by guid first (PostgreSQL JSONB query)
-                from sqlalchemy import func
-                existing_doc = db.query(Document).filter(
-                    Document.project_id == db_project.id,
-                    Document.document_metadata.isnot(None),
-                    func.jsonb_extract_path_text(Document.document_metadata, 'item_guid') == item_guid
-                ).first()
-            
-            if not existing_doc and item_link:
-                # Check by link if guid didn't match
-                existing_doc = db.query(Document).filter(
-                    Document.project_id == db_project.id,
-                    Document.document_metadata.isnot(None),
-                    func.jsonb_extract_path_text(Document.document_metadata, 'item_link') == item_link
-                ).first()
+        # Documents samlas som rader och skrivs med en batchad INSERT efter loopen
+        # (masked_text parallellt, till document_bodies)
+        document_rows = []
+        document_texts = []
+        
+        # Dedupe: hämta projektets befintliga guid/link en gång (en SELECT i stället för en per item).
+        # Mängderna fylls sedan på med items från denna import.
+        known_guids = set()
+        known_links = set()
+        existing_keys = db.query(
+            Document.document_metadata['item_guid'].as_string(),
+            Document.document_metadata['item_link'].as_string(),
+        ).filter(
+            Document.project_id == db_project.id,
+            Document.document_metadata.isnot(None)
+        ).all()
+        for existing_guid, existing_link in existing_keys:
+            if existing_guid:
+                known_guids.add(existing_guid)
+            if existing_link:
+                known_links.add(existing_link)
+        
+        # Fulltext hämtas parallellt (max 8 samtidiga) för items som passerar dedupe,
+        # i stället för en blockerande hämtning per item i loopen nedan
+        mode = request.mode or "fulltext"  # Default to fulltext if not specified
+        fetch_slots = asyncio.Semaphore(8)
+        
+        async def fetch_fulltext(link: str) -> str:
+            async with fetch_slots:
+                logger.info(f"Fetching fulltext for item: {link}")
+                try:
+                    return await run_in_threadpool(fetch_article_text, link)
+                except Exception as e:
+                    logger.error(f"Failed to fetch article text: {e}")
+                    return ""
+        
+        article_texts = {}
+        if mode == "fulltext":
+            fetch_links = []
+            seen_guids = set(known_guids)
+            seen_links = set(known_links)
+            for item in items_to_process:
+                item_guid = item.get('guid') or None
+                item_link = item.get('link') or ''
+                if (item_guid and item_guid in seen_guids) or (item_link and item_link in seen_links):
+                    continue
+                if item_guid:
+                    seen_guids.add(item_guid)
+                if item_link:
+                    seen_links.add(item_link)
+                    fetch_links.append(item_link)
+            fetched = await asyncio.gather(*(fetch_fulltext(link) for link in fetch_links))
+            article_texts = dict(zip(fetch_links, fetched))
+        
+        # Gemensamma metadatanycklar för alla items i flödet
+        feed_doc_metadata = {
+            "source_type": "feed",
+            "feed_url": request.url,
+            "feed_title": feed_data['title'],
+        }
+        
+        # Filskrivningar (I/O) överlappar med nästa items sanering i en liten trådpool
+        # Slumpbytes för alla fil-id:n hämtas i ett os.urandom-anrop (uuid4 gör ett per anrop)
+        file_id_bytes = os.urandom(16 * len(items_to_process))
+        with ThreadPoolExecutor(max_workers=8) as file_pool:
+            for item_index, item in enumerate(items_to_process):
+                item_guid = item.get('guid') or None
+                item_link = item.get('link') or ''
             
-            if existing_doc:
-                skipped_duplicates += 1
-                continue
+                # Dedupe: document with same guid or link already exists in project (or earlier in this import)
+                if (item_guid and item_guid in known_guids) or (item_link and item_link in known_links):
+                    skipped_duplicates += 1
+                    continue
             
-            # Fetch article text (fulltext or summary)
-            article_text = ""
-            mode = request.mode or "fulltext"  # Default to fulltext if not specified
-            logger.info(f"Processing item with mode={mode}, link={item_link}")
+                # Article text (fulltext or summary)
+                article_text = ""
+                logger.info(f"Processing item with mode={mode}, link={item_link}")
             
-            if mode == "fulltext" and item_link:
-                logger.info(f"Fetching fulltext for item: {item_link}")
-                try:
-                    article_text = fetch_article_text(item_link)
+                if mode == "fulltext" and item_link:
+                    if item_link in article_texts:
+                        article_text = article_texts[item_link]
+                    else:
+                        # Ej förhämtad (dublett av ett item som föll bort i sanering)
+                        article_text = await fetch_fulltext(item_link)
                     logger.info(f"Fetched article text length: {len(article_text)} chars")
-                except Exception as e:
-                    logger.error(f"Failed to fetch article text: {e}")
-                    article_text = ""
             
-            # Fallback to summary if fulltext is empty
-            if not article_text:
-                logger.warning(f"Fulltext extraction returned empty, using summary for: {item_link}")
-                article_text = item.get('summary_text', '')
-                logger.info(f"Using summary text length: {len(article_text)} chars")
+                # Fallback to summary if fulltext is empty
+                if not article_text:
+                    logger.warning(f"Fulltext extraction returned empty, using summary for: {item_link}")
+                    article_text = item.get('summary_text', '')
+                    logger.info(f"Using summary text length: {len(article_text)} chars")
             
-            # Build raw content with better formatting
-            published_str = item.get('published') or ''
-            published_display = ""
-            if published_str:
-                try:
-                    from datetime import datetime
-                    # Try to parse ISO format
-                    dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
-                    published_display = dt.strftime('%Y-%m-%d %H:%M')
-                except Exception:
-                    published_display = published_str
+                # Build raw content with better formatting
+                published_str = item.get('published') or ''
+                published_display = ""
+                if published_str:
+                    try:
+                        # Try to parse ISO format
+                        dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
+                        published_display = dt.strftime('%Y-%m-%d %H:%M')
+                    except Exception:
+                        published_display = published_str
             
-            feed_title = feed_data.get('title', 'RSS Feed')
+                feed_title = feed_data.get('title', 'RSS Feed')
             
-            if article_text:
-                raw_content = f"""KÄLLA
+                if article_text:
+                    raw_content = f"""KÄLLA
 {feed_title}
 {item_link}
 
@@ -3008,8 +3106,8 @@ INNEHÅLL
 EXTRAKTION
 Källa hämtad via RSS + artikellänk
 Text extraherad automatiskt"""
-            else:
-                raw_content = f"""KÄLLA
+                else:
+                    raw_content = f"""KÄLLA
 {feed_title}
 {item_link}
 
@@ -3022,100 +3120,75 @@ INNEHÅLL
 EXTRAKTION
 Källa hämtad via RSS (endast sammanfattning)"""
             
-            # Run sanitize pipeline (fail-closed)
-            try:
-                pipeline_result = run_sanitize_pipeline(raw_content)
-            except Exception as e:
-                logger.error(f"Pipeline failed for feed item {item_link}: {e}")
-                continue  # Skip this item (fail-closed)
-
-            # Feed/Scout är systemgenererat underlag. För att Extern inte ska fastna i
-            # sanitize_level_too_low direkt så höjer vi miniminivån till STRICT deterministiskt.
-            # OBS: Inga råa texter loggas.
-            try:
-                if pipeline_result.get("sanitize_level") == SanitizeLevel.NORMAL:
-                    normalized = normalize_text(raw_content)
-                    strict_masked = mask_text(normalized, level="strict")
-                    # Maska datum/tid för strict
-                    strict_masked, datetime_stats = mask_datetime(strict_masked, level="strict")
-                    is_safe, reasons = pii_gate_check(strict_masked)
-                    if is_safe:
-                        pipeline_result["masked_text"] = strict_masked
-                        pipeline_result["sanitize_level"] = SanitizeLevel.STRICT
-                        pipeline_result["pii_gate_reasons"] = None
-                        pipeline_result["usage_restrictions"] = {"ai_allowed": True, "export_allowed": True}
-                        pipeline_result["datetime_masked"] = datetime_stats["datetime_masked"]
-                        pipeline_result["datetime_mask_count"] = datetime_stats["datetime_mask_count"]
-                    else:
-                        paranoid_masked = mask_text(normalized, level="paranoid")
-                        # Maska datum/tid för paranoid
-                        paranoid_masked, datetime_stats_p = mask_datetime(paranoid_masked, level="paranoid")
-                        is_safe_p, reasons_p = pii_gate_check(paranoid_masked)
-                        if not is_safe_p:
-                            raise Exception("Paranoid masking failed PII gate for feed item")
-                        pipeline_result["masked_text"] = paranoid_masked
-                        pipeline_result["sanitize_level"] = SanitizeLevel.PARANOID
-                        pipeline_result["pii_gate_reasons"] = {"strict": reasons, "paranoid": reasons_p}
-                        pipeline_result["usage_restrictions"] = {"ai_allowed": False, "export_allowed": False}
-                        pipeline_result["datetime_masked"] = datetime_stats_p["datetime_masked"]
-                        pipeline_result["datetime_mask_count"] = datetime_stats_p["datetime_mask_count"]
-            except Exception as e:
-                logger.error(f"Failed to enforce min strict for feed item {item_link}: {e}")
-                continue  # Skip item (fail-closed)
+                # Run sanitize pipeline (fail-closed)
+                # Feed/Scout är systemgenererat underlag. För att Extern inte ska fastna i
+                # sanitize_level_too_low direkt så höjer vi miniminivån till STRICT deterministiskt.
+                # OBS: Inga råa texter loggas.
+                try:
+                    pipeline_result = run_sanitize_pipeline(raw_content, min_level=SanitizeLevel.STRICT)
+                except Exception as e:
+                    logger.error(f"Pipeline failed for feed item {item_link}: {e}")
+                    continue  # Skip this item (fail-closed)
             
-            # Generate filename from item title (sanitized for filesystem)
-            # Use item title as filename, fallback to guid/hash
-            if item.get('title'):
-                # Sanitize title for filename: remove special chars, limit length
-                import re
-                # Keep word chars, spaces, hyphens, and Swedish chars
-                safe_title = re.sub(r'[^\w\s\-åäöÅÄÖ]', '', item['title'])
-                safe_title = re.sub(r'\s+', '_', safe_title.strip())
-                safe_title = safe_title[:100]  # Limit length
-                filename = f"{safe_title}.txt"
-            elif item_guid:
-                filename = f"feed_{item_guid[:8]}.txt"
-            else:
-                # Hash link for stable filename
-                link_hash = hashlib.sha256(item_link.encode()).hexdigest()[:8]
-                filename = f"feed_{link_hash}.txt"
+                # Generate filename from item title (sanitized for filesystem)
+                # Use item title as filename, fallback to guid/hash
+                if item.get('title'):
+                    # Sanitize title for filename: remove special chars, limit length
+                    # Keep word chars, spaces, hyphens, and Swedish chars
+                    safe_title = re.sub(r'[^\w\s\-åäöÅÄÖ]', '', item['title'])
+                    safe_title = re.sub(r'\s+', '_', safe_title.strip())
+                    safe_title = safe_title[:100]  # Limit length
+                    filename = f"{safe_title}.txt"
+                elif item_guid:
+                    filename = f"feed_{item_guid[:8]}.txt"
+                else:
+                    # Hash link for stable filename
+                    link_hash = hashlib.sha256(item_link.encode()).hexdigest()[:8]
+                    filename = f"feed_{link_hash}.txt"
             
-            # Create file on disk (required by Document model)
-            file_id = str(uuid.uuid4())
-            permanent_path = UPLOAD_DIR / f"{file_id}.txt"
+                # Create file on disk (required by Document model)
+                # En egen fil per dokument (delas aldrig), så att radering av ett dokument/projekt
+                # aldrig rör en annan referens. Skrivningen körs i trådpoolen medan nästa item saneras.
+                file_id = str(uuid.UUID(bytes=file_id_bytes[item_index * 16:(item_index + 1) * 16], version=4))
+                permanent_path = UPLOAD_DIR / f"{file_id}.txt"
+                write_future = file_pool.submit(_write_text_file, permanent_path, raw_content)
+                
+                doc_metadata = {
+                    **feed_doc_metadata,
+                    "item_guid": item_guid,
+                    "item_link": item_link,
+                    "published": published_str
+                }
+                pending_items.append((write_future, item, item_link, filename, permanent_path, doc_metadata, pipeline_result))
+                if item_guid:
+                    known_guids.add(item_guid)
+                if item_link:
+                    known_links.add(item_link)
+        
+        # Alla filskrivningar är klara här (poolen väntar vid with-slut).
+        # Document/ProjectSource/ProjectNote skapas bara för items vars fil skrevs.
+        for write_future, item, item_link, filename, permanent_path, doc_metadata, pipeline_result in pending_items:
             try:
-                with open(permanent_path, 'w', encoding='utf-8') as f:
-                    f.write(raw_content)
-            except Exception as e:
+                write_future.result()
+            except (OSError, UnicodeError) as e:
+                # Halvskriven fil tas bort (en unlink, ingen exists()-stat)
                 logger.error(f"Failed to create file for feed item: {str(e)}")
+                permanent_path.unlink(missing_ok=True)
                 continue
             
             # Create Document
-            doc_metadata = {
-                "source_type": "feed",
-                "feed_url": request.url,
-                "feed_title": feed_data['title'],
-                "item_guid": item_guid,
-                "item_link": item_link,
-                "published": published_str
-            }
-            
-            db_document = Document(
-                project_id=db_project.id,
-                filename=filename,
-                file_type="txt",
-                classification=Classification.NORMAL,
-                masked_text=pipeline_result["masked_text"],
-                file_path=str(permanent_path),
-                sanitize_level=pipeline_result["sanitize_level"],
-                usage_restrictions=pipeline_result["usage_restrictions"],
-                pii_gate_reasons=pipeline_result["pii_gate_reasons"],
-                document_metadata=doc_metadata
-            )
-            db.add(db_document)
-            db.flush()  # Get document ID
-            
-            created_documents += 1
+            document_rows.append({
+                "project_id": db_project.id,
+                "filename": filename,
+                "file_type": "txt",
+                "classification": Classification.NORMAL,
+                "file_path": str(permanent_path),
+                "sanitize_level": pipeline_result["sanitize_level"],
+                "usage_restrictions": pipeline_result["usage_restrictions"],
+                "pii_gate_reasons": pipeline_result["pii_gate_reasons"],
+                "document_metadata": doc_metadata,
+            })
+            document_texts.append(pipeline_result["masked_text"])
             
             # Create ProjectSource (dedupe on URL)
             existing_source = db.query(ProjectSource).filter(
@@ -3145,12 +3218,22 @@ Källa hämtad via RSS (endast sammanfattning)"""
             )
             db.add(db_note)
             created_notes += 1
-            
-            # Commit after each item (or batch commit - but safer per-item for now)
-            db.commit()
         
-        # Log import event (metadata only)
-        import_event = ProjectEvent(
+        # En batchad INSERT för alla Documents (insertmanyvalues); RETURNING ger antalet faktiskt skrivna rader
+        # i samma rundresa. Sources/notes flushas av den enda commit:en nedan.
+        if document_rows:
+            inserted_ids = db.scalars(
+                insert(Document).returning(Document.id, sort_by_parameter_order=True),
+                document_rows
+            ).all()
+            created_documents = len(inserted_ids)
+            db.execute(insert(DocumentBody), [
+                {"document_id": document_id, "masked_text": masked_text}
+                for document_id, masked_text in zip(inserted_ids, document_texts)
+            ])
+        
+        # Log import event (metadata only), same commit as the bulk insert
+        db.add(ProjectEvent(
             project_id=db_project.id,
             event_type="feed_imported",
             actor=username,
@@ -3162,8 +3245,8 @@ Källa hämtad via RSS (endast sammanfattning)"""
                 "skipped_duplicates": skipped_duplicates,
                 "limit": request.limit
             }, context="audit")
-        )
-        db.add(import_event)
+        ))
+        
         db.commit()
         
         logger.info(f"Feed import completed: project_id={db_project.id}, documents={created_documents}, notes={created_notes}, sources={created_sources}, skipped={skipped_duplicates}")
@@ -3177,10 +3260,14 @@ Källa hämtad via RSS (endast sammanfattning)"""
         )
         
     except ValueError as e:
+        db.rollback()
+        # Inga Document-rader pekar på filerna efter rollback (secure delete når dem aldrig)
+        _unlink_all([pending[4] for pending in pending_items])
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Feed import failed: {str(e)}", exc_info=True)
         db.rollback()
+        _unlink_all([pending[4] for pending in pending_items])
         raise HTTPException(status_code=500, detail=f"Failed to import feed: {str(e)}")
 
 
@@ -3194,8 +3281,6 @@ async def create_project_from_scout_item(
     Create a project from a single Scout item.
     Creates a project with the item's title and imports the item as a document.
     """
-    from text_processing import normalize_text, mask_text, pii_gate_check
-    
     try:
         # Get Scout item
         scout_item = db.query(ScoutItem).filter(ScoutItem.id == request.scout_item_id).first()
@@ -3238,7 +3323,6 @@ async def create_project_from_scout_item(
         if scout_item.link:
             logger.info(f"Fetching fulltext for scout item: {scout_item.link}")
             try:
-                from feeds import fetch_article_text
                 article_text = fetch_article_text(scout_item.link)
                 logger.info(f"Fetched article text length: {len(article_text)} chars")
             except Exception as e:
@@ -3250,7 +3334,6 @@ async def create_project_from_scout_item(
         published_display = ""
         if scout_item.published_at:
             try:
-                from datetime import datetime
                 dt = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
                 published_display = dt.strftime('%Y-%m-%d %H:%M')
             except Exception:
@@ -3282,8 +3365,11 @@ EXTRAKTION
 Källa hämtad via RSS (endast sammanfattning)"""
         
         # Run ingest pipeline (same as document upload)
+        # Scout är systemgenererat underlag. För att undvika att Extern blir en återvändsgränd
+        # (sanitize_level_too_low direkt) så höjer vi miniminivån till STRICT deterministiskt.
+        # OBS: Vi använder endast råtexten i minnet här (inget loggas, inget sparas rått).
         try:
-            pipeline_result = run_sanitize_pipeline(raw_content)
+            pipeline_result = run_sanitize_pipeline(raw_content, min_level=SanitizeLevel.STRICT)
         except Exception as e:
             logger.error(f"Pipeline failed for scout item {scout_item.link}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to process content: {str(e)}")
@@ -3294,41 +3380,8 @@ Källa hämtad via RSS (endast sammanfattning)"""
         usage_restrictions = pipeline_result["usage_restrictions"]
         datetime_masked = pipeline_result.get("datetime_masked", False)
         datetime_mask_count = pipeline_result.get("datetime_mask_count", 0)
-
-        # Scout är systemgenererat underlag. För att undvika att Extern blir en återvändsgränd
-        # (sanitize_level_too_low direkt) så höjer vi miniminivån till STRICT deterministiskt.
-        # OBS: Vi använder endast råtexten i minnet här (inget loggas, inget sparas rått).
-        if sanitize_level == SanitizeLevel.NORMAL:
-            normalized = normalize_text(raw_content)
-            strict_masked = mask_text(normalized, level="strict")
-            # Maska datum/tid för strict
-            strict_masked, datetime_stats = mask_datetime(strict_masked, level="strict")
-            is_safe, reasons = pii_gate_check(strict_masked)
-            if is_safe:
-                masked_text = strict_masked
-                sanitize_level = SanitizeLevel.STRICT
-                # pii_gate_reasons är None om normal passerade; behåll None här.
-                pii_gate_reasons = None
-                usage_restrictions = {"ai_allowed": True, "export_allowed": True}
-                datetime_masked = datetime_stats["datetime_masked"]
-                datetime_mask_count = datetime_stats["datetime_mask_count"]
-            else:
-                # Fail-closed: paranoid ska alltid passera gate
-                paranoid_masked = mask_text(normalized, level="paranoid")
-                # Maska datum/tid för paranoid
-                paranoid_masked, datetime_stats_p = mask_datetime(paranoid_masked, level="paranoid")
-                is_safe_p, reasons_p = pii_gate_check(paranoid_masked)
-                if not is_safe_p:
-                    raise HTTPException(status_code=500, detail="Internal error: Paranoid masking failed PII gate for Scout item")
-                masked_text = paranoid_masked
-                sanitize_level = SanitizeLevel.PARANOID
-                pii_gate_reasons = {"strict": reasons, "paranoid": reasons_p}
-                usage_restrictions = {"ai_allowed": False, "export_allowed": False}
-                datetime_masked = datetime_stats_p["datetime_masked"]
-                datetime_mask_count = datetime_stats_p["datetime_mask_count"]
         
         # Generate filename from scout item title (sanitized for filesystem)
-        import re
         if scout_item.title:
             # Keep word chars, spaces, hyphens, and Swedish chars
             safe_title = re.sub(r'[^\w\s\-åäöÅÄÖ]', '', scout_item.title)
@@ -3423,14 +3476,14 @@ async def export_project_snapshot(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    documents = db.query(Document).filter(Document.project_id == project_id).order_by(Document.created_at.asc(), Document.id.asc()).all()
+    documents = db.query(Document).options(selectinload(Document.body)).filter(Document.project_id == project_id).order_by(Document.created_at.asc(), Document.id.asc()).all()
     # Exkludera Fort Knox-genererade rapportdokument från snapshot-underlag
     # (annars riskerar vi recursion/quote-gate och sämre UX).
     documents = [
         d for d in documents
         if not (getattr(d, "document_metadata", None) and (d.document_metadata or {}).get("source_type") == "fortknox_report")
     ]
-    notes = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.created_at.asc(), ProjectNote.id.asc()).all()
+    notes = db.query(ProjectNote).options(selectinload(ProjectNote.body)).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.created_at.asc(), ProjectNote.id.asc()).all()
     sources = db.query(ProjectSource).filter(ProjectSource.project_id == project_id).order_by(ProjectSource.created_at.asc(), ProjectSource.id.asc()).all()
     transcripts = []  # TODO: iteration 2
 
@@ -4503,9 +4556,6 @@ async def create_document_from_knox_report(
                 created_at=d.created_at
             )
 
-    import re
-    import uuid
-    from datetime import datetime
 
     # Extrahera title från första H1-raden: "# Title"
     md = report.rendered_markdown.strip()
@@ -4693,7 +4743,7 @@ async def update_document_sanitize_level(
     Bumpa dokumentets sanitize_level deterministiskt och re-sanitera masked_text.
     Idempotent: samma nivå igen gör ingen ändring.
     """
-    doc = db.query(Document).filter(Document.id == document_id).first()
+    doc = db.query(Document).options(joinedload(Document.body)).filter(Document.id == document_id).first()
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     desired = (body.level or "").lower()
@@ -4714,7 +4764,6 @@ async def update_document_sanitize_level(
         # Fail-closed ONLY om vi saknar både originalfil OCH maskat innehåll.
         # Scout-importerade dokument har ofta placeholder file_path (ingen faktisk fil),
         # men masked_text i DB räcker för deterministisk bump.
-        import os
         file_path = str(doc.file_path or "")
         file_exists = bool(file_path) and os.path.exists(file_path)
         has_masked = bool((doc.masked_text or "").strip())
@@ -4776,7 +4825,7 @@ async def update_note_sanitize_level(
     Bumpa anteckningens sanitize_level deterministiskt och re-sanitera masked_body.
     Idempotent: samma nivå igen gör ingen ändring.
     """
-    note = db.query(ProjectNote).filter(ProjectNote.id == note_id, ProjectNote.project_id == project_id).first()
+    note = db.query(ProjectNote).options(joinedload(ProjectNote.body)).filter(ProjectNote.id == note_id, ProjectNote.project_id == project_id).first()
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     desired = (body.level or "").lower()
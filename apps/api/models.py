@@ -1,10 +1,40 @@
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum as SQLEnum, Text, Boolean, Index
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 import enum
 from database import Base
 
 
+class EnumString(TypeDecorator):
+    """
+    str-enum lagrad som VARCHAR(n) med enum-värdet ('normal', 'source-sensitive').
+    Ingen native PG ENUM-typ (ingen typuppslagning/cast per rad, ingen ALTER TYPE för nya värden);
+    ORM-attributet är fortfarande enum-instansen.
+    """
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls, length: int = 16):
+        super().__init__(length)
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self.enum_cls(value)
+        except ValueError:
+            # Rader skrivna av SQLEnum innehåller enum-namnet ('NORMAL')
+            return self.enum_cls[value]
+
+
 class Classification(str, enum.Enum):
     NORMAL = "normal"
     SENSITIVE = "sensitive"
@@ -38,18 +68,20 @@ class Project(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    classification = Column(SQLEnum(Classification), default=Classification.NORMAL, nullable=False)
+    classification = Column(EnumString(Classification), default=Classification.NORMAL, nullable=False)
     status = Column(SQLEnum(ProjectStatus), default=ProjectStatus.RESEARCH, nullable=False)
     due_date = Column(DateTime(timezone=True), nullable=True)
     tags = Column(JSON, nullable=True)  # List of strings
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    events = relationship("ProjectEvent", back_populates="project", order_by="ProjectEvent.timestamp.desc()")
-    documents = relationship("Document", back_populates="project", order_by="Document.created_at.desc()")
-    notes = relationship("ProjectNote", back_populates="project", order_by="ProjectNote.created_at.desc()")
-    journalist_notes = relationship("JournalistNote", back_populates="project", order_by="JournalistNote.updated_at.desc()")
-    sources = relationship("ProjectSource", back_populates="project", order_by="ProjectSource.created_at.desc()")
+    # Ingen order_by på relationerna: listendpoints sorterar i sina egna queries
+    # (index på (project_id, created_at/timestamp)); relationsladdning ska inte kosta ORDER BY.
+    events = relationship("ProjectEvent", back_populates="project")
+    documents = relationship("Document", back_populates="project")
+    notes = relationship("ProjectNote", back_populates="project")
+    journalist_notes = relationship("JournalistNote", back_populates="project")
+    sources = relationship("ProjectSource", back_populates="project")
 
 
 class ProjectEvent(Base):
@@ -64,6 +96,11 @@ class ProjectEvent(Base):
 
     project = relationship("Project", back_populates="events")
 
+    # Projektets händelser laddas filtrerat på project_id, sorterat på timestamp DESC
+    __table_args__ = (
+        Index('idx_project_events_project_timestamp', 'project_id', 'timestamp'),
+    )
+
 
 class Document(Base):
     __tablename__ = "documents"
@@ -72,16 +109,31 @@ class Document(Base):
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String, nullable=False)
     file_type = Column(String, nullable=False)  # 'pdf' or 'txt'
-    classification = Column(SQLEnum(Classification), nullable=False)
-    masked_text = Column(Text, nullable=False)
+    classification = Column(EnumString(Classification), nullable=False)
     file_path = Column(String, nullable=False)  # Server-side only, never exposed
-    sanitize_level = Column(SQLEnum(SanitizeLevel), default=SanitizeLevel.NORMAL, nullable=False)
+    sanitize_level = Column(EnumString(SanitizeLevel), default=SanitizeLevel.NORMAL, nullable=False)
     usage_restrictions = Column(JSON, nullable=False, default=lambda: {"ai_allowed": True, "export_allowed": True})
     pii_gate_reasons = Column(JSON, nullable=True)  # {"normal": [...], "strict": [...]}
     document_metadata = Column("metadata", JSON, nullable=True)  # {"source_type": "feed", "feed_url": "...", "item_guid": "...", "item_link": "...", "published": "..."}
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     project = relationship("Project", back_populates="documents")
+    # masked_text ligger i document_bodies (1:1) så att listskanningar inte drar med brödtexten.
+    # Laddas först vid åtkomst; bulkläsare använder selectinload(Document.body).
+    body = relationship("DocumentBody", uselist=False, cascade="all, delete-orphan")
+    masked_text = association_proxy("body", "masked_text", creator=lambda masked_text: DocumentBody(masked_text=masked_text))
+
+    __table_args__ = (
+        Index('idx_documents_project_created_at', 'project_id', 'created_at'),
+    )
+
+
+class DocumentBody(Base):
+    """Maskerad text för ett Document (1:1)."""
+    __tablename__ = "document_bodies"
+
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True)
+    masked_text = Column(Text, nullable=False)
 
 
 class ProjectNote(Base):
@@ -91,13 +143,27 @@ class ProjectNote(Base):
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=True)  # Optional title
-    masked_body = Column(Text, nullable=False)  # Masked/sanitized body text
-    sanitize_level = Column(SQLEnum(SanitizeLevel), default=SanitizeLevel.NORMAL, nullable=False)
+    sanitize_level = Column(EnumString(SanitizeLevel), default=SanitizeLevel.NORMAL, nullable=False)
     pii_gate_reasons = Column(JSON, nullable=True)
     usage_restrictions = Column(JSON, nullable=True)  # Same as Document: {"ai_allowed": bool, "export_allowed": bool}
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     project = relationship("Project", back_populates="notes")
+    # Masked/sanitized body text, i project_note_bodies (1:1) som för Document
+    body = relationship("ProjectNoteBody", uselist=False, cascade="all, delete-orphan")
+    masked_body = association_proxy("body", "masked_body", creator=lambda masked_body: ProjectNoteBody(masked_body=masked_body))
+
+    __table_args__ = (
+        Index('idx_project_notes_project_created_at', 'project_id', 'created_at'),
+    )
+
+
+class ProjectNoteBody(Base):
+    """Maskerad brödtext för en ProjectNote (1:1)."""
+    __tablename__ = "project_note_bodies"
+
+    note_id = Column(Integer, ForeignKey("project_notes.id", ondelete="CASCADE"), primary_key=True)
+    masked_body = Column(Text, nullable=False)
 
 
 class NoteCategory(str, enum.Enum):
@@ -163,6 +229,9 @@ class ScoutFeed(Base):
     url = Column(String, nullable=False)  # Kan vara placeholder/tom
     is_enabled = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # HTTP-validatorer från senaste lyckade hämtning (villkorlig GET: If-None-Match/If-Modified-Since)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
 
 
 class ScoutItem(Base):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 from models import Classification, NoteCategory, SourceType, ProjectStatus
@@ -85,6 +85,7 @@ class DocumentListResponse(BaseModel):
     classification: str
     sanitize_level: str
     usage_restrictions: dict
+    # Listendpointen utelämnar None (exclude_none); webbklienten läser inte pii_gate_reasons i listan
     pii_gate_reasons: Optional[dict] = None
     created_at: datetime
     # NO masked_text in list
@@ -92,6 +93,21 @@ class DocumentListResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, row) -> "DocumentListResponse":
+        """Bygg från en betrodd Document-rad utan validering (model_construct); enums blir sina värden."""
+        return cls.model_construct(
+            id=row.id,
+            project_id=row.project_id,
+            filename=row.filename,
+            file_type=row.file_type,
+            classification=row.classification.value,
+            sanitize_level=row.sanitize_level.value,
+            usage_restrictions=row.usage_restrictions,
+            pii_gate_reasons=row.pii_gate_reasons,
+            created_at=row.created_at,
+        )
+
 
 # Project Notes schemas
 class NoteCreate(BaseModel):
@@ -127,6 +143,17 @@ class NoteListResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_orm_fast(cls, row) -> "NoteListResponse":
+        """Bygg från en betrodd ProjectNote-rad utan validering (model_construct)."""
+        return cls.model_construct(
+            id=row.id,
+            project_id=row.project_id,
+            title=row.title,
+            sanitize_level=row.sanitize_level.value,
+            created_at=row.created_at,
+        )
+
 
 # Journalist Notes schemas (raw text, no sanitization)
 class JournalistNoteCreate(BaseModel):
@@ -426,3 +453,11 @@ class KnoxReportResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Förkompilerade adapters för list-endpoints (core-schemat byggs en gång vid import).
+# Validerar ORM-rader (from_attributes) och serialiserar till JSON i ett steg.
+PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+PROJECT_EVENT_LIST_ADAPTER = TypeAdapter(List[ProjectEventResponse])
+DOCUMENT_LIST_ADAPTER = TypeAdapter(List[DocumentListResponse])
+NOTE_LIST_ADAPTER = TypeAdapter(List[NoteListResponse])
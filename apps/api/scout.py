@@ -3,13 +3,15 @@ Scout RSS feed fetching logic.
 """
 import hashlib
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 
 from models import ScoutFeed, ScoutItem
 
@@ -18,6 +20,8 @@ logger = logging.getLogger(__name__)
 # User-Agent for RSS requests
 USER_AGENT = "Scout/1.0 (journalist workspace)"
 REQUEST_TIMEOUT = 10  # seconds
+GUID_HASH_BATCH_SIZE = 500  # guid_hash values per IN query
+MAX_FETCH_WORKERS = 16  # feeds fetched concurrently
 
 
 def calculate_guid_hash(feed_url: str, entry: Dict) -> str:
@@ -71,10 +75,44 @@ def parse_rss_feed(url: str, content: Optional[bytes] = None) -> List[Dict]:
     return entries
 
 
+def _parsed_to_datetime(parsed) -> Optional[datetime]:
+    """
+    Convert a feedparser time tuple to an aware datetime.
+    
+    feedparser normalizes dates to UTC, so the tuple is used as-is
+    (time.mktime would read it as local time).
+    """
+    if not parsed:
+        return None
+    try:
+        return datetime(*parsed[:6], tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        logger.debug("Scout: unparseable feed date tuple")
+        return None
+
+
+def _fetch_feed(session: requests.Session, url: str, headers: Dict[str, str]):
+    """
+    Fetch and parse one feed (runs in a worker thread; no DB access).
+    
+    Returns:
+        (response, entries); entries is None on 304 Not Modified
+    """
+    response = session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+    response.raise_for_status()
+    if response.status_code == 304:
+        return response, None
+    # Parse feed (använd response.content så vi inte gör en ny fetch i feedparser)
+    return response, parse_rss_feed(url, content=response.content)
+
+
 def fetch_all_feeds(db: Session) -> Dict[int, int]:
     """
     Fetch all enabled feeds and save new items.
     
+    Feeds are fetched and parsed concurrently in a thread pool; dedup and
+    DB writes run serially in the calling thread, one commit per feed.
+    
     Args:
         db: Database session
         
@@ -82,6 +120,31 @@ def fetch_all_feeds(db: Session) -> Dict[int, int]:
         Dictionary mapping feed_id to count of new items created
     """
     feeds = db.query(ScoutFeed).filter(ScoutFeed.is_enabled.is_(True)).all()
+    if not feeds:
+        return {}
+    
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        adapter = HTTPAdapter(pool_connections=MAX_FETCH_WORKERS, pool_maxsize=MAX_FETCH_WORKERS)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        fetches = {}
+        for feed in feeds:
+            if not feed.url:
+                continue
+            # Fetch feed with timeout and User-Agent (conditional GET when we have validators)
+            headers = {'User-Agent': USER_AGENT}
+            if feed.etag:
+                headers['If-None-Match'] = feed.etag
+            if feed.last_modified:
+                headers['If-Modified-Since'] = feed.last_modified
+            fetches[feed.id] = executor.submit(_fetch_feed, session, feed.url, headers)
+        
+        return _store_fetched_feeds(db, feeds, fetches)
+
+
+def _store_fetched_feeds(db: Session, feeds: List[ScoutFeed], fetches: Dict) -> Dict[int, int]:
+    """Dedup and save new items per feed as its fetch completes (serial DB stage of fetch_all_feeds)."""
     results = {}
     
     for feed in feeds:
@@ -92,14 +155,8 @@ def fetch_all_feeds(db: Session) -> Dict[int, int]:
                 results[feed.id] = 0
                 continue
             
-            # Fetch feed with timeout and User-Agent
             try:
-                response = requests.get(
-                    feed.url,
-                    timeout=REQUEST_TIMEOUT,
-                    headers={'User-Agent': USER_AGENT}
-                )
-                response.raise_for_status()
+                response, entries = fetches[feed.id].result()
             except requests.exceptions.RequestException as e:
                 # Log metadata only (no content)
                 logger.error(f"Scout feed {feed.id} ({feed.name}): HTTP error - {type(e).__name__}")
@@ -107,59 +164,59 @@ def fetch_all_feeds(db: Session) -> Dict[int, int]:
                 results[feed.id] = 0
                 continue
             
-            # Parse feed (använd response.content så vi inte gör en ny fetch i feedparser)
-            entries = parse_rss_feed(feed.url, content=response.content)
+            # 304 Not Modified: inget nytt sedan förra hämtningen, hoppa över parse och dedup
+            if entries is None:
+                logger.info(f"Scout feed {feed.id} ({feed.name}): not modified")
+                results[feed.id] = 0
+                continue
             
             if not entries:
                 logger.warning(f"Scout feed {feed.id} ({feed.name}): no entries found")
                 results[feed.id] = 0
                 continue
             
-            new_count = 0
+            # New items are collected as rows and written with one batched INSERT per feed
+            item_rows = []
             
-            for entry in entries:
-                # Calculate dedup hash
-                guid_hash = calculate_guid_hash(feed.url, entry)
-                
-                # Check if item already exists
-                existing = db.query(ScoutItem).filter(ScoutItem.guid_hash == guid_hash).first()
-                if existing:
+            # Calculate dedup hashes and load the existing ones in batches (one IN query per chunk, not one per entry)
+            guid_hashes = [calculate_guid_hash(feed.url, entry) for entry in entries]
+            known_hashes = set()
+            for start in range(0, len(guid_hashes), GUID_HASH_BATCH_SIZE):
+                batch = guid_hashes[start:start + GUID_HASH_BATCH_SIZE]
+                known_hashes.update(
+                    row[0] for row in db.query(ScoutItem.guid_hash).filter(ScoutItem.guid_hash.in_(batch))
+                )
+            
+            for entry, guid_hash in zip(entries, guid_hashes):
+                # Skip items already stored (or seen earlier in this feed)
+                if guid_hash in known_hashes:
                     continue
+                known_hashes.add(guid_hash)
                 
-                # Parse published date from feedparser time tuple
-                published_at = None
-                if entry.get('published_parsed'):
-                    try:
-                        published_at = datetime.fromtimestamp(
-                            time.mktime(entry['published_parsed']),
-                            tz=timezone.utc
-                        )
-                    except Exception:
-                        pass
-                
-                # Fallback to updated_parsed if published_parsed not available
-                if not published_at and entry.get('updated_parsed'):
-                    try:
-                        published_at = datetime.fromtimestamp(
-                            time.mktime(entry['updated_parsed']),
-                            tz=timezone.utc
-                        )
-                    except Exception:
-                        pass
-                
-                # Create new item
-                item = ScoutItem(
-                    feed_id=feed.id,
-                    title=entry.get('title', '')[:500],  # Limit length
-                    link=entry.get('link', '')[:1000],  # Limit length
-                    published_at=published_at,
-                    guid_hash=guid_hash,
-                    raw_source=feed.name
+                # Published date, fallback to updated if published_parsed not available
+                published_at = (
+                    _parsed_to_datetime(entry.get('published_parsed'))
+                    or _parsed_to_datetime(entry.get('updated_parsed'))
                 )
-                db.add(item)
-                new_count += 1
+                
+                item_rows.append({
+                    'feed_id': feed.id,
+                    'title': entry.get('title', '')[:500],  # Limit length
+                    'link': entry.get('link', '')[:1000],  # Limit length
+                    'published_at': published_at,
+                    'guid_hash': guid_hash,
+                    'raw_source': feed.name
+                })
+            
+            # Spara validatorerna i samma commit som items (rollback vid fel ger full hämtning nästa gång)
+            feed.etag = response.headers.get('ETag')
+            feed.last_modified = response.headers.get('Last-Modified')
             
+            if item_rows:
+                # executemany utan ORM-objekt; insertmanyvalues delar upp i sidor om 1000 rader
+                db.execute(insert(ScoutItem), item_rows)
             db.commit()
+            new_count = len(item_rows)
             results[feed.id] = new_count
             
             # Log metadata only (no content)
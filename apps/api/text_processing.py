@@ -2,11 +2,39 @@
 Text extraction and masking utilities.
 Fail-closed: raises exceptions on errors.
 """
+import heapq
+import html
+import logging
+import mmap
 import re
 import os
+import threading
 from pathlib import Path
 from typing import Tuple, List, Optional
 from collections import Counter
+from functools import lru_cache
+
+# Hyperscan (optional): snabb förfiltrering i pii_gate_check
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# pypdfium2 (optional): PDFium-bindningar för PDF-text; pypdf används om det saknas
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+try:
+    import pypdf
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 class PiiGateError(Exception):
@@ -16,29 +44,55 @@ class PiiGateError(Exception):
         super().__init__(f"PII detected after masking: {', '.join(reasons)}")
 
 
+def _extract_pdf_pages_pdfium(file_path: str) -> List[str]:
+    """Page texts via PDFium, with pypdf's conventions: '\\n' line breaks, '-' at hyphenated line ends."""
+    text_parts = []
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if text:
+                text_parts.append(text.replace('\r\n', '\n').replace('\r', '\n').replace('\ufffe', '-'))
+    finally:
+        pdf.close()
+    return text_parts
+
+
+def _extract_pdf_pages_pypdf(file_path: str) -> List[str]:
+    """Page texts via pypdf (pure Python fallback)."""
+    if not PYPDF_AVAILABLE:
+        raise ImportError("pypdf is required for PDF extraction. Install with: pip install pypdf")
+    
+    text_parts = []
+    with open(file_path, 'rb') as f:
+        pdf_reader = pypdf.PdfReader(f)
+        for page in pdf_reader.pages:
+            text = page.extract_text()
+            if text:
+                text_parts.append(text)
+    return text_parts
+
+
 def extract_text_from_pdf(file_path: str) -> str:
     """
-    Extract text from PDF file.
+    Extract text from PDF file (PDFium if pypdfium2 is installed, else pypdf).
     Raises exception on failure (fail-closed).
     """
     try:
-        import pypdf
-    except ImportError:
-        raise ImportError("pypdf is required for PDF extraction. Install with: pip install pypdf")
-    
-    try:
-        text_parts = []
-        with open(file_path, 'rb') as f:
-            pdf_reader = pypdf.PdfReader(f)
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
+        if PDFIUM_AVAILABLE:
+            text_parts = _extract_pdf_pages_pdfium(file_path)
+        else:
+            text_parts = _extract_pdf_pages_pypdf(file_path)
         
         if not text_parts:
             raise ValueError("PDF contains no extractable text")
         
         return '\n\n'.join(text_parts)
+    except ImportError:
+        raise
     except Exception as e:
         raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
@@ -49,19 +103,23 @@ def extract_text_from_txt(file_path: str) -> str:
     Tries UTF-8 first, falls back to latin-1.
     Raises exception on failure (fail-closed).
     """
+    # Avkoda direkt från en read-only mmap: ingen privat bytes-kopia av filen bredvid str:en,
+    # och fallback behöver ingen andra läsning (sidorna ligger i page cache)
     try:
-        # Try UTF-8 first
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except UnicodeDecodeError:
-        try:
-            # Fallback to latin-1
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
-        except Exception as e:
-            raise ValueError(f"Failed to extract text from TXT file: {str(e)}")
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""  # mmap kan inte mappa tomma filer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    # Try UTF-8 first
+                    text = str(mm, 'utf-8')
+                except UnicodeDecodeError:
+                    # Fallback to latin-1 (kan inte misslyckas: varje byte är ett tecken)
+                    text = str(mm, 'latin-1')
     except Exception as e:
         raise ValueError(f"Failed to read TXT file: {str(e)}")
+    # Samma radbrytningar som textläge (universal newlines)
+    return text.replace('\r\n', '\n').replace('\r', '\n')
 
 
 def sanitize_journalist_note(raw_text: str) -> str:
@@ -79,8 +137,6 @@ def sanitize_journalist_note(raw_text: str) -> str:
     if not raw_text:
         return ""
     
-    import html
-    
     # Trim whitespace from start and end
     text = raw_text.strip()
     
@@ -105,6 +161,27 @@ def sanitize_journalist_note(raw_text: str) -> str:
     return text
 
 
+# Kompilerade mönster för datum/tid-maskning (kompileras en gång vid import).
+_SWEDISH_MONTHS_LONG = r'(januari|februari|mars|april|maj|juni|juli|augusti|september|oktober|november|december)'
+_SWEDISH_MONTHS_SHORT = r'(jan|feb|mar|apr|maj|jun|jul|aug|sep|sept|okt|nov|dec)'
+_DATETIME_PATTERNS = (
+    # ISO datum: 2026-01-06, 2026/01/06
+    (re.compile(r'\b(19|20)\d{2}[-/](0[1-9]|1[0-2])[-/](0[1-9]|[12]\d|3[01])\b'), '[DATUM]'),
+    # DD/MM/YYYY och D/M/YYYY
+    (re.compile(r'\b(0?[1-9]|[12]\d|3[01])/(0?[1-9]|1[0-2])/(19|20)\d{2}\b'), '[DATUM]'),
+    # Svenska månader (lång form): "6 januari 2026", "12 maj 2024"
+    (re.compile(rf'\b(0?[1-9]|[12]\d|3[01])\s+{_SWEDISH_MONTHS_LONG}\s+(19|20)\d{{2}}\b', re.IGNORECASE), '[DATUM]'),
+    # Svenska månader (kort form): "6 jan 2026", "12 dec 2024"
+    (re.compile(rf'\b(0?[1-9]|[12]\d|3[01])\s+{_SWEDISH_MONTHS_SHORT}\.?\s+(19|20)\d{{2}}\b', re.IGNORECASE), '[DATUM]'),
+    # "6 januari", "12 maj" (utan år)
+    (re.compile(rf'\b(0?[1-9]|[12]\d|3[01])\s+{_SWEDISH_MONTHS_LONG}\b', re.IGNORECASE), '[DATUM]'),
+    # Klockslag: "13:24", "7:45", "kl 13:24", "kl. 13:24"
+    (re.compile(r'\b(kl\.?\s+)?(0?[0-9]|1\d|2[0-3])[:\.]([0-5]\d)\b', re.IGNORECASE), '[TID]'),
+)
+# PARANOID: relativa tidsord (svenska)
+_RELATIVE_TIME_RE = re.compile(r'\b(igår|idag|imorgon|i går|i dag|i morgon|förrgår|övermorgon)\b', re.IGNORECASE)
+
+
 def mask_datetime(text: str, level: str = "strict") -> Tuple[str, dict]:
     """
     Mask datum/tid deterministiskt (fail-closed: datum aldrig exporteras externt).
@@ -118,37 +195,13 @@ def mask_datetime(text: str, level: str = "strict") -> Tuple[str, dict]:
     """
     masked_count = 0
     
-    # DATUM-patterns (strict + paranoid)
-    # ISO datum: 2026-01-06, 2026/01/06
-    text, n = re.subn(r'\b(19|20)\d{2}[-/](0[1-9]|1[0-2])[-/](0[1-9]|[12]\d|3[01])\b', '[DATUM]', text)
-    masked_count += n
-    
-    # DD/MM/YYYY och D/M/YYYY
-    text, n = re.subn(r'\b(0?[1-9]|[12]\d|3[01])/(0?[1-9]|1[0-2])/(19|20)\d{2}\b', '[DATUM]', text)
-    masked_count += n
-    
-    # Svenska månader (lång form): "6 januari 2026", "12 maj 2024"
-    swedish_months_long = r'(januari|februari|mars|april|maj|juni|juli|augusti|september|oktober|november|december)'
-    text, n = re.subn(rf'\b(0?[1-9]|[12]\d|3[01])\s+{swedish_months_long}\s+(19|20)\d{{2}}\b', '[DATUM]', text, flags=re.IGNORECASE)
-    masked_count += n
-    
-    # Svenska månader (kort form): "6 jan 2026", "12 dec 2024"
-    swedish_months_short = r'(jan|feb|mar|apr|maj|jun|jul|aug|sep|sept|okt|nov|dec)'
-    text, n = re.subn(rf'\b(0?[1-9]|[12]\d|3[01])\s+{swedish_months_short}\.?\s+(19|20)\d{{2}}\b', '[DATUM]', text, flags=re.IGNORECASE)
-    masked_count += n
-    
-    # "6 januari", "12 maj" (utan år)
-    text, n = re.subn(rf'\b(0?[1-9]|[12]\d|3[01])\s+{swedish_months_long}\b', '[DATUM]', text, flags=re.IGNORECASE)
-    masked_count += n
-    
-    # Klockslag: "13:24", "7:45", "kl 13:24", "kl. 13:24"
-    text, n = re.subn(r'\b(kl\.?\s+)?(0?[0-9]|1\d|2[0-3])[:\.]([0-5]\d)\b', '[TID]', text, flags=re.IGNORECASE)
-    masked_count += n
+    # DATUM/TID-patterns (strict + paranoid)
+    for pattern, token in _DATETIME_PATTERNS:
+        text, n = pattern.subn(token, text)
+        masked_count += n
     
-    # PARANOID: relativa tidsord (svenska)
     if level == "paranoid":
-        relative_time_words = r'\b(igår|idag|imorgon|i går|i dag|i morgon|förrgår|övermorgon)\b'
-        text, n = re.subn(relative_time_words, '[RELATIV_TID]', text, flags=re.IGNORECASE)
+        text, n = _RELATIVE_TIME_RE.subn('[RELATIV_TID]', text)
         masked_count += n
     
     stats = {
@@ -159,6 +212,9 @@ def mask_datetime(text: str, level: str = "strict") -> Tuple[str, dict]:
     return text, stats
 
 
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
 def normalize_text(text: str) -> str:
     """
     Basic text normalization:
@@ -168,12 +224,12 @@ def normalize_text(text: str) -> str:
     # Normalize line breaks
     text = text.replace('\r\n', '\n').replace('\r', '\n')
     
-    # Remove excessive blank lines (max 2 consecutive)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    # Remove excessive blank lines (max 2 consecutive); regexen körs bara om det finns tre i rad
+    if '\n\n\n' in text:
+        text = _EXCESS_BLANK_LINES_RE.sub('\n\n', text)
     
-    # Remove trailing whitespace from lines
-    lines = [line.rstrip() for line in text.split('\n')]
-    text = '\n'.join(lines)
+    # Remove trailing whitespace from lines (split/rstrip/join i C; snabbare än en regex per radslut)
+    text = '\n'.join(map(str.rstrip, text.split('\n')))
     
     return text.strip()
 
@@ -195,31 +251,125 @@ def mask_text(text: str, level: str = "normal") -> str:
         return mask_text_normal(text)
 
 
+# Kompilerade maskningsmönster. Kaskaden (normal -> strict -> paranoid) kör samma
+# mönster på varje item, så de kompileras en gång vid import i stället för per anrop.
+_EMAIL_RE = re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b', re.IGNORECASE)
+_EMAIL_CHAR_RE = re.compile(r'[\w\.-]')
+_WORD_BOUNDARY_RE = re.compile(r'\b')
+
+
+def _sub_emails(pattern: re.Pattern, text: str, replacement: str) -> str:
+    """
+    Linjär motsvarighet till pattern.sub(replacement, text) för _EMAIL_RE/_GATE_EMAIL_RE.
+
+    re provar varje startposition i en [\\w.-]-körning och läser körningen till slut, vilket blir
+    kvadratiskt på t.ex. 'a.a.a…' i en text som innehåller '@'. En träff måste använda första '@'
+    efter sin start och delen efter '@' beror inte på starten, så det räcker med en .match() per
+    '@' från den vänstraste tillåtna starten (körningens början, eller första \\b för _EMAIL_RE).
+    """
+    leading_boundary = pattern.pattern.startswith('\\b')
+    parts = []
+    last = pos = 0
+    while True:
+        at = text.find('@', pos)
+        if at < 0:
+            break
+        start = at
+        while start > pos and _EMAIL_CHAR_RE.match(text, start - 1):
+            start -= 1
+        if leading_boundary and start < at:
+            boundary = _WORD_BOUNDARY_RE.search(text, start, at)
+            start = boundary.start() if boundary else at
+        m = pattern.match(text, start) if start < at else None
+        if m:
+            parts.append(text[last:m.start()])
+            parts.append(replacement)
+            last = pos = m.end()
+        else:
+            pos = at + 1
+    if not parts:
+        return text
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+# Personnummer pattern (YYYYMMDD-XXXX or YYYYMMDDXXXX); lookahead:en hoppar över positioner utan 1/2
+_PERSONNUMMER_RE = re.compile(r'(?=[12])(?:\b(19|20)\d{6}[- ]\d{4}\b|\b(19|20)\d{10}\b)')
+
+# Swedish phone number patterns
+_PHONE_RES = (
+    re.compile(r'\+46\s*\d{1,2}[- ]?\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}'),
+    re.compile(r'\b0\d{1,2}[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b'),
+    re.compile(r'\b07\d[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b'),
+    re.compile(r'-\d{4}\b'),
+    re.compile(r'\b\d{2,3}[- ]\d{2,3}[- ]\d{2,4}\b'),
+)
+
+# Long numbers (>10 digits)
+_LONG_NUMBER_RE = re.compile(r'\b\d{11,}\b')
+
+# ID labels (strict)
+_ID_LABEL_RES = (
+    re.compile(r'Dok\.Id\s+\d+', re.IGNORECASE),
+    re.compile(r'ID:\s*\d+', re.IGNORECASE),
+    re.compile(r'Id:\s*\d+', re.IGNORECASE),
+    re.compile(r'\bID\s+\d+', re.IGNORECASE),
+)
+
+# Match digit clusters with spaces/hyphens: "24 698", "322-9448", "123 45 67"
+# But avoid matching dates like "2025-11-20" (4 digits - 2 digits - 2 digits)
+# Also avoid matching already masked patterns
+_DIGIT_CLUSTER_RE = re.compile(
+    r'\b(?!(?:19|20)\d{2}[- ]\d{2}[- ]\d{2})(?![\[PHONE\]\[EMAIL\]\[REDACTED\]\[ID\]\[NUM\]])\d{1,4}(?:[- ]\d{1,4}){1,4}\b'
+)
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Standalone 5+ digit sequences (strict)
+_STANDALONE_LONG_RE = re.compile(r'\b\d{5,}\b')
+
+# Paranoid
+_URL_RE = re.compile(r'https?://[^\s]+', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+_DIGIT_RUN_RE = re.compile(r'\d+')
+_NAME_LABELS = ('Sökande', 'Motpart', 'Ombud', 'RÄTTEN', 'Rådmannen')
+# Alla etiketter i en MULTILINE-alternation över hela texten (i stället för en split på rader).
+# [^\S\n]+ är \s+ utan radbrytning så att träffen aldrig går över till nästa rad, som med radvis match.
+# En grupp per etikett; m.lastindex väljer ersättningen med etikettens normerade stavning.
+_NAME_LABEL_RE = re.compile(
+    r'^(?:' + '|'.join(f'({label})' for label in _NAME_LABELS) + r')[^\S\n]+.+',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _mask_name_label(match) -> str:
+    return _NAME_LABELS[match.lastindex - 1] + ' [NAME]'
+
+
+def _mask_digit_cluster(match) -> str:
+    """Mask spaced/hyphenated digit soups with >= 5 digits."""
+    matched = match.group()
+    # Träffen består bara av siffror, ' ' och '-' (kan aldrig innehålla en [TOKEN]):
+    # antal siffror = längd minus separatorer, utan regex
+    if len(matched) - matched.count(' ') - matched.count('-') >= 5:
+        return '[NUM]'
+    return matched
+
+
 def mask_text_normal(text: str) -> str:
     """Normal masking: email, phone, personnummer, long numbers"""
-    # Email pattern
-    email_pattern = r'\b[\w\.-]+@[\w\.-]+\.\w+\b'
-    text = re.sub(email_pattern, '[EMAIL]', text, flags=re.IGNORECASE)
-    
-    # Personnummer pattern (YYYYMMDD-XXXX or YYYYMMDDXXXX)
-    personnummer_pattern = r'\b(19|20)\d{6}[- ]\d{4}\b|\b(19|20)\d{10}\b'
-    text = re.sub(personnummer_pattern, '[REDACTED]', text)
-    
-    # Swedish phone number patterns
-    phone_patterns = [
-        r'\+46\s*\d{1,2}[- ]?\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}',
-        r'\b0\d{1,2}[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',
-        r'\b07\d[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',
-        r'-\d{4}\b',
-        r'\b\d{2,3}[- ]\d{2,3}[- ]\d{2,4}\b',
-    ]
+    # Passer som inte kan träffa hoppas över: email kräver '@', övriga en siffra.
+    # Ersättningstokens innehåller varken '@' eller siffror, så kontrollen på indatat räcker.
+    if '@' in text:
+        text = _sub_emails(_EMAIL_RE, text, '[EMAIL]')
+    if not _DIGIT_RE.search(text):
+        return text
     
-    for pattern in phone_patterns:
-        text = re.sub(pattern, '[PHONE]', text)
+    text = _PERSONNUMMER_RE.sub('[REDACTED]', text)
     
-    # Long numbers (>10 digits)
-    long_number_pattern = r'\b\d{11,}\b'
-    text = re.sub(long_number_pattern, '[REDACTED]', text)
+    for pattern in _PHONE_RES:
+        text = pattern.sub('[PHONE]', text)
+    
+    text = _LONG_NUMBER_RE.sub('[REDACTED]', text)
     
     return text
 
@@ -234,50 +384,15 @@ def mask_text_strict(text: str) -> str:
     text = mask_text_normal(text)
     
     # More aggressive ID label masking
-    id_label_patterns = [
-        r'Dok\.Id\s+\d+',
-        r'ID:\s*\d+',
-        r'Id:\s*\d+',
-        r'\bID\s+\d+',
-    ]
-    
-    for pattern in id_label_patterns:
-        text = re.sub(pattern, '[ID]', text, flags=re.IGNORECASE)
+    for pattern in _ID_LABEL_RES:
+        text = pattern.sub('[ID]', text)
     
     # Mask spaced/hyphenated digit soups (e.g., "24 698", "322 9448")
     # Pattern: sequences of digits separated by spaces/hyphens, total >= 5 digits
-    # But exclude already masked tokens and dates
-    def mask_digit_cluster(match):
-        matched = match.group()
-        # Skip if it's already a token
-        if any(token in matched for token in ['[PHONE]', '[EMAIL]', '[REDACTED]', '[ID]', '[NUM]']):
-            return matched
-        # Count total digits
-        digit_count = len(re.sub(r'\D', '', matched))
-        if digit_count >= 5:
-            return '[NUM]'
-        return matched
-    
-    # Match digit clusters with spaces/hyphens: "24 698", "322-9448", "123 45 67"
-    # But avoid matching dates like "2025-11-20" (4 digits - 2 digits - 2 digits)
-    # Also avoid matching already masked patterns
-    digit_cluster_pattern = r'\b(?!(?:19|20)\d{2}[- ]\d{2}[- ]\d{2})(?![\[PHONE\]\[EMAIL\]\[REDACTED\]\[ID\]\[NUM\]])\d{1,4}(?:[- ]\d{1,4}){1,4}\b'
-    text = re.sub(digit_cluster_pattern, mask_digit_cluster, text)
+    text = _DIGIT_CLUSTER_RE.sub(_mask_digit_cluster, text)
     
     # Also mask standalone 5+ digit sequences (not already masked)
-    # But check that it's not part of a token
-    def mask_standalone_digits(match):
-        matched = match.group()
-        # Check if surrounded by brackets (already a token)
-        start = match.start()
-        end = match.end()
-        if start > 0 and end < len(text):
-            if text[start-1] == '[' and text[end] == ']':
-                return matched
-        return '[NUM]'
-    
-    standalone_long_pattern = r'\b\d{5,}\b'
-    text = re.sub(standalone_long_pattern, '[NUM]', text)
+    text = _STANDALONE_LONG_RE.sub('[NUM]', text)
     
     return text
 
@@ -290,39 +405,244 @@ def mask_text_paranoid(text: str) -> str:
     text, _datetime_stats = mask_datetime(text, level="paranoid")
 
     # Replace emails and URLs with [LINK] first (before digit replacement)
-    email_pattern = r'\b[\w\.-]+@[\w\.-]+\.\w+\b'
-    text = re.sub(email_pattern, '[LINK]', text, flags=re.IGNORECASE)
-    
-    url_pattern = r'https?://[^\s]+'
-    text = re.sub(url_pattern, '[LINK]', text, flags=re.IGNORECASE)
+    if '@' in text:
+        text = _sub_emails(_EMAIL_RE, text, '[LINK]')
+    text = _URL_RE.sub('[LINK]', text)
     
-    # Replace all digits 0-9 with [NUM] (preserve structure)
-    # This ensures no numeric PII remains
-    text = re.sub(r'\d', '[NUM]', text)
+    # Replace every digit run with one [NUM] (separators between runs are preserved)
+    # This ensures no numeric PII remains, and the token count no longer reveals number lengths
+    text = _DIGIT_RUN_RE.sub('[NUM]', text)
     
     # Mask names after known labels (preserve line structure)
-    lines = text.split('\n')
-    masked_lines = []
-    
-    name_label_patterns = [
-        (r'^Sökande\s+(.+)', r'Sökande [NAME]'),
-        (r'^Motpart\s+(.+)', r'Motpart [NAME]'),
-        (r'^Ombud\s+(.+)', r'Ombud [NAME]'),
-        (r'^RÄTTEN\s+(.+)', r'RÄTTEN [NAME]'),
-        (r'^Rådmannen\s+(.+)', r'Rådmannen [NAME]'),
-    ]
+    text = _NAME_LABEL_RE.sub(_mask_name_label, text)
     
-    for line in lines:
-        masked_line = line
-        for pattern, replacement in name_label_patterns:
-            if re.match(pattern, line, flags=re.IGNORECASE):
-                masked_line = re.sub(pattern, replacement, line, flags=re.IGNORECASE)
-                break
-        masked_lines.append(masked_line)
+    return text
+
+
+# Tecken som normal/strict-maskning och pii_gate_check kräver för att slå till.
+_PII_FEATURE_PATTERNS = (
+    ("digit", re.compile(r'\d')),
+    ("email", re.compile(r'@')),
+)
+
+
+def detect_pii_features(text: str) -> set:
+    """
+    Billig förkontroll före maskningskaskaden.
+    Returnerar vilka PII-bärande teckenklasser som finns ({"digit", "email"}).
     
-    text = '\n'.join(masked_lines)
+    Alla mönster i normal/strict-maskning och i pii_gate_check kräver en siffra
+    eller ett @. Tom mängd betyder alltså att maskningen inte ändrar texten och
+    att gaten passerar, så kaskaden kan hoppas över.
+    """
+    return {name for name, pattern in _PII_FEATURE_PATTERNS if pattern.search(text)}
+
+
+# PII-gate (pii_gate_check): mönstren kompileras en gång vid import
+# Tillåtna maskningstoken ersätts med [TOKEN] i ett pass (en alternation i stället för en sub per token)
+_ALLOWED_TOKEN_RE = re.compile(r'\[(?:PHONE|EMAIL|PERSONNUMMER|ID|REDACTED|NUM|LINK|NAME)\]', re.IGNORECASE)
+# YYYYMMDD-XXXX, YYYYMMDDXXXX, YYMMDD-XXXX, YYMMDDXXXX
+_GATE_PERSONNUMMER_RES = (
+    re.compile(r'\b(19|20)\d{6}[- ]\d{4}\b'),  # YYYYMMDD-XXXX
+    re.compile(r'\b(19|20)\d{10}\b'),          # YYYYMMDDXXXX (12 digits)
+    re.compile(r'\b\d{6}[- ]\d{4}\b'),         # YYMMDD-XXXX
+    re.compile(r'\b\d{10}\b'),                 # YYMMDDXXXX (10 digits, but careful with context)
+)
+# Kompakt datum (19780126, 20251231), men inte YYYY-MM-DD
+_GATE_BIRTHDATE_RE = re.compile(r'\b(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])\b')
+_GATE_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_GATE_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+', re.IGNORECASE)
+# Samma träffmängd för search(): en träff finns om något '@' har ett [\w.-]-tecken före sig.
+# Förankrad på '@' i stället för att prova varje position i långa körningar (linjär).
+_GATE_EMAIL_AT_RE = re.compile(r'(?<=[\w\.-])@[\w\.-]+\.\w+', re.IGNORECASE)
+# Samma tre prefixkrävande telefonmönster som i maskningen (+46, 0X-, 07X-)
+_GATE_PHONE_RES = _PHONE_RES[:3]
+_GATE_DATE_ONLY_RE = re.compile(r'^(19|20)\d{2}-\d{2}-\d{2}$')
+_GATE_LONG_NUMBER_RE = re.compile(r'\b\d{9,}\b')
+
+
+def _birthdate_outside_iso_date(text: str, match) -> bool:
+    # Om YYYY-MM-DD finns inom 20 tecken är det troligen ett datum, inte ett födelsedatum
+    start, end = match.span()
+    return not _GATE_ISO_DATE_RE.search(text[max(0, start - 20):min(len(text), end + 20)])
+
+
+def _phone_like(text: str, match) -> bool:
+    # Minst 7 siffror och inte ett YYYY-MM-DD-datum
+    matched_text = match.group()
+    return len(_NON_DIGIT_RE.sub('', matched_text)) >= 7 and not _GATE_DATE_ONLY_RE.match(matched_text)
+
+
+# Detektionssteg i reason-ordning: (reason, mönster, efterkontroll eller None).
+# Generic reason codes only, no raw values.
+_PII_DETECT_STEPS = (
+    # Step 2: personnummer (YYYYMMDD-XXXX, YYYYMMDDXXXX, YYMMDD-XXXX, YYMMDDXXXX)
+    ('personnummer_detected', _GATE_PERSONNUMMER_RES, None),
+    # Step 3: standalone birthdate-like YYYYMMDD (not part of a YYYY-MM-DD context)
+    ('birthdate_like_sequence_detected', (_GATE_BIRTHDATE_RE,), _birthdate_outside_iso_date),
+    # Step 4: email (kan börja på valfritt ordtecken; körs separat och bara om texten har '@')
+    ('email_detected', (_GATE_EMAIL_RE,), None),
+    # Step 5: phone numbers with explicit 0/+ prefix and 7+ digits
+    ('phone_detected', _GATE_PHONE_RES, _phone_like),
+    # Step 6: unmasked ID labels
+    ('unmasked_id_detected', _ID_LABEL_RES, None),
+    # Step 7: long numeric sequences (9+ digits)
+    ('long_number_detected', (_GATE_LONG_NUMBER_RE,), None),
+)
+_EMAIL_STEP = 2
+# Övriga steg som en alternation med en namngiven grupp per steg (flaggor inline per mönster).
+# Alla börjar på en siffra, '+' (+46) eller D/I (Dok.Id, ID:, Id:); lookahead:en låter
+# regexmotorn hoppa över övriga positioner utan att prova alternativen. D/I matchas med (?i)
+# som ID-mönstren själva, så att case folding (İ, ı) ger samma startpositioner.
+_PII_DETECT_RE = re.compile(r'(?=[\d+]|(?i:[di]))(?:' + '|'.join(
+    f'(?P<step{index}>' + '|'.join(
+        f'(?i:{pattern.pattern})' if pattern.flags & re.IGNORECASE else f'(?:{pattern.pattern})'
+        for pattern in patterns
+    ) + ')'
+    for index, (_reason, patterns, _check) in enumerate(_PII_DETECT_STEPS)
+    if index != _EMAIL_STEP
+) + ')')
+
+
+def _python_char_class(pattern: str, universe: str, flags: int = 0) -> str:
+    """
+    Hyperscan-teckenklass med exakt de tecken i universe som `pattern` matchar i Pythons re (\\d, \\s, (?i)d).
+    Klassen härleds från re självt så att Unicode-siffror/-blanksteg/-case folding aldrig blir smalare.
+    """
+    codes = sorted({ord(c) for c in re.findall(pattern, universe, flags)})
+    ranges = []
+    for code in codes:
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return '[' + ''.join(
+        f'\\x{{{lo:x}}}' if lo == hi else f'\\x{{{lo:x}}}-\\x{{{hi:x}}}' for lo, hi in ranges
+    ) + ']'
+
+
+def _hyperscan_expression(pattern: re.Pattern, classes: dict, universe: str) -> bytes:
+    """
+    Översätt ett gate-mönster till ett hyperscan-uttryck som matchar minst samma texter:
+    \\b tas bort (bara fler träffar), \\d/\\s och bokstäver i IGNORECASE-mönster ersätts med
+    klasser härledda från re. Teckenklasser [...] och övriga escapes kopieras oförändrade.
+    """
+    source = pattern.pattern
+    caseless = bool(pattern.flags & re.IGNORECASE)
+    out = []
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            escape = source[i:i + 2]
+            if escape == '\\b':
+                pass
+            elif escape in ('\\d', '\\s'):
+                out.append(classes[escape])
+            else:
+                out.append(escape)
+            i += 2
+        elif char == '[':
+            end = source.index(']', i + 2)
+            out.append(source[i:end + 1])
+            i = end + 1
+        elif caseless and char.isalpha():
+            if char not in classes:
+                classes[char] = _python_char_class(re.escape(char), universe, re.IGNORECASE)
+            out.append(classes[char])
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    return ''.join(out).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _build_pii_prefilter():
+    """
+    Hyperscan-databas över gate-stegen utom email (om hyperscan finns), i prefilter-läge.
+    Uttrycken matchar en övermängd av re-mönstren, så ett steg som hyperscan inte rapporterar
+    kan inte träffa i re (fail-closed: bara falska positiva, som re-skanningen sedan avgör).
+    None om hyperscan saknas eller inte kan kompilera mönstren. Byggs vid första gate-anropet
+    (kompileringen tar ~1 s), inte vid import.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    # Plan 0-1 utom surrogater. Alla Nd-siffror, blanksteg och
+    # case-varianter av ASCII-bokstäver ligger där; plan 2+ är CJK, taggar och privat bruk.
+    universe = ''.join(map(chr, (*range(0xD800), *range(0xE000, 0x20000))))
+    classes = {'\\d': _python_char_class(r'\d', universe), '\\s': _python_char_class(r'\s', universe)}
+    expressions, ids = [], []
+    for index, (_reason, patterns, _check) in enumerate(_PII_DETECT_STEPS):
+        if index == _EMAIL_STEP:
+            continue
+        for pattern in patterns:
+            expressions.append(_hyperscan_expression(pattern, classes, universe))
+            ids.append(index)
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=[flags] * len(expressions))
+    except Exception:
+        return None
+    return database
+
+
+def _prefilter_may_match(text: str) -> bool:
+    """False bara om hyperscan visar att inget gate-steg (utom email) kan matcha."""
+    prefilter = _build_pii_prefilter()
+    if prefilter is None:
+        return True
+    try:
+        data = text.encode('utf-8')
+    except UnicodeEncodeError:
+        # Ensamma surrogater: ogiltig UTF-8 för hyperscan, låt re avgöra
+        return True
+    hits = []
+
+    def on_match(step_id, start, end, flags, context):
+        hits.append(step_id)
+        return True  # En träff räcker: avbryt skanningen
+
+    try:
+        prefilter.scan(data, match_event_handler=on_match)
+    except hyperscan.error:
+        if not hits:
+            return True
+    return bool(hits)
+
+
+def _pii_detect_reasons(text: str) -> List[str]:
+    """
+    Kör detektionsstegen i en skanning (email separat).
     
-    return text
+    _PII_DETECT_RE hittar varje position där något steg matchar. Alternationen rapporterar bara ett
+    steg per position, så övriga ännu ej träffade steg provas med .match() på samma position.
+    Resultatet blir detsamma som en separat search per steg (i reason-ordning), med tidig exit
+    när alla steg har träffat.
+    """
+    found = set()
+    if '@' in text and _GATE_EMAIL_AT_RE.search(text):
+        found.add(_EMAIL_STEP)
+    # Alla övriga steg kräver en siffra
+    if not _DIGIT_RE.search(text) or not _prefilter_may_match(text):
+        return [_PII_DETECT_STEPS[index][0] for index in sorted(found)]
+    pos = 0
+    while len(found) < len(_PII_DETECT_STEPS):
+        m = _PII_DETECT_RE.search(text, pos)
+        if not m:
+            break
+        start = m.start()
+        for index, (_reason, patterns, check) in enumerate(_PII_DETECT_STEPS):
+            if index in found:
+                continue
+            for pattern in patterns:
+                step_match = m if m.lastgroup == f'step{index}' and check is None else pattern.match(text, start)
+                if step_match and (check is None or check(text, step_match)):
+                    found.add(index)
+                    break
+        pos = start + 1
+    return [_PII_DETECT_STEPS[index][0] for index in sorted(found)]
 
 
 def pii_gate_check(text: str) -> Tuple[bool, List[str]]:
@@ -340,116 +660,17 @@ def pii_gate_check(text: str) -> Tuple[bool, List[str]]:
     - unmasked_id_detected
     - long_number_detected
     """
-    reasons = []
+    # Fast path: every detection step needs a digit or '@' (the common case after paranoid masking).
+    # Token removal below only deletes characters, so checking the unmodified text is enough.
+    if '@' not in text and not _DIGIT_RE.search(text):
+        return (True, [])
     
     # Step 1: Remove allowed tokens to avoid false positives
-    # Replace tokens with placeholders before pattern matching
-    allowed_tokens = [
-        r'\[PHONE\]',
-        r'\[EMAIL\]',
-        r'\[PERSONNUMMER\]',
-        r'\[ID\]',
-        r'\[REDACTED\]',
-        r'\[NUM\]',
-        r'\[LINK\]',
-        r'\[NAME\]'
-    ]
-    
-    # Create a sanitized version for pattern matching
-    sanitized = text
-    for token_pattern in allowed_tokens:
-        sanitized = re.sub(token_pattern, '[TOKEN]', sanitized, flags=re.IGNORECASE)
-    
-    # Step 2: Check for personnummer patterns
-    # YYYYMMDD-XXXX, YYYYMMDDXXXX, YYMMDD-XXXX, YYMMDDXXXX
-    personnummer_patterns = [
-        r'\b(19|20)\d{6}[- ]\d{4}\b',  # YYYYMMDD-XXXX
-        r'\b(19|20)\d{10}\b',          # YYYYMMDDXXXX (12 digits)
-        r'\b\d{6}[- ]\d{4}\b',         # YYMMDD-XXXX
-        r'\b\d{10}\b',                 # YYMMDDXXXX (10 digits, but careful with context)
-    ]
-    
-    for pattern in personnummer_patterns:
-        if re.search(pattern, sanitized):
-            if 'personnummer_detected' not in reasons:
-                reasons.append('personnummer_detected')
-            break
-    
-    # Step 3: Check for standalone birthdate-like YYYYMMDD sequences
-    # Pattern: (19|20)YY(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])
-    # This matches valid dates in compact form (e.g., 19780126, 20251231)
-    # But NOT YYYY-MM-DD (those are explicitly allowed)
-    birthdate_pattern = r'\b(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])\b'
-    if re.search(birthdate_pattern, sanitized):
-        # Double-check: make sure it's not part of a date with dashes
-        # If we find YYYY-MM-DD nearby, it's probably a date, not a birthdate
-        birthdate_matches = re.finditer(birthdate_pattern, sanitized)
-        for match in birthdate_matches:
-            start, end = match.span()
-            # Check if this is part of a YYYY-MM-DD pattern
-            context_start = max(0, start - 20)
-            context_end = min(len(sanitized), end + 20)
-            context = sanitized[context_start:context_end]
-            # If we see YYYY-MM-DD pattern nearby, skip this match
-            if not re.search(r'\d{4}-\d{2}-\d{2}', context):
-                if 'birthdate_like_sequence_detected' not in reasons:
-                    reasons.append('birthdate_like_sequence_detected')
-                break
-    
-    # Step 4: Check for email patterns
-    email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-    if re.search(email_pattern, sanitized, flags=re.IGNORECASE):
-        reasons.append('email_detected')
-    
-    # Step 5: Check for phone number patterns (broader: 7+ digits total)
-    # Require explicit prefix: starts with 0 or + (to avoid false positives like case numbers)
-    # Include variants with spaces, hyphens, and optional country code +46
-    # BUT: exclude date patterns (YYYY-MM-DD) which have dashes but are not phones
-    phone_patterns = [
-        # Swedish format with country code: +46 70 123 45 67, +46701234567
-        r'\+46\s*\d{1,2}[- ]?\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}',
-        # Area code with separators: 031-123 45 67, 08-123 45 67 (must start with 0)
-        r'\b0\d{1,2}[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',
-        # Mobile with separators: 070-123 45 67, 070-1234567 (must start with 07)
-        r'\b07\d[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',
-    ]
-    
-    for pattern in phone_patterns:
-        matches = re.finditer(pattern, sanitized)
-        for match in matches:
-            # Count total digits in the match
-            matched_text = match.group()
-            digit_count = len(re.sub(r'\D', '', matched_text))
-            # Also check: if it looks like a date (YYYY-MM-DD), skip it
-            if re.match(r'^(19|20)\d{2}-\d{2}-\d{2}$', matched_text):
-                continue
-            # Require at least 7 digits total
-            if digit_count >= 7:
-                if 'phone_detected' not in reasons:
-                    reasons.append('phone_detected')
-                break
-        if 'phone_detected' in reasons:
-            break
-    
-    # Step 6: Check for unmasked ID labels
-    id_label_patterns = [
-        r'Dok\.Id\s+\d+',
-        r'ID:\s*\d+',
-        r'Id:\s*\d+',
-        r'\bID\s+\d+',
-    ]
+    # Replace tokens with placeholders before pattern matching (one pass; no copy without '[')
+    sanitized = _ALLOWED_TOKEN_RE.sub('[TOKEN]', text) if '[' in text else text
     
-    for pattern in id_label_patterns:
-        if re.search(pattern, sanitized, flags=re.IGNORECASE):
-            if 'unmasked_id_detected' not in reasons:
-                reasons.append('unmasked_id_detected')
-            break
-    
-    # Step 7: Check for long numeric sequences (>8 digits, excluding tokens)
-    # Find all sequences of 9+ consecutive digits
-    long_number_pattern = r'\b\d{9,}\b'
-    if re.search(long_number_pattern, sanitized):
-        reasons.append('long_number_detected')
+    # Steps 2-7: one scan over the text for all detection patterns (see _pii_detect_reasons)
+    reasons = _pii_detect_reasons(sanitized)
     
     # Return result
     is_safe = len(reasons) == 0
@@ -466,68 +687,60 @@ def validate_file_type(file_path: str, filename: str) -> Tuple[str, bool]:
     """
     # Check extension
     ext = os.path.splitext(filename)[1].lower()
+    if ext not in ('.pdf', '.txt'):
+        # Unknown extension
+        return ('', False)
     
-    # Read first bytes for magic number check
+    # Only the 5-byte PDF magic is needed: TXT decoding falls back to latin-1,
+    # which accepts any bytes, so a TXT is decodable unless it is a PDF
     try:
         with open(file_path, 'rb') as f:
-            first_bytes = f.read(1024)
+            is_pdf = f.read(5) == b'%PDF-'
     except Exception:
         return ('', False)
     
-    # Check for PDF
     if ext == '.pdf':
-        if first_bytes.startswith(b'%PDF-'):
-            return ('pdf', True)
-        else:
-            return ('pdf', False)
-    
-    # Check for TXT
-    if ext == '.txt':
-        # Must not be PDF
-        if first_bytes.startswith(b'%PDF-'):
-            return ('txt', False)
-        
-        # Must be decodable as text
-        try:
-            first_bytes.decode('utf-8')
-            return ('txt', True)
-        except UnicodeDecodeError:
-            try:
-                first_bytes.decode('latin-1')
-                return ('txt', True)
-            except Exception:
-                return ('txt', False)
-    
-    # Unknown extension
-    return ('', False)
+        return ('pdf', is_pdf)
+    # TXT must not be PDF
+    return ('txt', not is_pdf)
+
 
+# STT engine cache: en laddning per (engine, modell). Låset gör att samtidiga första anrop
+# väntar på samma laddning i stället för att ladda modellen två gånger (lru_cache håller inget
+# lås under själva anropet). maxsize=1: byte av engine/modell släpper den gamla modellen som förut.
+_STT_LOAD_LOCK = threading.Lock()
 
-# STT engine singleton cache
-_stt_engine = None
-_stt_model = None
-_stt_engine_name = None
-_stt_model_name = None
+
+@lru_cache(maxsize=1)
+def _load_stt_engine(engine_name: str, model_name: str, device: str, compute_type: str):
+    """Ladda STT-engine/-modell; returnerar (engine, model) där den oanvända är None."""
+    logger.info(f"[STT] Loading STT engine: {engine_name}, model: {model_name}")
+    
+    if engine_name == "faster_whisper":
+        # CTranslate2; device/compute_type gäller bara faster_whisper (t.ex. cuda + float16/int8_float16)
+        from faster_whisper import WhisperModel
+        engine, model = WhisperModel(model_name, device=device, compute_type=compute_type), None
+    elif engine_name == "whisper":
+        import whisper
+        engine, model = None, whisper.load_model(model_name)  # whisper uses model object directly
+    else:
+        raise ValueError(f"Unknown STT engine: {engine_name}. Supported: faster_whisper, whisper")
+    
+    logger.info(f"[STT] Engine loaded: {engine_name}, model: {model_name}")
+    return engine, model
 
 
 def _get_stt_engine():
     """
-    Lazy load STT engine (singleton pattern).
-    Engine is cached globally to avoid reloading on each request.
+    Lazy load STT engine (cached per engine/model).
+    Engine is cached to avoid reloading on each request.
     
     Supports:
     - faster_whisper (default, recommended for demo)
     - whisper (legacy)
     
-    Model defaults to "base" (demo sweetspot).
-    "medium" model is blocked (fallback to "base").
+    Model defaults to "small" (WHISPER_MODEL).
     """
-    global _stt_engine, _stt_model, _stt_engine_name, _stt_model_name
-    
-    import os
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     # Get engine from env (default: faster_whisper)
     engine_name = os.getenv("STT_ENGINE", "faster_whisper")
     
@@ -537,26 +750,15 @@ def _get_stt_engine():
     # Allow all models (small recommended for quality, medium for best quality)
     # Note: medium is slower but provides best quality
     
-    # Reload if engine or model changed
-    if _stt_engine is None or _stt_engine_name != engine_name or _stt_model_name != model_name:
-        logger.info(f"[STT] Loading STT engine: {engine_name}, model: {model_name} (cached={_stt_engine is not None})")
-        
-        if engine_name == "faster_whisper":
-            from faster_whisper import WhisperModel
-            _stt_engine = WhisperModel(model_name, device="cpu", compute_type="int8")
-            _stt_model = None  # faster-whisper doesn't use separate model object
-        elif engine_name == "whisper":
-            import whisper
-            _stt_model = whisper.load_model(model_name)
-            _stt_engine = None  # whisper uses model object directly
-        else:
-            raise ValueError(f"Unknown STT engine: {engine_name}. Supported: faster_whisper, whisper")
-        
-        _stt_engine_name = engine_name
-        _stt_model_name = model_name
-        logger.info(f"[STT] Engine loaded: {engine_name}, model: {model_name}")
+    # faster_whisper runtime (default: CPU with INT8 quantization)
+    device = os.getenv("WHISPER_DEVICE", "cpu")
+    compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
     
-    return _stt_engine, _stt_model, _stt_engine_name, _stt_model_name
+    # Reload happens automatically if engine, model or runtime changed (new cache key)
+    with _STT_LOAD_LOCK:
+        engine, model = _load_stt_engine(engine_name, model_name, device, compute_type)
+    
+    return engine, model, engine_name, model_name
 
 
 def transcribe_audio(audio_path: str) -> str:
@@ -572,9 +774,6 @@ def transcribe_audio(audio_path: str) -> str:
     NEVER log the raw transcript output.
     Fail-closed: raises exception on error (no document created).
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     audio_path_obj = Path(audio_path)
     if not audio_path_obj.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
@@ -631,6 +830,119 @@ def transcribe_audio(audio_path: str) -> str:
         raise RuntimeError(f"Audio transcription failed: {error_type}")
 
 
+# Common Swedish STT error mappings (deterministic, explicit)
+# Extended list based on real Whisper errors
+_STT_ERROR_MAPPINGS = {
+    # Common Whisper mishearings (from actual transcripts)
+    "konfliktsutom": "konflikter",
+    "önskimol": "önskemål",
+    "önskimolen": "önskemålen",
+    "öfomulerade": "oformulerade",
+    "ommedvetna": "omedvetna",
+    "nertonat": "nertonad",
+    "frustrerad agerande": "frustrerat agerande",
+    "involverad": "involverade",
+    "det är uppfattar": "det uppfattas",
+    "det är en konflikt består": "en konflikt består",
+    "inom form av sån": "i form av en sådan",
+    "sån situation": "sådan situation",
+    "drare": "drar",
+    "ytterstaspets": "yttersta spets",
+    "ytterstasyfte": "yttersta syfte",
+    "slå snere": "slå sig ner",
+    "höjer östen": "höjer rösten",
+    "börja gråta": "börjar gråta",
+    "skargång": "jargong",
+    "mål på jobbetor": "mår på jobbet",
+    "hämrisar": "hänvisar",
+    "förypa": "fördjupa",
+    "fördjupa sig": "fördjupa sig",
+    "beståndställer": "beståndsdelar",
+    "avröter": "avbröt",
+    "honsa hansa": "hon sa, han sa",
+    "Göteborgens": "Göteborgs",
+    "funnera": "definierar",
+    "förstasked": "första skede",
+    "handtering": "hantering",
+    "bort dem": "bortom det",
+    "uppfattar som": "uppfattas som",
+    "praktiskt en": "praktiskt en",
+    "rätt visst": "rättvist",
+    "kallit upp oss": "hakat upp oss",
+    "kontors utrimmat": "kontorsutrymme",
+    "låter oerhört": "lade oerhört",
+    "gärna ett bra jobb": "gör ett bra jobb",
+    "lasa i stressen": "lade sig stressen",
+    "sjunk-iritationen": "sjönk irritationen",
+    "ovena": "ovänner",
+    "nåt är det igen": "återigen",
+    "bilder oss": "bildar oss",
+    # New error mappings from user feedback
+    "plasskar": "plaskar",
+    "själva": "själv",
+    "längt": "länge",
+    "annorlunda": "annorlunda",
+    "hej och ho": "hej och välkommen",
+    # Repeated words (common STT artifact)
+    "det det": "det",
+    "och och": "och",
+    "är är": "är",
+    "som som": "som",
+    "för för": "för",
+    "i i": "i",
+    "av av": "av",
+    "med med": "med",
+    "till till": "till",
+    "på på": "på",
+    "om om": "om",
+    "en en": "en",
+    "ett ett": "ett",
+    "den den": "den",
+    # Common phrase corrections
+    "det vill säga att": "det vill säga",
+    "det är det": "det är",
+    "det här är": "detta är",
+    "det här": "detta",
+}
+
+
+# (gemen nyckel, mönster, rättelse) i dict-ordning; ordningen är semantisk (tidigare rättelser matas
+# in i senare, t.ex. "det det" -> "det" följt av "det är uppfattar"), så ingen sammanslagen alternation.
+_STT_ERROR_RES = tuple(
+    (error.lower(), re.compile(r'\b' + re.escape(error) + r'\b', re.IGNORECASE), correction)
+    for error, correction in _STT_ERROR_MAPPINGS.items()
+)
+# Tecken som IGNORECASE matchar mot i/s men där str.lower() inte ger i/s; då hoppas förfiltret över
+_STT_CASEFOLD_SPECIALS = ('İ', 'ı', 'ſ')
+
+
+# Fasta efterbearbetningsmönster för normalize_transcript_text (kompileras en gång vid import).
+# Mönster som börjar med en körning (\s+, [.!?]+) startar bara vid körningens början ((?<!\s) osv.):
+# samma träffar, men re provar annars om från varje position i körningen (kvadratiskt på långa körningar)
+# Hela körningen av upprepningar i en pass ("det det det" -> "det"), inte bara par
+_REPEATED_WORD_RE = re.compile(r'\b(\w+)(?:\s+\1\b)+', re.IGNORECASE)
+_DET_AR_DET_RE = re.compile(r'\bdet är det\b', re.IGNORECASE)
+_SENTENCE_START_RE = re.compile(r'([.!?])\s+([a-zåäö])')
+_MISSING_PERIOD_RE = re.compile(r'([a-zåäö])([A-ZÅÄÖ])')
+_PERIOD_BEFORE_LOWER_RE = re.compile(r'\.\s+([a-zåäö])')
+_WHITESPACE_RE = re.compile(r'\s+')
+# En pass för "\s+\." följt av "\.\s*\.+": varje körning punkter (med blanksteg före/mellan) blir en punkt
+_PERIOD_RUN_RE = re.compile(r'(?<!\s)\s+\.(?:\s*\.)*|\.(?:\s*\.)+')
+_COMMA_SPACING_RE = re.compile(r'(?<!\s)\s+,\s*')
+_COLON_SPACING_RE = re.compile(r'(?<!\s)\s+:\s*')
+_SEMICOLON_SPACING_RE = re.compile(r'(?<!\s)\s+;\s*')
+_DET_AR_VERB_RE = re.compile(r'\bdet är (går|kommer|blir|finns)\b', re.IGNORECASE)
+_DET_AR_EN_BESTAR_RE = re.compile(r'\bdet är en (\w+) består\b', re.IGNORECASE)
+_DEFINIERAR_VI_RE = re.compile(r'\bdefinierar vi\b', re.IGNORECASE)
+_REPEATED_FILLER_RE = re.compile(r'\b(ja|alltså|liksom|typ)\s+\1\b', re.IGNORECASE)
+_DET_HAR_AR_RE = re.compile(r'\bdet här är\b', re.IGNORECASE)
+_DET_HAR_RE = re.compile(r'\bdet här\b', re.IGNORECASE)
+
+
+def _upper_after_punctuation(m: re.Match) -> str:
+    return m.group(1) + ' ' + m.group(2).upper()
+
+
 def normalize_transcript_text(raw_text: str, use_enhanced: bool = True) -> str:
     """
     Normalize and enhance Swedish STT transcript output.
@@ -653,142 +965,66 @@ def normalize_transcript_text(raw_text: str, use_enhanced: bool = True) -> str:
     
     text = raw_text
     
-    # Common Swedish STT error mappings (deterministic, explicit)
-    # Extended list based on real Whisper errors
-    stt_error_mappings = {
-        # Common Whisper mishearings (from actual transcripts)
-        "konfliktsutom": "konflikter",
-        "önskimol": "önskemål",
-        "önskimolen": "önskemålen",
-        "öfomulerade": "oformulerade",
-        "ommedvetna": "omedvetna",
-        "nertonat": "nertonad",
-        "frustrerad agerande": "frustrerat agerande",
-        "involverad": "involverade",
-        "det är uppfattar": "det uppfattas",
-        "det är en konflikt består": "en konflikt består",
-        "inom form av sån": "i form av en sådan",
-        "sån situation": "sådan situation",
-        "drare": "drar",
-        "ytterstaspets": "yttersta spets",
-        "ytterstasyfte": "yttersta syfte",
-        "slå snere": "slå sig ner",
-        "höjer östen": "höjer rösten",
-        "börja gråta": "börjar gråta",
-        "skargång": "jargong",
-        "mål på jobbetor": "mår på jobbet",
-        "hämrisar": "hänvisar",
-        "förypa": "fördjupa",
-        "fördjupa sig": "fördjupa sig",
-        "beståndställer": "beståndsdelar",
-        "avröter": "avbröt",
-        "honsa hansa": "hon sa, han sa",
-        "Göteborgens": "Göteborgs",
-        "funnera": "definierar",
-        "funnera vi": "definierar vi",
-        "förstasked": "första skede",
-        "handtering": "hantering",
-        "bort dem": "bortom det",
-        "uppfattar som": "uppfattas som",
-        "praktiskt en": "praktiskt en",
-        "rätt visst": "rättvist",
-        "kallit upp oss": "hakat upp oss",
-        "kontors utrimmat": "kontorsutrymme",
-        "låter oerhört": "lade oerhört",
-        "gärna ett bra jobb": "gör ett bra jobb",
-        "lasa i stressen": "lade sig stressen",
-        "sjunk-iritationen": "sjönk irritationen",
-        "ovena": "ovänner",
-        "nåt är det igen": "återigen",
-        "bilder oss": "bildar oss",
-        # New error mappings from user feedback
-        "plasskar": "plaskar",
-        "plasskar med rom": "plaskar med rom",
-        "själva": "själv",
-        "längt": "länge",
-        "längt att": "länge att",
-        "längt att det": "länge att det",
-        "annorlunda": "annorlunda",
-        "hej och ho": "hej och välkommen",
-        # Repeated words (common STT artifact)
-        "det det": "det",
-        "och och": "och",
-        "är är": "är",
-        "som som": "som",
-        "för för": "för",
-        "i i": "i",
-        "av av": "av",
-        "med med": "med",
-        "till till": "till",
-        "på på": "på",
-        "om om": "om",
-        "en en": "en",
-        "ett ett": "ett",
-        "den den": "den",
-        # Common phrase corrections
-        "det vill säga att": "det vill säga",
-        "det är det": "det är",
-        "det här är": "detta är",
-        "det här": "detta",
-    }
-    
     # Apply error mappings (word boundaries to avoid partial matches)
-    for error, correction in stt_error_mappings.items():
-        # Use word boundaries for whole-word replacements
-        pattern = r'\b' + re.escape(error) + r'\b'
-        text = re.sub(pattern, correction, text, flags=re.IGNORECASE)
+    # Förfilter: kör bara mönster vars nyckel finns i texten (gemener uppdateras efter varje träff)
+    prefilter = not any(c in text for c in _STT_CASEFOLD_SPECIALS)
+    lowered = text.lower()
+    for key, pattern, correction in _STT_ERROR_RES:
+        if prefilter and key not in lowered:
+            continue
+        text, count = pattern.subn(correction, text)
+        if count:
+            lowered = text.lower()
     
     # Remove repeated words (common STT artifact)
-    # Pattern: word word (same word repeated with space)
-    text = re.sub(r'\b(\w+)\s+\1\b', r'\1', text, flags=re.IGNORECASE)
+    # Pattern: word word [word ...] (same word repeated with space)
+    text = _REPEATED_WORD_RE.sub(r'\1', text)
     
     # Fix common sentence structure issues
     # Fix "det är det" -> "det är"
-    text = re.sub(r'\bdet är det\b', 'det är', text, flags=re.IGNORECASE)
+    text = _DET_AR_DET_RE.sub('det är', text)
     
     # Fix capitalization after sentence endings
     # Capitalize first letter after period, exclamation, question mark
-    text = re.sub(r'([.!?])\s+([a-zåäö])', lambda m: m.group(1) + ' ' + m.group(2).upper(), text)
+    text = _SENTENCE_START_RE.sub(_upper_after_punctuation, text)
     
     # Fix common punctuation issues
-    text = re.sub(r'([a-zåäö])([A-ZÅÄÖ])', r'\1. \2', text)  # Add period if missing between sentences
-    text = re.sub(r'\.\s+([a-zåäö])', r'. \1', text)  # Ensure space after period before lowercase
+    text = _MISSING_PERIOD_RE.sub(r'\1. \2', text)  # Add period if missing between sentences
+    text = _PERIOD_BEFORE_LOWER_RE.sub(r'. \1', text)  # Ensure space after period before lowercase
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces -> single space
-    text = re.sub(r'\s+\.', '.', text)  # Space before period -> period
-    text = re.sub(r'\.\s*\.+', '.', text)  # Multiple periods -> single period
-    text = re.sub(r'\s+,\s*', ', ', text)  # Normalize comma spacing
-    text = re.sub(r'\s+:\s*', ': ', text)  # Normalize colon spacing
-    text = re.sub(r'\s+;\s*', '; ', text)  # Normalize semicolon spacing
-    text = re.sub(r'\s+-\s+', ' - ', text)  # Normalize dash spacing
+    text = _WHITESPACE_RE.sub(' ', text)  # Multiple spaces -> single space
+    text = _PERIOD_RUN_RE.sub('.', text)  # Space before period + multiple periods -> single period
+    text = _COMMA_SPACING_RE.sub(', ', text)  # Normalize comma spacing
+    text = _COLON_SPACING_RE.sub(': ', text)  # Normalize colon spacing
+    text = _SEMICOLON_SPACING_RE.sub('; ', text)  # Normalize semicolon spacing
     
     # Fix common Swedish grammar issues
     # "det är" + verb -> "det" + verb (when appropriate)
-    text = re.sub(r'\bdet är (går|kommer|blir|finns)\b', r'det \1', text, flags=re.IGNORECASE)
+    text = _DET_AR_VERB_RE.sub(r'det \1', text)
     
     # Fix common word order issues
     # "det är en X består" -> "en X består"
-    text = re.sub(r'\bdet är en (\w+) består\b', r'en \1 består', text, flags=re.IGNORECASE)
+    text = _DET_AR_EN_BESTAR_RE.sub(r'en \1 består', text)
     
     # Fix "vi definierar" -> "vi definierar" (ensure correct form)
-    text = re.sub(r'\bdefinierar vi\b', 'definierar vi', text, flags=re.IGNORECASE)
+    text = _DEFINIERAR_VI_RE.sub('definierar vi', text)
     
     # Remove excessive filler words (common in speech)
     # Be conservative - only remove obvious duplicates
-    text = re.sub(r'\b(ja|alltså|liksom|typ)\s+\1\b', r'\1', text, flags=re.IGNORECASE)
+    text = _REPEATED_FILLER_RE.sub(r'\1', text)
     
     # Fix common Swedish word order issues
     # "det här är" -> "detta är" (more formal/written)
-    text = re.sub(r'\bdet här är\b', 'detta är', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bdet här\b', 'detta', text, flags=re.IGNORECASE)
+    text = _DET_HAR_AR_RE.sub('detta är', text)
+    text = _DET_HAR_RE.sub('detta', text)
     
     # Remove empty lines and normalize line breaks
     lines = [line.strip() for line in text.split('\n') if line.strip()]
     text = ' '.join(lines)  # Join all lines with space
     
     # Final cleanup
-    text = re.sub(r'\s+', ' ', text)  # Final whitespace normalization
+    text = _WHITESPACE_RE.sub(' ', text)  # Final whitespace normalization
     text = text.strip()
     
     # Ensure text starts with capital letter
@@ -802,45 +1038,44 @@ def normalize_transcript_text(raw_text: str, use_enhanced: bool = True) -> str:
     return text
 
 
-# MASTERCLASS: Enhanced transcript improvements
-def _apply_masterclass_enhancements(text: str) -> str:
-    """
-    Apply masterclass-level enhancements to transcript.
-    Includes Swedish word list checking, verb form correction, and advanced structure improvements.
-    """
+# MASTERCLASS: ordnade (mönster, ersättning); ersättningen kan vara en funktion
+_MASTERCLASS_SUBS = (
     # Fix verb forms: "börja gråta" -> "börjar gråta"
-    text = re.sub(r'\bbörja (gråta|prata|tala|jobba|arbeta)\b', r'börjar \1', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\bbörja (gråta|prata|tala|jobba|arbeta)\b', re.IGNORECASE), r'börjar \1'),
     # Fix "göra ett bra jobb" -> "gör ett bra jobb"
-    text = re.sub(r'\bgöra (ett|en) (bra|dåligt) (jobb|arbete)\b', r'gör \1 \2 \3', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\bgöra (ett|en) (bra|dåligt) (jobb|arbete)\b', re.IGNORECASE), r'gör \1 \2 \3'),
     # Fix common mishearings: "plasskar" -> "plaskar", "själva" -> "själv" (when appropriate)
-    text = re.sub(r'\bplasskar\b', 'plaskar', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bsjälva\b', 'själv', text, flags=re.IGNORECASE)
-    text = re.sub(r'\blängt\b', 'länge', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\bplasskar\b', re.IGNORECASE), 'plaskar'),
+    (re.compile(r'\bsjälva\b', re.IGNORECASE), 'själv'),
+    (re.compile(r'\blängt\b', re.IGNORECASE), 'länge'),
     # Advanced sentence structure improvements
     # Fix "det är en X består" -> "en X består"
-    text = re.sub(r'\bdet är en (\w+) består\b', r'en \1 består', text, flags=re.IGNORECASE)
-    
+    (_DET_AR_EN_BESTAR_RE, r'en \1 består'),
     # Fix "inom form av" -> "i form av"
-    text = re.sub(r'\binom form av\b', 'i form av', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\binom form av\b', re.IGNORECASE), 'i form av'),
     # Fix "sån" -> "sådan" (more formal)
-    text = re.sub(r'\bsån\b', 'sådan', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\bsån\b', re.IGNORECASE), 'sådan'),
     # Enhanced punctuation: ensure proper spacing
-    text = re.sub(r'([.!?])\s*([a-zåäö])', lambda m: m.group(1) + ' ' + m.group(2).upper(), text)
-    
+    (re.compile(r'([.!?])\s*([a-zåäö])'), _upper_after_punctuation),
     # Fix common Swedish grammar: "det är det" -> "det är"
-    text = re.sub(r'\bdet är det\b', 'det är', text, flags=re.IGNORECASE)
-    
+    (_DET_AR_DET_RE, 'det är'),
     # Normalize spacing around punctuation
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-    text = re.sub(r'([.,!?;:])([^\s])', r'\1 \2', text)
+    (re.compile(r'(?<!\s)\s+([.,!?;:])'), r'\1'),
+    (re.compile(r'([.,!?;:])([^\s])'), r'\1 \2'),
+)
+
+
+# MASTERCLASS: Enhanced transcript improvements
+def _apply_masterclass_enhancements(text: str) -> str:
+    """
+    Apply masterclass-level enhancements to transcript.
+    Includes Swedish word list checking, verb form correction, and advanced structure improvements.
+    """
+    for pattern, replacement in _MASTERCLASS_SUBS:
+        text = pattern.sub(replacement, text)
     
     # Final normalization
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
     
     return text
@@ -875,6 +1110,21 @@ def generate_stub_transcript(filename: str, duration_seconds: Optional[int] = No
     return " ".join(sentences)
 
 
+# Förskanning i process_transcript: samma mönster som maskningen/gaten där de sammanfaller
+_TRANSCRIPT_PHONE_RES = (
+    _PHONE_RES[1],  # Swedish phone
+    _PHONE_RES[2],  # Mobile
+    re.compile(r'\+\d{1,3}[- ]?\d{1,4}[- ]?\d{2,4}[- ]?\d{2,4}\b'),  # International
+)
+_TRANSCRIPT_PERSONNUMMER_RES = _GATE_PERSONNUMMER_RES[:2]  # YYYYMMDD-XXXX, YYYYMMDDXXXX
+_SENTENCE_SPLIT_RE = re.compile(r'(?<![.!?])[.!?]+\s+')
+# Keywords to prefer for Nyckelpunkter (substring match on the lowercased sentence, +100 each)
+_KEY_POINT_KEYWORDS = ('viktigt', 'problem', 'nästa steg', 'deadline', 'källa', 'risk', 'behöver')
+_SENTENCE_SPLIT_KEEP_RE = re.compile(r'((?<![.!?])[.!?]+\s+)')
+# Tidslinjen har högst 8 segment à 15 s: [00:00], [00:15], ... [01:45]
+_TIMELINE_TIMESTAMPS = tuple(f"[{i * 15 // 60:02d}:{i * 15 % 60:02d}]" for i in range(8))
+
+
 def process_transcript(raw_transcript: str, project_name: str, recording_date: str, duration_seconds: Optional[int] = None) -> str:
     """
     Process raw transcript into structured markdown-like format.
@@ -893,30 +1143,19 @@ def process_transcript(raw_transcript: str, project_name: str, recording_date: s
     text = raw_transcript
     
     # Email pattern
-    email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-    text = re.sub(email_pattern, '[EMAIL]', text, flags=re.IGNORECASE)
+    text = _sub_emails(_GATE_EMAIL_RE, text, '[EMAIL]')
     
     # Phone patterns (similar to masking)
-    phone_patterns = [
-        r'\b0\d{1,2}[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',  # Swedish phone
-        r'\b07\d[- ]\d{2,3}[- ]?\d{2,3}[- ]?\d{2,4}\b',      # Mobile
-        r'\+\d{1,3}[- ]?\d{1,4}[- ]?\d{2,4}[- ]?\d{2,4}\b',  # International
-    ]
-    for pattern in phone_patterns:
-        text = re.sub(pattern, '[PHONE]', text)
+    for pattern in _TRANSCRIPT_PHONE_RES:
+        text = pattern.sub('[PHONE]', text)
     
     # Personnummer patterns
-    personnummer_patterns = [
-        r'\b(19|20)\d{6}[- ]\d{4}\b',  # YYYYMMDD-XXXX
-        r'\b(19|20)\d{10}\b',          # YYYYMMDDXXXX
-    ]
-    for pattern in personnummer_patterns:
-        text = re.sub(pattern, '[PERSONNUMMER]', text)
+    for pattern in _TRANSCRIPT_PERSONNUMMER_RES:
+        text = pattern.sub('[PERSONNUMMER]', text)
     
     # Split into sentences
     # Simple sentence splitting (period, exclamation, question mark followed by space or end)
-    sentences = re.split(r'[.!?]+\s+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text)) if s]
     
     # Build output with strict markdown formatting
     # Ensure each section is separated by blank lines (\n\n)
@@ -979,29 +1218,24 @@ def process_transcript(raw_transcript: str, project_name: str, recording_date: s
     output_lines.append("## Nyckelpunkter")
     output_lines.append("")  # Blank line after heading
     
-    # Keywords to prefer
-    keywords = ['viktigt', 'problem', 'nästa steg', 'deadline', 'källa', 'risk', 'behöver']
-    
     # Score sentences by keyword presence and length
     scored_sentences = []
     for i, sent in enumerate(sentences):
         score = len(sent)  # Base score on length
         sent_lower = sent.lower()
-        for keyword in keywords:
+        for keyword in _KEY_POINT_KEYWORDS:
             if keyword in sent_lower:
                 score += 100  # Boost for keywords
         scored_sentences.append((score, i, sent))
     
-    # Sort by score (descending) and take top 3-5
-    scored_sentences.sort(reverse=True)
-    key_points = scored_sentences[:min(5, len(scored_sentences))]
-    key_points = sorted(key_points, key=lambda x: x[1])  # Sort by original order
+    # Take top 3-5 by score (descending); index i is unique, so nlargest == sort + slice
+    key_points = heapq.nlargest(5, scored_sentences)
+    key_points.sort(key=lambda x: x[1])  # Sort by original order
     
     # If we have fewer than 3, use longest sentences
     if len(key_points) < 3:
-        longest = sorted([(len(s), i, s) for i, s in enumerate(sentences)], reverse=True)
-        key_points = longest[:min(5, len(longest))]
-        key_points = sorted(key_points, key=lambda x: x[1])
+        key_points = heapq.nlargest(5, ((len(s), i, s) for i, s in enumerate(sentences)))
+        key_points.sort(key=lambda x: x[1])
     
     for _, _, sent in key_points[:5]:
         # Ensure key point is a complete sentence (no truncation with "...")
@@ -1049,19 +1283,12 @@ def process_transcript(raw_transcript: str, project_name: str, recording_date: s
         if start_idx >= len(sentences):
             break
         
-        # Calculate timestamp (assume ~3 seconds per sentence)
-        timestamp_seconds = i * 15  # [00:00], [00:15], [00:30], etc.
-        minutes = timestamp_seconds // 60
-        seconds = timestamp_seconds % 60
-        timestamp = f"[{minutes:02d}:{seconds:02d}]"
-        
-        # Use first sentence of chunk
-        chunk_sentences = sentences[start_idx:end_idx]
-        if chunk_sentences:
-            first_sent = chunk_sentences[0].strip()
+        # Use first sentence of chunk (timestamps are fixed 15 s steps)
+        if start_idx < end_idx:
+            first_sent = sentences[start_idx]
             if len(first_sent) > 120:
                 first_sent = first_sent[:117] + "..."
-            output_lines.append(f"{timestamp} {first_sent}")
+            output_lines.append(f"{_TIMELINE_TIMESTAMPS[i]} {first_sent}")
     
     output_lines.append("")  # Blank line after timeline
     
@@ -1076,7 +1303,7 @@ def process_transcript(raw_transcript: str, project_name: str, recording_date: s
     
     # Split into sentences preserving original punctuation
     # Use the same sentence splitting as above but keep original text
-    original_sentences_list = re.split(r'([.!?]+\s+)', original_text_for_full)
+    original_sentences_list = _SENTENCE_SPLIT_KEEP_RE.split(original_text_for_full)
     
     # Reconstruct sentences with their original punctuation
     full_sentences = []
@@ -1150,6 +1377,26 @@ def process_transcript(raw_transcript: str, project_name: str, recording_date: s
     return "\n".join(result_lines)
 
 
+# Common STT mishearings and spelling corrections (enhance_presentation_text)
+_PRESENTATION_STT_FIXES = tuple((re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in (
+    # Common Swedish STT errors
+    (r'\bdrare\b', 'drar'),
+    (r'\bnerjonat\b', 'nedtonat'),
+    (r'\bnertjonat\b', 'nedtonat'),
+    (r'\bviset\b', 'visst'),
+    (r'\bsås\b', 'sådan'),
+    (r'\bsån\b', 'sådan'),
+    # Spelling corrections
+    (r'\bvåran\b', 'vår'),
+    (r'\bdefinerar\b', 'definierar'),
+    (r'\bdefinierar\b', 'definierar'),  # Already correct, but ensure consistency
+    # Remove incomplete sentence markers
+    (r'\.\.\.\s*$', '.'),  # Complete trailing ...
+    (r'\.\.\.\s*\.', '.'),  # Remove redundant ...
+))
+_LEADING_FILLER_RE = re.compile(r'^(Och|Men|Så|Då)\s+', re.IGNORECASE)
+
+
 def enhance_presentation_text(text: str) -> str:
     """
     Light presentation enhancement for summary and key points ONLY.
@@ -1168,32 +1415,14 @@ def enhance_presentation_text(text: str) -> str:
     
     enhanced = text
     
-    # Common STT mishearings and spelling corrections
-    stt_fixes = {
-        # Common Swedish STT errors
-        r'\bdrare\b': 'drar',
-        r'\bnerjonat\b': 'nedtonat',
-        r'\bnertjonat\b': 'nedtonat',
-        r'\bviset\b': 'visst',
-        r'\bsås\b': 'sådan',
-        r'\bsån\b': 'sådan',
-        # Spelling corrections
-        r'\bvåran\b': 'vår',
-        r'\bdefinerar\b': 'definierar',
-        r'\bdefinierar\b': 'definierar',  # Already correct, but ensure consistency
-        # Remove incomplete sentence markers
-        r'\.\.\.\s*$': '.',  # Complete trailing ...
-        r'\.\.\.\s*\.': '.',  # Remove redundant ...
-    }
-    
     # Apply fixes (only obvious corrections)
-    for pattern, replacement in stt_fixes.items():
-        enhanced = re.sub(pattern, replacement, enhanced, flags=re.IGNORECASE)
+    for pattern, replacement in _PRESENTATION_STT_FIXES:
+        enhanced = pattern.sub(replacement, enhanced)
     
     # Light linguistic simplification (only very safe patterns)
     # Remove excessive filler words at start (but keep if sentence becomes too short)
     original_start = enhanced
-    enhanced = re.sub(r'^(Och|Men|Så|Då)\s+', '', enhanced, flags=re.IGNORECASE)
+    enhanced = _LEADING_FILLER_RE.sub('', enhanced)
     # But only if sentence is still meaningful
     if len(enhanced.strip()) < 10:
         enhanced = original_start  # Revert if too aggressive
@@ -1205,6 +1434,118 @@ def enhance_presentation_text(text: str) -> str:
     return enhanced
 
 
+# refine_editorial_text: talspråkssignaler och tal->skrift-mappningar, kompilerade en gång
+# Common Swedish speech signals to trim from bullet points
+_REFINE_SPEECH_SIGNAL_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'^och\s+',
+    r'^det här\s+',
+    r'^detta\s+',
+    r'^jag tycker\s+',
+    r'^jag tror\s+',
+    r'^jag tror att\s+',
+    r'^tycker jag\s+',
+    r'^tror jag\s+',
+    r'^alltså\s+',
+    r'^så\s+',
+    r'^sen\s+',
+    r'^sedan\s+',
+    r'^då\s+',
+    r'^men\s+',
+    r'^eller\s+',
+    r'^så att\s+',
+    r'^så att säga\s+',
+))
+# Förankrad grind över alla signaler: matchar ingen i början av bulleten ändrar loopen ingenting.
+# Själva trimningen är kvar i ordning, eftersom en signal kan blottlägga nästa ("och så x" -> "x").
+_REFINE_SPEECH_SIGNAL_ANY_RE = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern in _REFINE_SPEECH_SIGNAL_RES), re.IGNORECASE
+)
+# Speech-to-written Swedish transformations (deterministic mappings, applied in order)
+# (gemen literal som varje träff innehåller, mönster, ersättning); literalen används som förfilter
+_REFINE_SPEECH_TO_WRITTEN = tuple((key, re.compile(p, re.IGNORECASE), r) for key, p, r in (
+    # "det är" -> "det" (remove redundant "är")
+    ('det är', r'\bdet är\s+', 'det '),
+    # "det här" -> "detta" (more formal)
+    ('det här', r'\bdet här\s+', 'detta '),
+    # "så att" -> "så att" (keep, but can be context-dependent)
+    # "om vi" -> "om vi" (keep)
+    # "det kan" -> "det kan" (keep)
+    # Remove filler words in middle of sentences
+    ('alltså', r'(?<!\s)\s+alltså\s+', ' '),
+    ('så att säga', r'(?<!\s)\s+så att säga\s+', ' '),
+    ('typ', r'(?<!\s)\s+typ\s+', ' '),
+    # Fix common speech patterns
+    ('det det', r'\bdet det\b', 'det'),
+    ('är är', r'\bär är\b', 'är'),
+    ('kan kan', r'\bkan kan\b', 'kan'),
+    ('ska ska', r'\bska ska\b', 'ska'),
+))
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+# Speech connectors dropped from the start of a bullet
+_BULLET_CONNECTORS = frozenset(('och', 'men', 'eller', 'så', 'då', 'sen', 'sedan', 'alltså'))
+# Common Swedish verbs that may start a bullet in lowercase (prefix incl. space, for str.startswith)
+_BULLET_VERB_PREFIXES = tuple(v + ' ' for v in ('behöver', 'kan', 'ska', 'måste', 'vill', 'får', 'gör', 'har', 'är', 'blir'))
+# Stop words ignored when picking the conclusion word
+_CONCLUSION_STOP_WORDS = frozenset((
+    'detta', 'finns', 'skulle', 'borde', 'bör', 'kanske', 'möjligt', 'eller', 'också', 'även',
+    'där', 'här', 'denna', 'denne',
+))
+
+
+def _finalize_bullet(bullet_text: str) -> str:
+    """
+    Ensure a refined bullet starts with a noun or verb.
+    
+    Simple heuristic: drop a leading speech connector, then capitalize unless the bullet
+    starts with a common verb. Verbs: inflected forms are complex, so we check for common
+    patterns. Nouns: often start with determiners (en, ett, den, det) or are capitalized.
+    """
+    # If starts with common speech connectors, remove it (only if another word follows)
+    words = bullet_text.split()
+    if len(words) > 1 and words[0].lower() in _BULLET_CONNECTORS:
+        bullet_text = ' '.join(words[1:])
+    
+    # Capitalize first letter if needed (basic heuristic)
+    if bullet_text and bullet_text[0].islower():
+        if not bullet_text.lower().strip().startswith(_BULLET_VERB_PREFIXES):
+            bullet_text = bullet_text[0].upper() + bullet_text[1:]
+    return bullet_text
+
+
+def _has_two_sentences(text: str) -> bool:
+    """
+    True if text has at least 2 sentences longer than 5 chars (split on terminator + whitespace).
+    
+    Same count as filtering _SENTENCE_SPLIT_RE.split(text), but stops at the second sentence.
+    """
+    count = 0
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        if len(text[start:match.start()].strip()) > 5:
+            count += 1
+            if count == 2:
+                return True
+        start = match.end()
+    return count == 1 and len(text[start:].strip()) > 5
+
+
+def _apply_speech_to_written(text: str) -> str:
+    """Apply _REFINE_SPEECH_TO_WRITTEN in order, skipping rules whose literal is not in the text."""
+    # Samma förfilter som STT-mappningarna: gemen text, förnyas efter varje träff eftersom
+    # en tidigare regel kan skapa träffar för en senare ("det är det x" -> "det det x")
+    prefilter = not any(c in text for c in _STT_CASEFOLD_SPECIALS)
+    lowered = text.lower()
+    for key, pattern, replacement in _REFINE_SPEECH_TO_WRITTEN:
+        if prefilter and key not in lowered:
+            continue
+        text, n = pattern.subn(replacement, text)
+        if n:
+            lowered = text.lower()
+    return text
+
+
 def refine_editorial_text(structured_text: str) -> str:
     """
     Refine structured transcript text to editorial-ready first draft (deterministic).
@@ -1227,179 +1568,91 @@ def refine_editorial_text(structured_text: str) -> str:
     
     lines = structured_text.split('\n')
     output_lines = []
-    i = 0
-    
-    # Common Swedish speech signals to trim from bullet points
-    speech_signals = [
-        r'^och\s+',
-        r'^det här\s+',
-        r'^detta\s+',
-        r'^jag tycker\s+',
-        r'^jag tror\s+',
-        r'^jag tror att\s+',
-        r'^tycker jag\s+',
-        r'^tror jag\s+',
-        r'^alltså\s+',
-        r'^så\s+',
-        r'^sen\s+',
-        r'^sedan\s+',
-        r'^då\s+',
-        r'^men\s+',
-        r'^eller\s+',
-        r'^så att\s+',
-        r'^så att säga\s+',
-    ]
-    
-    # Speech-to-written Swedish transformations (deterministic mappings)
-    speech_to_written = {
-        # "det är" -> "det" (remove redundant "är")
-        r'\bdet är\s+': 'det ',
-        # "det här" -> "detta" (more formal)
-        r'\bdet här\s+': 'detta ',
-        # "så att" -> "så att" (keep, but can be context-dependent)
-        # "om vi" -> "om vi" (keep)
-        # "det kan" -> "det kan" (keep)
-        # Remove filler words in middle of sentences
-        r'\s+alltså\s+': ' ',
-        r'\s+så att säga\s+': ' ',
-        r'\s+typ\s+': ' ',
-        # Fix common speech patterns
-        r'\bdet det\b': 'det',
-        r'\bär är\b': 'är',
-        r'\bkan kan\b': 'kan',
-        r'\bska ska\b': 'ska',
-    }
     
     # Process line by line
     in_sammanfattning = False
     in_nyckelpunkter = False
     sammanfattning_lines = []
     sammanfattning_start_idx = -1
+    nyckelpunkter_bullets = []  # Originaltext per bullet, för slutsatsen nedan (ingen andra genomgång)
     
-    while i < len(lines):
-        line = lines[i]
+    for line in lines:
+        stripped = line.strip()
         
         # Detect sections
-        if line.strip() == "## Sammanfattning":
+        if stripped == "## Sammanfattning":
             in_sammanfattning = True
             in_nyckelpunkter = False
             output_lines.append(line)
-            i += 1
             continue
-        elif line.strip() == "## Nyckelpunkter":
+        elif stripped == "## Nyckelpunkter":
             in_sammanfattning = False
             in_nyckelpunkter = True
             output_lines.append(line)
-            i += 1
             continue
-        elif line.strip().startswith("##"):
+        elif stripped.startswith("##"):
             in_sammanfattning = False
             in_nyckelpunkter = False
             output_lines.append(line)
-            i += 1
             continue
         
         # Process Sammanfattning section
-        if in_sammanfattning and line.strip() and not line.strip().startswith("#"):
+        if in_sammanfattning and stripped and not stripped.startswith("#"):
             if sammanfattning_start_idx == -1:
                 sammanfattning_start_idx = len(output_lines)
             sammanfattning_lines.append(line)
             # Apply speech-to-written transformations
-            refined_line = line
-            for pattern, replacement in speech_to_written.items():
-                refined_line = re.sub(pattern, replacement, refined_line, flags=re.IGNORECASE)
-            output_lines.append(refined_line)
-            i += 1
+            output_lines.append(_apply_speech_to_written(line))
             continue
         
         # Process Nyckelpunkter bullets
-        if in_nyckelpunkter and line.strip().startswith("- "):
+        if in_nyckelpunkter and stripped.startswith("- "):
             bullet_text = line[2:].strip()  # Remove "- " prefix
+            nyckelpunkter_bullets.append(bullet_text)
             
             # Trim speech signals from beginning
-            for signal_pattern in speech_signals:
-                bullet_text = re.sub(signal_pattern, '', bullet_text, flags=re.IGNORECASE)
+            if _REFINE_SPEECH_SIGNAL_ANY_RE.match(bullet_text):
+                for signal_pattern in _REFINE_SPEECH_SIGNAL_RES:
+                    bullet_text = signal_pattern.sub('', bullet_text)
             
             # Apply speech-to-written transformations
-            for pattern, replacement in speech_to_written.items():
-                bullet_text = re.sub(pattern, replacement, bullet_text, flags=re.IGNORECASE)
+            bullet_text = _apply_speech_to_written(bullet_text)
             
             # Ensure bullet starts with noun or verb
-            # Simple heuristic: check if starts with common Swedish verbs or nouns
-            # Verbs: inflected forms are complex, so we check for common patterns
-            # Nouns: often start with determiners (en, ett, den, det) or are capitalized
-            bullet_lower = bullet_text.lower().strip()
-            
-            # If starts with common speech connectors, try to find next word
-            connectors = ['och', 'men', 'eller', 'så', 'då', 'sen', 'sedan', 'alltså']
-            words = bullet_text.split()
-            if words and words[0].lower() in connectors:
-                # Try to keep only if next word is a good start
-                if len(words) > 1:
-                    # Remove first word if it's a connector
-                    bullet_text = ' '.join(words[1:])
-                    bullet_lower = bullet_text.lower().strip()
-            
-            # Capitalize first letter if needed (basic heuristic)
-            if bullet_text and bullet_text[0].islower():
-                # Check if it's a verb or noun starting with lowercase
-                # Common Swedish verbs that start lowercase: behöver, kan, ska, måste, vill
-                # If not starting with verb, capitalize
-                common_verbs = ['behöver', 'kan', 'ska', 'måste', 'vill', 'får', 'gör', 'har', 'är', 'blir']
-                if not any(bullet_lower.startswith(v + ' ') for v in common_verbs):
-                    bullet_text = bullet_text[0].upper() + bullet_text[1:] if len(bullet_text) > 1 else bullet_text.upper()
+            bullet_text = _finalize_bullet(bullet_text)
             
             output_lines.append(f"- {bullet_text}")
-            i += 1
             continue
         
         # Pass through other lines unchanged
         output_lines.append(line)
-        i += 1
     
     # Post-process: Enhance Sammanfattning if it has < 2 sentences
     if sammanfattning_start_idx != -1 and len(sammanfattning_lines) > 0:
         # Count sentences in Sammanfattning
         sammanfattning_text = ' '.join(sammanfattning_lines)
-        sentences = re.split(r'[.!?]+\s+', sammanfattning_text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 5]
         
-        if len(sentences) < 2:
+        if not _has_two_sentences(sammanfattning_text):
             # Extract key words from existing text for condensed conclusion
             # Use words from Nyckelpunkter and Sammanfattning (no new info)
-            all_words = []
-            
-            # Find Nyckelpunkter section and extract words from bullets
-            in_nyckelpunkter_section = False
-            for line in lines:
-                if line.strip() == "## Nyckelpunkter":
-                    in_nyckelpunkter_section = True
-                    continue
-                elif line.strip().startswith("##") and in_nyckelpunkter_section:
-                    in_nyckelpunkter_section = False
-                    continue
-                
-                if in_nyckelpunkter_section and line.strip().startswith("- "):
-                    bullet_text = line[2:].strip()
-                    all_words.extend(re.findall(r'\b\w+\b', bullet_text.lower()))
+            # Bullets samlades i huvudloopen; radbrytningen skiljer dem så inga ord slås ihop
+            all_words = _WORD_RE.findall('\n'.join(nyckelpunkter_bullets).lower())
             
             # Add words from Sammanfattning
-            all_words.extend(re.findall(r'\b\w+\b', sammanfattning_text.lower()))
+            all_words.extend(_WORD_RE.findall(sammanfattning_text.lower()))
             
             # Find common important words (nouns, verbs - simple heuristic)
             # Filter out common stop words
-            stop_words = {'detta', 'detta', 'finns', 'skulle', 'borde', 'bör', 'kanske', 'möjligt', 'eller', 'också', 'även', 'där', 'här', 'där', 'denna', 'detta', 'denne'}
-            important_words = [w for w in all_words if len(w) > 4 and w not in stop_words]
+            important_words = [w for w in all_words if len(w) > 4 and w not in _CONCLUSION_STOP_WORDS]
             
             # Create simple conclusion based on existing content
             # Just extract key concept and make a simple statement
             if important_words:
-                # Use most common word or a key concept
-                word_counts = Counter(important_words)
-                top_words = [w for w, _ in word_counts.most_common(3)]
+                # Use most common word or a key concept (first seen wins ties, as with most_common)
+                top_word = Counter(important_words).most_common(1)[0][0]
                 
                 # Build simple conclusion sentence using existing patterns
-                conclusion = f"Detta fokuserar på {top_words[0] if top_words else 'huvudpunkterna'}."
+                conclusion = f"Detta fokuserar på {top_word}."
             else:
                 conclusion = "Detta sammanfattar huvudpunkterna."
             
@@ -1408,8 +1661,6 @@ def refine_editorial_text(structured_text: str) -> str:
             insert_idx = sammanfattning_start_idx + len(sammanfattning_lines)
             output_lines.insert(insert_idx, conclusion)
     
-    # Join and return
-    result = "\n".join(output_lines)
-    result_lines = [line.rstrip() for line in result.split('\n')]
-    return "\n".join(result_lines)
+    # Join and return (no element contains a newline, so strip per element before the single join)
+    return "\n".join([line.rstrip() for line in output_lines])
 
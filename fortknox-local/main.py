@@ -16,11 +16,17 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, ValidationError
 import uvicorn
 import requests
 
+try:
+    import orjson
+except ImportError:  # valfritt: json räcker, orjson parsar modellsvaren snabbare
+    orjson = None
+
 # Setup logging (metadata-only, ingen textinnehåll)
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
@@ -44,6 +50,12 @@ LLAMA_SERVER_URL = os.getenv("LLAMA_SERVER_URL", "http://localhost:8080")
 FORTKNOX_PORT = int(os.getenv("FORTKNOX_PORT", "8787"))
 TESTMODE = os.getenv("FORTKNOX_TESTMODE", "0") == "1"
 FORTKNOX_MAX_ITEM_CHARS = int(os.getenv("FORTKNOX_MAX_ITEM_CHARS", "2000"))
+# Skicka svarsschemat till llama.cpp (json_schema -> grammatik) så att modellen bara kan ge giltig JSON.
+# Stäng av (0) för äldre llama-server utan json_schema-stöd.
+FORTKNOX_JSON_SCHEMA = os.getenv("FORTKNOX_JSON_SCHEMA", "1") == "1"
+
+# Delad session mot llama.cpp: keep-alive, ingen ny TCP-anslutning per anrop (urllib3-poolen är trådsäker)
+_LLAMA_SESSION = requests.Session()
 
 # Schemas (måste matcha apps/api/schemas.py)
 class KnoxPolicyInput(BaseModel):
@@ -70,19 +82,68 @@ class CompileRequest(BaseModel):
     documents: list[DocumentItem]
     notes: list[NoteItem]
 
+class KnoxThemeItem(BaseModel):
+    name: str
+    bullets: list[str]
+
+class KnoxRiskItem(BaseModel):
+    risk: str
+    mitigation: str
+
 class KnoxLLMResponse(BaseModel):
     template_id: str
     language: str = "sv"
     title: str
     executive_summary: str
-    themes: list[Dict[str, Any]]  # [{"name": str, "bullets": list[str]}]
+    themes: list[KnoxThemeItem]
     timeline_high_level: list[str]
-    risks: list[Dict[str, Any]]  # [{"risk": str, "mitigation": str}]
+    risks: list[KnoxRiskItem]
     open_questions: list[str]
     next_steps: list[str]
     confidence: str  # "low" | "medium" | "high"
 
 
+# JSON Schema för constrained decoding (samma form som apps/api/schemas.py KnoxLLMResponse,
+# additionalProperties:false). Fältordningen följer prompten; llama.cpp genererar i den ordningen.
+_STR_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+LLM_RESPONSE_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "template_id": {"type": "string"},
+        "language": {"type": "string", "enum": ["sv"]},
+        "title": {"type": "string"},
+        "executive_summary": {"type": "string"},
+        "themes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "bullets": _STR_LIST_SCHEMA},
+                "required": ["name", "bullets"],
+                "additionalProperties": False,
+            },
+        },
+        "timeline_high_level": _STR_LIST_SCHEMA,
+        "risks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"risk": {"type": "string"}, "mitigation": {"type": "string"}},
+                "required": ["risk", "mitigation"],
+                "additionalProperties": False,
+            },
+        },
+        "open_questions": _STR_LIST_SCHEMA,
+        "next_steps": _STR_LIST_SCHEMA,
+        "confidence": {"type": "string", "enum": ["low", "medium", "high"]},
+    },
+    "required": [
+        "template_id", "language", "title", "executive_summary", "themes",
+        "timeline_high_level", "risks", "open_questions", "next_steps", "confidence",
+    ],
+    "additionalProperties": False,
+}
+
+
 # Test fixtures (för deterministisk testning)
 TEST_FIXTURES = {
     "internal": {
@@ -115,69 +176,156 @@ TEST_FIXTURES = {
     }
 }
 
+# Validerade en gång vid import (ogiltig fixture -> fel vid start, inte per anrop)
+_FIXTURE_RESPONSES = {key: KnoxLLMResponse.model_validate(data) for key, data in TEST_FIXTURES.items()}
 
-def call_llama_server(prompt: str, *, temperature: float = 0.2, n_predict: int = 2048) -> str:
+
+def _json_loads(s: str) -> Any:
+    """
+    json.loads med orjson som snabbväg.
+    
+    orjson är striktare (NaN/Infinity, ensamma surrogater); vid fel provas json.loads så att
+    samma svar accepteras som förut. Felet som når anroparen är alltid json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
+class _JsonObjectScanner:
+    """
+    Inkrementell sökning efter första balanserade {...} (klamrar inne i strängar räknas inte).
+
+    feed() tar text i bitar (t.ex. strömmade tokens); start/end är index i all text som matats in.
+    """
+
+    def __init__(self) -> None:
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+
+    def feed(self, chunk: str) -> bool:
+        """Mata in nästa bit; True när objektet är slutet (end satt)."""
+        if self.end != -1:
+            return True
+        offset = self._pos
+        self._pos += len(chunk)
+        i = 0
+        if self.start == -1:
+            i = chunk.find("{")
+            if i == -1:
+                return False
+            self.start = offset + i
+        for i in range(i, len(chunk)):
+            ch = chunk[i]
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = offset + i + 1
+                    return True
+        return False
+
+
+# Text före JSON-objektet som gör att strömningen får avbrytas när objektet slutit
+# (annars kan en tidig "{...}" i prosa vara fel objekt, och parse_llm_response behöver hela svaret)
+_STREAM_JSON_PREFIXES = ("", "```", "```json")
+
+
+def call_llama_server(
+    prompt: str,
+    *,
+    temperature: float = 0.2,
+    n_predict: int = 2048,
+    json_schema: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     Anropa llama.cpp server för LLM-inferens.
     
     Args:
         prompt: Text prompt för LLM
+        json_schema: Valfritt JSON Schema; llama.cpp begränsar då samplingen till giltig JSON
     
     Returns:
         LLM response text
     """
+    body: Dict[str, Any] = {
+        "prompt": prompt,
+        # Mer deterministiskt + mindre risk för trunkering
+        "n_predict": n_predict,
+        "temperature": temperature,
+        # Undvik stop på "\n\n\n" då modellen ofta skriver nya rader i JSON och kan trunkeras.
+        "stop": ["</s>"]
+    }
+    if json_schema is not None:
+        body["json_schema"] = json_schema
+    # Strömma (SSE) och sluta läsa när JSON-objektet är komplett: modellen pratar ibland vidare
+    # efter JSON:en ända till n_predict, och stängd anslutning avbryter genereringen i llama-server.
+    body["stream"] = True
+    parts: list[str] = []
+    scanner = _JsonObjectScanner()
     try:
         # llama.cpp server API (completion endpoint)
-        response = requests.post(
+        with _LLAMA_SESSION.post(
             f"{LLAMA_SERVER_URL}/completion",
-            json={
-                "prompt": prompt,
-                # Mer deterministiskt + mindre risk för trunkering
-                "n_predict": n_predict,
-                "temperature": temperature,
-                # Undvik stop på "\n\n\n" då modellen ofta skriver nya rader i JSON och kan trunkeras.
-                "stop": ["</s>"]
-            },
-            # Lokala modeller kan ta tid, särskilt när kontexten är stor.
+            json=body,
+            stream=True,
+            # Lokala modeller kan ta tid, särskilt när kontexten är stor (gäller per läsning).
             timeout=180
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("content", "")
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                data = _json_loads(line[6:])
+                content = data.get("content", "")
+                if content:
+                    parts.append(content)
+                    if scanner.feed(content):
+                        text = "".join(parts)
+                        if text[:scanner.start].strip() in _STREAM_JSON_PREFIXES:
+                            return text
+                if data.get("stop"):
+                    break
+        return "".join(parts)
     except requests.exceptions.RequestException as e:
         logger.error(f"llama.cpp server error: {e}")
         raise HTTPException(status_code=503, detail="LLM server unavailable")
 
 
-def build_prompt(request: CompileRequest, documents_text: str, notes_text: str) -> str:
-    """
-    Bygg prompt för LLM baserat på policy och template.
-    """
-    mode = request.policy.mode
-    template = request.template_id
-    
-    if mode == "internal":
-        mode_instruction = "Intern redaktionell brief (kan innehålla mer detaljer, men inga personuppgifter)."
-    else:
-        mode_instruction = (
-            "Extern redaktionell brief. Regler: "
-            "INTE exakta datum/klockslag (använd 'i början av månaden', 'under veckan', etc), "
-            "INTE långa citat från källan (>8 ord i följd), "
-            "INTE personuppgifter eller identifierande detaljer. "
-            "Skriv som en erfaren redaktör: konkret, journalistiskt, utan att prata om 'tester', 'system' eller 'confidentialitetshantering'."
-        )
-    
-    anti_quote = ""
-    if mode == "external":
-        anti_quote = (
-            "\nANTI-CITAT (KRITISKT):\n"
-            "- Du får INTE kopiera meningar eller fraser från underlaget.\n"
-            "- Du får inte återge 8+ ord i följd som förekommer i input.\n"
-            "- Använd inga citattecken och inga blockcitat.\n"
-            "- Parafrasera alltid och håll formuleringar generiska.\n"
-        )
-    
-    prompt = f"""Du är en senior grävredaktör som skapar en strukturerad brief från ett journalistiskt projekt.
+# Prompt-delar (konstanta per läge) byggs en gång; bara dokument, noter och template varierar
+_MODE_INSTRUCTION_INTERNAL = "Intern redaktionell brief (kan innehålla mer detaljer, men inga personuppgifter)."
+_MODE_INSTRUCTION_EXTERNAL = (
+    "Extern redaktionell brief. Regler: "
+    "INTE exakta datum/klockslag (använd 'i början av månaden', 'under veckan', etc), "
+    "INTE långa citat från källan (>8 ord i följd), "
+    "INTE personuppgifter eller identifierande detaljer. "
+    "Skriv som en erfaren redaktör: konkret, journalistiskt, utan att prata om 'tester', 'system' eller 'confidentialitetshantering'."
+)
+_ANTI_QUOTE_EXTERNAL = (
+    "\nANTI-CITAT (KRITISKT):\n"
+    "- Du får INTE kopiera meningar eller fraser från underlaget.\n"
+    "- Du får inte återge 8+ ord i följd som förekommer i input.\n"
+    "- Använd inga citattecken och inga blockcitat.\n"
+    "- Parafrasera alltid och håll formuleringar generiska.\n"
+)
+_PROMPT_HEADER = """Du är en senior grävredaktör som skapar en strukturerad brief från ett journalistiskt projekt.
 
 Policy: {mode_instruction}
 Template: {template}
@@ -185,10 +333,8 @@ Språk: Svenska
 {anti_quote}
 
 Dokument:
-{documents_text}
-
-Noter:
-{notes_text}
+"""
+_PROMPT_JSON_SKELETON = """
 
 Skapa en rapport enligt följande JSON-struktur (svara ENDAST med JSON, ingen annan text):
 
@@ -215,8 +361,50 @@ Skapa en rapport enligt följande JSON-struktur (svara ENDAST med JSON, ingen an
 }}
 
 JSON:"""
+
+
+def build_prompt(request: CompileRequest, documents_text: str, notes_text: str) -> str:
+    """
+    Bygg prompt för LLM baserat på policy och template.
+    """
+    template = request.template_id
+    
+    if request.policy.mode == "internal":
+        mode_instruction = _MODE_INSTRUCTION_INTERNAL
+        anti_quote = ""
+    else:
+        mode_instruction = _MODE_INSTRUCTION_EXTERNAL
+        # Anti-citat endast för uttryckligen externt läge (okända lägen får extern policy utan den)
+        anti_quote = _ANTI_QUOTE_EXTERNAL if request.policy.mode == "external" else ""
     
-    return prompt
+    # Dokument och noter fogas in som de är (aldrig genom format, de kan innehålla klamrar)
+    return "".join((
+        _PROMPT_HEADER.format(mode_instruction=mode_instruction, template=template, anti_quote=anti_quote),
+        documents_text,
+        "\n\nNoter:\n",
+        notes_text,
+        _PROMPT_JSON_SKELETON.format(template=template),
+    ))
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Första balanserade {...} i text (klamrar inne i strängar räknas inte).
+
+    Modellen skriver ibland prosa med klamrar efter JSON:en; då räcker inte första '{' till sista '}'.
+    Är objektet obalanserat (t.ex. trunkerat svar) används första '{' till sista '}' som förut,
+    så att reparationssteget fortfarande får en chans.
+    """
+    scanner = _JsonObjectScanner()
+    if scanner.feed(text):
+        return text[scanner.start:scanner.end]
+    if scanner.start == -1:
+        return None
+
+    end_idx = text.rfind("}") + 1
+    if end_idx == 0:
+        return None
+    return text[scanner.start:end_idx]
 
 
 def parse_llm_response(llm_text: str, template_id: str) -> Dict[str, Any]:
@@ -240,14 +428,10 @@ def parse_llm_response(llm_text: str, template_id: str) -> Dict[str, Any]:
         llm_text = llm_text.split("```")[1].split("```")[0].strip()
     
     # Försök hitta JSON object
-    start_idx = llm_text.find("{")
-    end_idx = llm_text.rfind("}") + 1
-    
-    if start_idx == -1 or end_idx == 0:
+    json_str = _extract_json_object(llm_text)
+    if json_str is None:
         raise ValueError("No JSON found in LLM response")
     
-    json_str = llm_text[start_idx:end_idx]
-    
     def _normalize_response_shape(data: Dict[str, Any]) -> Dict[str, Any]:
         # Fort Knox v1: next_steps ska vara list[str]. Modeller tenderar att returnera list[dict].
         ns = data.get("next_steps")
@@ -274,7 +458,7 @@ def parse_llm_response(llm_text: str, template_id: str) -> Dict[str, Any]:
         return data
 
     try:
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
         # Sätt template_id om det saknas
         if "template_id" not in data:
             data["template_id"] = template_id
@@ -328,7 +512,7 @@ def parse_llm_response(llm_text: str, template_id: str) -> Dict[str, Any]:
         repaired = re.sub(r",(\\s*[}\\]])", r"\\1", repaired)
 
         try:
-            data = json.loads(repaired)
+            data = _json_loads(repaired)
             if "template_id" not in data:
                 data["template_id"] = template_id
             logger.info("JSON repaired successfully", extra={"sha256_16": digest})
@@ -338,6 +522,12 @@ def parse_llm_response(llm_text: str, template_id: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid JSON from LLM: {e}")
 
 
+@app.on_event("shutdown")
+def close_llama_session():
+    """Stäng poolade anslutningar mot llama.cpp vid avslut."""
+    _LLAMA_SESSION.close()
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint."""
@@ -369,14 +559,8 @@ async def compile_report(request: CompileRequest):
     if TESTMODE:
         logger.info(f"TESTMODE: Using fixture for {request.policy.mode}")
         fixture_key = "internal" if request.policy.mode == "internal" else "external"
-        fixture_data = TEST_FIXTURES[fixture_key].copy()
-        fixture_data["template_id"] = request.template_id
-        
-        try:
-            return KnoxLLMResponse(**fixture_data)
-        except ValidationError as e:
-            logger.error(f"Fixture validation failed: {e}")
-            raise HTTPException(status_code=500, detail="Test fixture validation failed")
+        # Fixturerna är validerade vid import; kopiera bara med rätt template_id
+        return _FIXTURE_RESPONSES[fixture_key].model_copy(update={"template_id": request.template_id})
     
     # Build prompt (bounded input för stabilitet + mindre risk för context-trunkering).
     # OBS: input är redan maskad/sanerad innan den når Fort Knox Local.
@@ -393,7 +577,10 @@ async def compile_report(request: CompileRequest):
     try:
         prompt = build_prompt(request, documents_text, notes_text)
 
-        # Call LLM (med retry om modellen spottar ur sig invalid JSON)
+        # Call LLM (med retry om modellen spottar ur sig invalid JSON).
+        # Med json_schema kan svaret inte vara ogiltig JSON; retry finns kvar som skydd
+        # (t.ex. trunkering vid n_predict eller server utan schemastöd).
+        json_schema = LLM_RESPONSE_JSON_SCHEMA if FORTKNOX_JSON_SCHEMA else None
         last_err: Optional[Exception] = None
         for attempt in range(2):
             # Försök 1: ganska deterministiskt
@@ -411,11 +598,14 @@ async def compile_report(request: CompileRequest):
                       "Om du är osäker: returnera en minimal JSON enligt schemat med tomma listor.\n"
                 )
 
-            llm_response_text = call_llama_server(retry_prompt, temperature=temperature, n_predict=2048)
+            # Blockerande HTTP-anrop (kan ta minuter) körs i threadpoolen så att event-loopen är fri
+            llm_response_text = await run_in_threadpool(
+                call_llama_server, retry_prompt, temperature=temperature, n_predict=2048, json_schema=json_schema
+            )
 
             try:
                 response_data = parse_llm_response(llm_response_text, request.template_id)
-                llm_response = KnoxLLMResponse(**response_data)
+                llm_response = KnoxLLMResponse.model_validate(response_data)
                 break
             except (ValueError, ValidationError) as e:
                 last_err = e